@@ -0,0 +1,103 @@
+import json
+import zipfile
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from quadro.models import Task
+
+
+INDEX_NAME = "index.json"
+
+
+class MilestoneArchive:
+    """
+    A milestone packed into a single LZMA-compressed zip bundle.
+
+    The bundle holds each task file unchanged as ``<id>.md`` plus an
+    ``index.json`` with the ID, title, status and timestamps of every task.
+    Zip members are compressed independently and located through the
+    central directory, so a single task is read without unpacking the rest.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._index: dict[int, dict[str, Any]] = {}
+        self._index_mtime: int | None = None
+
+    @property
+    def milestone(self) -> str:
+        return self.path.stem
+
+    @classmethod
+    def write(cls, path: Path, contents: Iterable[tuple[Task, str]]) -> "MilestoneArchive":
+        """
+        Write a bundle atomically, replacing any existing one at ``path``.
+
+        Parameters
+        ----------
+        path : Path
+            Location of the bundle. Its stem is the milestone name.
+        contents : Iterable[tuple[Task, str]]
+            Each task with the markdown content to store for it.
+
+        Returns
+        -------
+        MilestoneArchive
+            The archive for the written bundle.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        entries = []
+
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_LZMA) as bundle:
+            for task, content in sorted(contents, key=lambda item: item[0].id):
+                bundle.writestr(f"{task.id}.md", content)
+                entries.append(
+                    {
+                        "id": task.id,
+                        "title": task.title,
+                        "status": task.status.value,
+                        "created": task.created.isoformat(),
+                        "completed": task.completed.isoformat() if task.completed else None,
+                    }
+                )
+            bundle.writestr(INDEX_NAME, json.dumps({"milestone": path.stem, "tasks": entries}))
+
+        temp_path.replace(path)
+
+        return cls(path)
+
+    def index(self) -> dict[int, dict[str, Any]]:
+        """Return the embedded index by task ID, re-read only when the bundle changes."""
+        mtime = self.path.stat().st_mtime_ns
+
+        if self._index_mtime != mtime:
+            with zipfile.ZipFile(self.path) as bundle:
+                data = json.loads(bundle.read(INDEX_NAME))
+            self._index = {entry["id"]: entry for entry in data["tasks"]}
+            self._index_mtime = mtime
+
+        return self._index
+
+    def ids(self) -> list[int]:
+        return sorted(self.index())
+
+    def read_task(self, task_id: int) -> Task | None:
+        if task_id not in self.index():
+            return None
+
+        return next(self.iter_tasks([task_id]))
+
+    def iter_tasks(self, task_ids: Iterable[int] | None = None) -> Iterator[Task]:
+        """Parse the given tasks, or every task, decompressing only their members."""
+        for task_id, content in self.iter_contents(task_ids):
+            yield Task.from_markdown(content, task_id, f"{self.path}:{task_id}.md")
+
+    def iter_contents(self, task_ids: Iterable[int] | None = None) -> Iterator[tuple[int, str]]:
+        ids = self.ids() if task_ids is None else task_ids
+
+        with zipfile.ZipFile(self.path) as bundle:
+            for task_id in ids:
+                yield task_id, bundle.read(f"{task_id}.md").decode()
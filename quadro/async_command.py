@@ -0,0 +1,182 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from functools import wraps
+from pathlib import Path
+
+from quadro import command
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.rollup import BurndownPoint
+from quadro.stats import TaskStats
+from quadro.storage import CheckReport
+from quadro.storage import TaskStorage
+
+
+MAX_WORKERS = 8
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="quadro")
+_write_lock = threading.Lock()
+
+
+async def run_in_executor[**P, R](func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    """
+    Run a blocking function on the bounded worker pool.
+
+    Parameters
+    ----------
+    func : Callable[P, R]
+        The blocking function to run.
+    *args : P.args
+        Positional arguments for ``func``.
+    **kwargs : P.kwargs
+        Keyword arguments for ``func``.
+
+    Returns
+    -------
+    R
+        The value returned by ``func``.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+def _exclusive[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Serialize calls to a mutating command so concurrent writers cannot interleave."""
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with _write_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+async def add_task(
+    title: str,
+    description: str | None = None,
+    milestone: str | None = None,
+    storage: TaskStorage | None = None,
+) -> Task:
+    """Async variant of `quadro.command.add_task`."""
+    return await run_in_executor(
+        _exclusive(command.add_task), title, description, milestone, storage=storage
+    )
+
+
+async def list_tasks(
+    milestone: str | None = None,
+    statuses: list[TaskStatus] | None = None,
+    storage: TaskStorage | None = None,
+) -> list[Task]:
+    """Async variant of `quadro.command.list_tasks`."""
+    return await run_in_executor(
+        command.list_tasks, milestone=milestone, statuses=statuses, storage=storage
+    )
+
+
+async def search_tasks(
+    query: str,
+    milestone: str | None = None,
+    statuses: list[TaskStatus] | None = None,
+    storage: TaskStorage | None = None,
+) -> list[Task]:
+    """Async variant of `quadro.command.search_tasks`."""
+    return await run_in_executor(
+        command.search_tasks, query, milestone=milestone, statuses=statuses, storage=storage
+    )
+
+
+async def start_task(task_id: int, storage: TaskStorage | None = None) -> Task:
+    """Async variant of `quadro.command.start_task`."""
+    return await run_in_executor(_exclusive(command.start_task), task_id, storage=storage)
+
+
+async def complete_task(task_id: int, storage: TaskStorage | None = None) -> Task:
+    """Async variant of `quadro.command.complete_task`."""
+    return await run_in_executor(_exclusive(command.complete_task), task_id, storage=storage)
+
+
+async def show_task(task_id: int, storage: TaskStorage | None = None) -> Task:
+    """Async variant of `quadro.command.show_task`."""
+    return await run_in_executor(command.show_task, task_id, storage=storage)
+
+
+async def list_milestones(storage: TaskStorage | None = None) -> list[Task]:
+    """Async variant of `quadro.command.list_milestones`."""
+    return await run_in_executor(command.list_milestones, storage=storage)
+
+
+async def milestone_counts(storage: TaskStorage | None = None) -> dict[str, dict[TaskStatus, int]]:
+    """Async variant of `quadro.command.milestone_counts`."""
+    return await run_in_executor(command.milestone_counts, storage=storage)
+
+
+async def move_task(
+    task_id: int, to_milestone: str, storage: TaskStorage | None = None
+) -> tuple[str, str, str]:
+    """Async variant of `quadro.command.move_task`."""
+    return await run_in_executor(
+        _exclusive(command.move_task), task_id, to_milestone, storage=storage
+    )
+
+
+async def get_task_markdown(task_id: int, storage: TaskStorage | None = None) -> str:
+    """Async variant of `quadro.command.get_task_markdown`."""
+    return await run_in_executor(command.get_task_markdown, task_id, storage=storage)
+
+
+async def update_task_from_markdown(
+    task_id: int, markdown_content: str, storage: TaskStorage | None = None
+) -> Task:
+    """Async variant of `quadro.command.update_task_from_markdown`."""
+    return await run_in_executor(
+        _exclusive(command.update_task_from_markdown), task_id, markdown_content, storage=storage
+    )
+
+
+async def update_task(
+    task_id: int,
+    title: str | None = None,
+    description: str | None = None,
+    storage: TaskStorage | None = None,
+) -> Task:
+    """Async variant of `quadro.command.update_task`."""
+    return await run_in_executor(
+        _exclusive(command.update_task),
+        task_id,
+        title=title,
+        description=description,
+        storage=storage,
+    )
+
+
+async def delete_task(task_id: int, storage: TaskStorage | None = None) -> tuple[Task, Path]:
+    """Async variant of `quadro.command.delete_task`."""
+    return await run_in_executor(_exclusive(command.delete_task), task_id, storage=storage)
+
+
+async def check_tasks(storage: TaskStorage | None = None) -> CheckReport:
+    """Async variant of `quadro.command.check_tasks`."""
+    return await run_in_executor(command.check_tasks, storage=storage)
+
+
+async def task_stats(
+    milestone: str | None = None,
+    weeks: int = 8,
+    bins: int = 10,
+    storage: TaskStorage | None = None,
+) -> TaskStats:
+    """Async variant of `quadro.command.task_stats`."""
+    return await run_in_executor(
+        command.task_stats, milestone=milestone, weeks=weeks, bins=bins, storage=storage
+    )
+
+
+async def milestone_burndown(
+    milestone: str, storage: TaskStorage | None = None
+) -> list[BurndownPoint]:
+    """Async variant of `quadro.command.milestone_burndown`."""
+    return await run_in_executor(command.milestone_burndown, milestone, storage=storage)
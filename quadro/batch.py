@@ -0,0 +1,116 @@
+import shlex
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from quadro.cli import run_command
+from quadro.storage import TaskStorage
+
+
+# Commands that would start another session or block the batch.
+UNAVAILABLE_COMMANDS = frozenset({"batch", "daemon", "serve", "shell"})
+
+
+@dataclass
+class BatchResult:
+    line: int
+    args: list[str]
+    code: int
+
+    @property
+    def ok(self) -> bool:
+        return self.code == 0
+
+
+def parse_script(lines: Iterable[str]) -> list[tuple[int, list[str]]]:
+    """
+    Split a batch script into command lines.
+
+    Every line holds one ``quadro`` command, with or without the ``quadro``
+    prefix, quoted as in a shell. Blank lines and lines starting with ``#``
+    are skipped.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the script.
+
+    Returns
+    -------
+    list[tuple[int, list[str]]]
+        The line number and arguments of every command, in order.
+
+    Raises
+    ------
+    ValueError
+        If a line cannot be split or names a command that cannot run in a
+        batch. Nothing should be run then, so the whole script is checked
+        first.
+
+    Examples
+    --------
+    >>> parse_script(['add "Fix login" --milestone mvp', "# tidy up", "done 3"])
+    [(1, ['add', 'Fix login', '--milestone', 'mvp']), (3, ['done', '3'])]
+    """
+    commands = []
+
+    for number, line in enumerate(lines, start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            msg = f"Line {number}: {e}"
+            raise ValueError(msg) from e
+
+        if args and args[0] == "quadro":
+            args = args[1:]
+        if not args:
+            continue
+
+        if args[0] in UNAVAILABLE_COMMANDS:
+            msg = f"Line {number}: '{args[0]}' is not available in a batch"
+            raise ValueError(msg)
+
+        commands.append((number, args))
+
+    return commands
+
+
+def run_batch(
+    commands: Iterable[tuple[int, list[str]]],
+    storage: TaskStorage | None = None,
+    *,
+    fail_fast: bool = False,
+) -> list[BatchResult]:
+    """
+    Run command lines one after another in a single storage batch.
+
+    All commands share ``storage`` and run inside `TaskStorage.batch`, so
+    tasks are parsed once, the rollup counters are saved once and files
+    are synced to disk once, at the end. Each command's output is written
+    as usual.
+
+    Parameters
+    ----------
+    commands : Iterable[tuple[int, list[str]]]
+        The line number and arguments of every command, see `parse_script`.
+    storage : TaskStorage | None, optional
+        The storage to run the commands against, by default ``tasks/``.
+    fail_fast : bool, optional
+        Stop at the first command that fails. By default False.
+
+    Returns
+    -------
+    list[BatchResult]
+        The exit status of every command run, in order.
+    """
+    storage = storage or TaskStorage()
+    results = []
+
+    with storage.batch():
+        for number, args in commands:
+            result = BatchResult(number, args, run_command(args, storage, pager=False))
+            results.append(result)
+
+            if fail_fast and not result.ok:
+                break
+
+    return results
@@ -0,0 +1,234 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from quadro.models import Task
+
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.segment import Segment
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class TaskCache:
+    """
+    A bounded LRU cache of parsed tasks keyed by file path.
+
+    Each entry remembers the mtime and size of the file it was parsed from
+    and is only returned while the file still has both, so edits made by
+    other processes are never served stale. Entries are evicted least
+    recently used first once either budget is exceeded. The byte budget is
+    measured in task file sizes, which approximates the memory held by the
+    parsed tasks.
+
+    Cached tasks are copied on the way in and out, so callers may modify
+    the tasks they get without affecting the cache.
+
+    Examples
+    --------
+    >>> cache = TaskCache(max_entries=256)
+    >>> storage = TaskStorage(cache=cache)
+    >>> storage.load_task(1)
+    >>> storage.load_task(1)
+    >>> cache.stats()
+    CacheStats(hits=1, misses=1, evictions=0, entries=1, bytes=120)
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int | None = None) -> None:
+        """
+        Create an empty cache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of cached tasks, by default 1024.
+        max_bytes : int | None, optional
+            Maximum total size of the cached task files, by default None
+            (no byte budget).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Path, tuple[int, int, Task]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, mtime_ns: int, size: int) -> Task | None:
+        """Return a copy of the task parsed from ``path`` if the file is unchanged."""
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if entry is None or entry[:2] != (mtime_ns, size):
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return replace(entry[2])
+
+    def put(self, path: Path, mtime_ns: int, size: int, task: Task) -> None:
+        """Cache a copy of the task parsed from ``path`` with the file's mtime and size."""
+        with self._lock:
+            self._remove(path)
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            self._entries[path] = (mtime_ns, size, replace(task))
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._remove(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _remove(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+class RenderedMarkdown:
+    """
+    The lines of a Markdown document rendered at one width, produced on demand.
+
+    Rendering runs only as far as the lines requested so far, and the lines
+    are kept, so a document that is paged through is rendered once and a
+    document that is only partly shown is only partly rendered.
+    """
+
+    def __init__(self, console: "Console", text: str, width: int) -> None:
+        # Imported here so that loading the task cache does not load rich.
+        from rich.markdown import Markdown  # noqa: PLC0415
+        from rich.segment import Segment  # noqa: PLC0415
+
+        options = console.options.update_width(width)
+        self._source: Iterator[list[Segment]] | None = iter(
+            Segment.split_and_crop_lines(
+                console.render(Markdown(text), options), width, pad=False, include_new_lines=True
+            )
+        )
+        self._lines: list[list[Segment]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        return self._source is None
+
+    def lines(self, start: int = 0, stop: int | None = None) -> list[list["Segment"]]:
+        """Return rendered lines ``start`` to ``stop``, rendering only up to ``stop``."""
+        with self._lock:
+            while self._source is not None and (stop is None or len(self._lines) < stop):
+                line = next(self._source, None)
+                if line is None:
+                    self._source = None
+                else:
+                    self._lines.append(line)
+
+            return self._lines[start:stop]
+
+    def pages(self, height: int) -> Iterator[list[list["Segment"]]]:
+        """Yield the lines in pages of ``height`` lines, rendering each page when reached."""
+        start = 0
+        while page := self.lines(start, start + height):
+            yield page
+            start += height
+
+
+class MarkdownCache:
+    """
+    A bounded LRU cache of rendered Markdown keyed by text hash and width.
+
+    Rendering Markdown with rich is slow for long documents, so views that
+    show the same description again, such as a REPL, a daemon or a TUI
+    re-drawing a task, reuse the rendered lines instead. Entries are keyed
+    by a hash of the text, not the text itself, and are rendered lazily, see
+    `RenderedMarkdown`.
+
+    Examples
+    --------
+    >>> cache = MarkdownCache()
+    >>> rendered = cache.render(console, task.description)
+    >>> for page in rendered.pages(console.height):
+    ...     console.print(Segments(chain.from_iterable(page)), end="")
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], RenderedMarkdown] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, console: "Console", text: str, width: int | None = None) -> RenderedMarkdown:
+        """
+        Return the rendering of ``text`` at ``width``, reusing a cached one.
+
+        Parameters
+        ----------
+        console : Console
+            Console whose theme and options the text is rendered with.
+        text : str
+            The Markdown source.
+        width : int | None, optional
+            Width to render at, by default the console width.
+
+        Returns
+        -------
+        RenderedMarkdown
+            The lazily rendered lines.
+        """
+        width = console.width if width is None else width
+        key = (hashlib.blake2b(text.encode(), digest_size=16).hexdigest(), width)
+
+        with self._lock:
+            rendered = self._entries.get(key)
+
+            if rendered is None:
+                rendered = RenderedMarkdown(console, text, width)
+                self._entries[key] = rendered
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+
+            return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,26 +1,89 @@
+import sys
 from collections.abc import Callable
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
+from contextlib import suppress
+from dataclasses import replace
 from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import TextIO
 
 import click
-from rich.console import Console
 
 from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import check_tasks
 from quadro.command import complete_task
+from quadro.command import create_snapshot
 from quadro.command import delete_task
+from quadro.command import export_tasks
 from quadro.command import get_task_markdown
-from quadro.command import list_milestones
+from quadro.command import import_tasks
+from quadro.command import list_snapshots
+from quadro.command import list_task_table
 from quadro.command import list_tasks as get_all_tasks
+from quadro.command import milestone_burndown
+from quadro.command import milestone_counts
 from quadro.command import move_task
+from quadro.command import restore_snapshot
+from quadro.command import search_tasks
 from quadro.command import show_task
 from quadro.command import start_task
+from quadro.command import sync_tasks
+from quadro.command import task_stats
+from quadro.command import unarchive_milestone
 from quadro.command import update_task
 from quadro.command import update_task_from_markdown
+from quadro.exceptions import MilestoneNotFoundError
+from quadro.exceptions import SnapshotExistsError
+from quadro.exceptions import SnapshotNotFoundError
 from quadro.exceptions import TaskAlreadyDoneError
 from quadro.exceptions import TaskAlreadyInProgressError
 from quadro.exceptions import TaskNotFoundError
+from quadro.exchange import FORMATS
+from quadro.exchange import LIST_FORMATS
+from quadro.exchange import TABLE_LIST_FORMATS
+from quadro.exchange import write_task_list
+from quadro.exchange import write_task_table
+from quadro.models import Task
 from quadro.models import TaskStatus
-from quadro.renderer import Renderer
+from quadro.storage import TaskStorage
+from quadro.workspace import WORKSPACE_ENV
+from quadro.workspace import Workspace
+
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def _error_lines(error: Exception) -> list[str]:
+    if isinstance(error, PermissionError):
+        return [
+            "[red]✗[/red] Permission denied",
+            f"Cannot access: {error.filename or 'tasks directory'}",
+            "Check that you have read/write permissions for the tasks directory.",
+        ]
+    if isinstance(error, FileNotFoundError):
+        return [
+            "[red]✗[/red] File not found",
+            f"Missing file: {error.filename or 'unknown'}",
+            "The task file may have been deleted or moved.",
+        ]
+    if isinstance(error, OSError):
+        return [
+            "[red]✗[/red] System error",
+            f"{error}",
+            "Check disk space and file permissions.",
+        ]
+    if isinstance(error, ValueError):
+        return ["[red]✗[/red] Invalid data", f"{error}"]
+    return [
+        "[red]✗[/red] Unexpected error",
+        f"{type(error).__name__}: {error}",
+        "Please report this issue if it persists.",
+    ]
 
 
 def handle_exceptions(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -28,37 +91,115 @@ def handle_exceptions(f: Callable[..., Any]) -> Callable[..., Any]:
 
     @wraps(f)
     def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-        console = Console()
         try:
             return f(*args, **kwargs)
-        except PermissionError as e:
-            console.print("[red]✗[/red] Permission denied")
-            console.print(f"Cannot access: {e.filename or 'tasks directory'}")
-            console.print("Check that you have read/write permissions for the tasks directory.")
-            raise SystemExit(1) from e
-        except FileNotFoundError as e:
-            console.print("[red]✗[/red] File not found")
-            console.print(f"Missing file: {e.filename or 'unknown'}")
-            console.print("The task file may have been deleted or moved.")
-            raise SystemExit(1) from e
-        except OSError as e:
-            console.print("[red]✗[/red] System error")
-            console.print(f"{e}")
-            console.print("Check disk space and file permissions.")
-            raise SystemExit(1) from e
-        except ValueError as e:
-            console.print("[red]✗[/red] Invalid data")
-            console.print(f"{e}")
-            raise SystemExit(1) from e
         except Exception as e:
-            console.print("[red]✗[/red] Unexpected error")
-            console.print(f"{type(e).__name__}: {e}")
-            console.print("Please report this issue if it persists.")
+            from rich.console import Console
+
+            console = Console()
+            for line in _error_lines(e):
+                console.print(line)
             raise SystemExit(1) from e
 
     return wrapper
 
 
+def current_storage() -> TaskStorage | None:
+    """
+    Return the storage the current command line runs against.
+
+    This is the storage passed to `run_command`, which the daemon uses to
+    keep one storage warm across commands. When None, as for a plain
+    ``quadro`` invocation, each command opens the default ``tasks/`` storage.
+    """
+    ctx = click.get_current_context(silent=True)
+    return ctx.find_object(TaskStorage) if ctx is not None else None
+
+
+def workspace_option(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Add a ``--workspace`` option that queries every root of a workspace file."""
+    return click.option(
+        "--workspace",
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+        envvar=WORKSPACE_ENV,
+        default=None,
+        help=f"Query every root listed in a workspace file (env: {WORKSPACE_ENV})",
+    )(f)
+
+
+def status_filters(todo: bool, progress: bool, done: bool) -> list[TaskStatus]:  # noqa: FBT001
+    statuses = []
+    if todo:
+        statuses.append(TaskStatus.TODO)
+    if progress:
+        statuses.append(TaskStatus.PROGRESS)
+    if done:
+        statuses.append(TaskStatus.DONE)
+    return statuses
+
+
+def format_option(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Add a ``--format`` option choosing between the rich table and line formats."""
+    return click.option(
+        "--format",
+        "fmt",
+        type=click.Choice(LIST_FORMATS),
+        default=None,
+        help="Output format (default: table on a terminal, plain otherwise)",
+    )(f)
+
+
+def paged(console: "Console", pager: bool | None, rows: int) -> AbstractContextManager["Console"]:  # noqa: FBT001
+    """Open a pager console when asked to, or by default when rows overflow the terminal."""
+    from quadro.pager import pager_console
+
+    if pager is None:
+        pager = console.is_terminal and rows > console.height
+    return pager_console(console) if pager else nullcontext(console)
+
+
+def list_format(fmt: str | None) -> str:
+    """Return the listing format, by default a table on a terminal and plain lines otherwise."""
+    return fmt or ("table" if sys.stdout.isatty() else "plain")
+
+
+def print_tasks(
+    rows: list[tuple[str, Task]],
+    fmt: str | None,
+    empty_message: str,
+    *,
+    pager: bool | None = False,
+) -> None:
+    """
+    Print tasks as a rich table on a terminal, or as lines when piped.
+
+    With a line format, the tasks go straight to stdout without any rich
+    layout, and ``empty_message`` goes to stderr so it never mixes with the
+    data. Rich is only imported for the table, which keeps piped listings
+    in shell loops and hooks fast to start.
+    """
+    fmt = list_format(fmt)
+
+    if fmt != "table":
+        if not rows:
+            click.secho(empty_message, fg="yellow", err=True)
+        write_task_list(rows, sys.stdout, fmt)
+        return
+
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
+    console = Console()
+
+    if not rows:
+        console.print(f"[yellow]{empty_message}[/yellow]")
+        return
+
+    with paged(console, pager, len(rows)) as output:
+        Renderer(output).render_task_rows(rows)
+
+
 @click.group(invoke_without_command=True)
 @click.pass_context
 def main(ctx: click.Context) -> None:
@@ -91,9 +232,11 @@ def add(title: str, description: str | None, milestone: str | None) -> None:
     $ quadro add "Add tests" -d "Write unit tests for auth module" --milestone mvp
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
-    task = add_task(title, description, milestone)
+    task = add_task(title, description, milestone, storage=current_storage())
 
     console.print(f"[green]✓[/green] Created task #{task.id}")
 
@@ -103,12 +246,22 @@ def add(title: str, description: str | None, milestone: str | None) -> None:
 @click.option("--todo", is_flag=True, help="Show only TODO tasks")
 @click.option("--progress", is_flag=True, help="Show only tasks in PROGRESS")
 @click.option("--done", is_flag=True, help="Show only DONE tasks")
+@click.option(
+    "--pager/--no-pager",
+    default=None,
+    help="Page the output (default: when it is longer than the terminal)",
+)
+@format_option
+@workspace_option
 @handle_exceptions
-def list_tasks(
+def list_tasks(  # noqa: PLR0913
     milestone: str | None,
     todo: bool,  # noqa: FBT001
     progress: bool,  # noqa: FBT001
     done: bool,  # noqa: FBT001
+    pager: bool | None = None,  # noqa: FBT001
+    fmt: str | None = None,
+    workspace: Path | None = None,
 ) -> None:
     """List all tasks with their status and details.
 
@@ -120,6 +273,20 @@ def list_tasks(
 
     This is the default command when running 'quadro' without arguments.
 
+    With --workspace (or QUADRO_WORKSPACE), lists the tasks of every root in
+    the workspace file, scanned concurrently. IDs are shown qualified by the
+    root name, as in 'api:12'.
+
+    Output longer than the terminal is shown in a pager ($PAGER, by
+    default 'less -FRX'), which displays the first screen while the rest of
+    a large list is still being rendered. Use --pager or --no-pager to
+    force it on or off.
+
+    When stdout is not a terminal, tasks are written one per line as
+    '<id> <status> <milestone> <title>' without any table layout. Use
+    --format to pick the output explicitly: table, plain, tsv (with a
+    header row) or json (an array of task records).
+
     Examples
     --------
     ```bash
@@ -128,26 +295,45 @@ def list_tasks(
     $ quadro list --todo
     $ quadro list --todo --progress
     $ quadro list --done --milestone mvp
+    $ quadro list --workspace ~/code/quadro-workspace.toml --progress
+    $ quadro list --todo | grep login
+    $ quadro list --format json > tasks.json
     ```
     """
-    console = Console()
-    renderer = Renderer(console)
-
-    status_filters = []
-    if todo:
-        status_filters.append(TaskStatus.TODO)
-    if progress:
-        status_filters.append(TaskStatus.PROGRESS)
-    if done:
-        status_filters.append(TaskStatus.DONE)
+    statuses = status_filters(todo, progress, done)
+
+    if workspace is not None:
+        entries = Workspace.from_file(workspace).list_tasks(milestone=milestone, statuses=statuses)
+        print_tasks(
+            [(entry.qualified_id, entry.task) for entry in entries],
+            fmt,
+            "No tasks found in workspace",
+            pager=pager,
+        )
+        return
 
-    tasks = get_all_tasks(milestone=milestone, statuses=status_filters or None)
+    fmt = list_format(fmt)
+    empty_message = "No tasks found. Create one with 'quadro add <title>'"
 
-    if not tasks:
-        console.print("[yellow]No tasks found. Create one with 'quadro add <title>'[/yellow]")
+    if fmt in TABLE_LIST_FORMATS:
+        # Lines only need the table's columns, so tasks are packed as they
+        # are parsed instead of being held as Task objects.
+        table = list_task_table(
+            milestone=milestone, statuses=statuses or None, storage=current_storage()
+        )
+        if not table:
+            click.secho(empty_message, fg="yellow", err=True)
+        write_task_table(table, sys.stdout, fmt)
         return
 
-    renderer.render_task_list(tasks)
+    tasks = get_all_tasks(milestone=milestone, statuses=statuses or None, storage=current_storage())
+
+    print_tasks(
+        [(str(task.id), task) for task in tasks],
+        fmt,
+        empty_message,
+        pager=pager,
+    )
 
 
 @main.command("start")
@@ -168,10 +354,12 @@ def start(task_id: int) -> None:
     $ quadro start 1
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
     try:
-        task = start_task(task_id)
+        task = start_task(task_id, storage=current_storage())
         console.print(f"[green]✓[/green] Started task #{task_id}: {task.title}")
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
@@ -198,10 +386,12 @@ def done(task_id: int) -> None:
     $ quadro done 1
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
     try:
-        task = complete_task(task_id)
+        task = complete_task(task_id, storage=current_storage())
         console.print(f"[green]✓[/green] Completed task #{task_id}: {task.title}")
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
@@ -227,20 +417,83 @@ def show(task_id: int) -> None:
     $ quadro show 1
     ```
     """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
     console = Console()
     renderer = Renderer(console)
 
     try:
-        task = show_task(task_id)
+        task = show_task(task_id, storage=current_storage())
         renderer.render_task_detail(task)
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
         raise SystemExit(1) from None
 
 
+@main.command("search")
+@click.argument("query")
+@click.option("--milestone", default=None, help="Only search tasks of this milestone")
+@click.option("--todo", is_flag=True, help="Show only TODO tasks")
+@click.option("--progress", is_flag=True, help="Show only tasks in PROGRESS")
+@click.option("--done", is_flag=True, help="Show only DONE tasks")
+@format_option
+@workspace_option
+@handle_exceptions
+def search(  # noqa: PLR0913
+    query: str,
+    milestone: str | None,
+    todo: bool,  # noqa: FBT001
+    progress: bool,  # noqa: FBT001
+    done: bool,  # noqa: FBT001
+    fmt: str | None = None,
+    workspace: Path | None = None,
+) -> None:
+    """Find tasks whose title or description contains QUERY.
+
+    Matching is case-insensitive. Results can be narrowed with the same
+    milestone, status and --format options as 'quadro list'.
+
+    With --workspace (or QUADRO_WORKSPACE), searches every root in the
+    workspace file concurrently and shows IDs qualified by the root name.
+
+    Examples
+    --------
+    ```bash
+    $ quadro search login
+    $ quadro search "rate limit" --milestone mvp --todo
+    $ quadro search auth --workspace ~/code/quadro-workspace.toml
+    ```
+    """
+    statuses = status_filters(todo, progress, done)
+
+    if workspace is not None:
+        entries = Workspace.from_file(workspace).search(
+            query, milestone=milestone, statuses=statuses
+        )
+        print_tasks(
+            [(entry.qualified_id, entry.task) for entry in entries],
+            fmt,
+            f"No tasks matching '{query}' found in workspace",
+        )
+        return
+
+    tasks = search_tasks(
+        query, milestone=milestone, statuses=statuses or None, storage=current_storage()
+    )
+
+    print_tasks(
+        [(str(task.id), task) for task in tasks],
+        fmt,
+        f"No tasks matching '{query}' found",
+    )
+
+
 @main.command("milestones")
+@workspace_option
 @handle_exceptions
-def milestones() -> None:
+def milestones(workspace: Path | None = None) -> None:
     """Display a summary of all milestones and their tasks.
 
     Shows a grouped view of tasks organized by milestone, with counts of
@@ -250,26 +503,122 @@ def milestones() -> None:
     Only tasks that have been assigned to a milestone are included in this
     view. Tasks without a milestone are not shown.
 
+    The counts are read from per-milestone counters that are kept up to
+    date as tasks change, so no task file is parsed.
+
+    With --workspace (or QUADRO_WORKSPACE), summarizes the milestones of
+    every root in the workspace file, named as 'root:milestone'.
+
     Examples
     --------
     ```bash
     $ quadro milestones
+    $ quadro milestones --workspace ~/code/quadro-workspace.toml
     ```
     """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
     console = Console()
     renderer = Renderer(console)
 
+    if workspace is not None:
+        entries = Workspace.from_file(workspace).list_milestones()
+        if not entries:
+            console.print("[yellow]No milestones found in workspace[/yellow]")
+            return
+        renderer.render_milestones(
+            [
+                replace(entry.task, milestone=f"{entry.root}:{entry.task.milestone}")
+                for entry in entries
+            ]
+        )
+        return
+
     try:
-        milestone_tasks = list_milestones()
+        counts = milestone_counts(storage=current_storage())
     except TaskNotFoundError:
         console.print("[yellow]No tasks found. Create one with 'quadro add <title>'[/yellow]")
         return
 
-    if not milestone_tasks:
+    if not counts:
         console.print("[yellow]No milestones found. Add tasks with '--milestone <name>'[/yellow]")
         return
 
-    renderer.render_milestones(milestone_tasks)
+    renderer.render_milestone_counts(counts)
+
+
+@main.command("stats")
+@click.option("--milestone", default=None, help="Only include tasks of this milestone")
+@click.option("--weeks", default=8, type=click.IntRange(min=1), help="Weeks of throughput to show")
+@click.option("--bins", default=10, type=click.IntRange(min=1), help="Histogram bins")
+@handle_exceptions
+def stats(milestone: str | None, weeks: int, bins: int) -> None:
+    """Show lead time, throughput and aging statistics.
+
+    Lead time is the number of days from creation to completion of done
+    tasks. Aging is the number of days open tasks have existed, shown per
+    milestone. Both are summarized by their mean and 50th, 85th and 95th
+    percentiles, and lead time also as a histogram. Throughput counts the
+    tasks completed in each of the last weeks, starting on Monday (UTC).
+
+    With --milestone, the milestone's archived tasks are included.
+    Aggregation is vectorized with NumPy when it is installed
+    (pip install "qdr[stats]").
+
+    Examples
+    --------
+    ```bash
+    $ quadro stats
+    $ quadro stats --milestone mvp
+    $ quadro stats --weeks 12 --bins 5
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
+    console = Console()
+    renderer = Renderer(console)
+
+    report = task_stats(milestone=milestone, weeks=weeks, bins=bins, storage=current_storage())
+
+    renderer.render_stats(report)
+
+
+@main.command("burndown")
+@click.argument("milestone")
+@click.option("--days", default=None, type=click.IntRange(min=1), help="Only show the last days")
+@handle_exceptions
+def burndown(milestone: str, days: int | None) -> None:
+    """Show a milestone's scope, completed and remaining tasks per day.
+
+    The chart is read from daily counters kept up to date as tasks are
+    added, completed, moved and deleted, so it renders in constant time
+    regardless of how many tasks the milestone has. Archived tasks are
+    included.
+
+    Examples
+    --------
+    ```bash
+    $ quadro burndown mvp
+    $ quadro burndown mvp --days 14
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
+    console = Console()
+    renderer = Renderer(console)
+
+    points = milestone_burndown(milestone, storage=current_storage())
+
+    if days is not None:
+        points = points[-days:]
+
+    renderer.render_burndown(milestone, points)
 
 
 @main.command("move")
@@ -294,10 +643,12 @@ def move(task_id: int, to: str) -> None:
     $ quadro move 3 --to v2.0
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
     try:
-        old_milestone, new_milestone, new_path = move_task(task_id, to)
+        old_milestone, new_milestone, new_path = move_task(task_id, to, storage=current_storage())
         console.print(
             f"[green]✓[/green] Moved task #{task_id} from {old_milestone} to {new_milestone}"
         )
@@ -331,10 +682,12 @@ def edit(task_id: int) -> None:
     $ quadro edit 1
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
     try:
-        original_content = get_task_markdown(task_id)
+        original_content = get_task_markdown(task_id, storage=current_storage(), archived=False)
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
         raise SystemExit(1) from None
@@ -349,7 +702,7 @@ def edit(task_id: int) -> None:
         console.print("[yellow]![/yellow] No changes made")
         return
 
-    update_task_from_markdown(task_id, edited_content)
+    update_task_from_markdown(task_id, edited_content, storage=current_storage())
     console.print(f"[green]✓[/green] Updated task #{task_id}")
 
 
@@ -378,6 +731,8 @@ def update(
     $ quadro update 3 -d "Using shorthand flag"
     ```
     """
+    from rich.console import Console
+
     console = Console()
 
     if title is None and description is None:
@@ -386,7 +741,7 @@ def update(
         raise SystemExit(1)
 
     try:
-        task = update_task(task_id, title=title, description=description)
+        task = update_task(task_id, title=title, description=description, storage=current_storage())
         console.print(f"[green]✓[/green] Updated task #{task_id}: {task.title}")
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
@@ -419,11 +774,15 @@ def delete(task_id: int, yes: bool) -> None:  # noqa: FBT001
     $ quadro delete 1 -y
     ```
     """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
     console = Console()
     renderer = Renderer(console)
 
     try:
-        task = show_task(task_id)
+        task = show_task(task_id, storage=current_storage(), archived=False)
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
         raise SystemExit(1) from None
@@ -438,10 +797,539 @@ def delete(task_id: int, yes: bool) -> None:  # noqa: FBT001
             return
 
     try:
-        _, file_path = delete_task(task_id)
+        _, file_path = delete_task(task_id, storage=current_storage())
     except TaskNotFoundError as e:
         console.print(f"[red]✗[/red] {e}")
         raise SystemExit(1) from None
 
     console.print(f"[green]✓[/green] Deleted task #{task_id}: {task.title}")
     console.print(f"[dim]Removed: {file_path}[/dim]")
+
+
+@main.command("fsck")
+@handle_exceptions
+def fsck() -> None:
+    """Check the tasks directory for inconsistencies.
+
+    Reads and parses every task file, reporting files that cannot be parsed,
+    task IDs that exist in more than one file or also in an archived
+    milestone, and tasks whose frontmatter milestone does not match the
+    directory they are stored in.
+
+    Also rebuilds the milestone counters and drops the cached sync hashes
+    kept in 'tasks/.quadro', so both are recomputed from the task files.
+
+    Useful after moving or editing task files by hand. Exits with status 1
+    when any issue is found.
+
+    Examples
+    --------
+    ```bash
+    $ quadro fsck
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
+    console = Console()
+    renderer = Renderer(console)
+
+    report = check_tasks(storage=current_storage())
+    renderer.render_check_report(report)
+
+    if not report.ok:
+        raise SystemExit(1)
+
+
+@main.command("snapshot")
+@click.argument("name", required=False)
+@click.option("--list", "list_", is_flag=True, help="List existing snapshots")
+@handle_exceptions
+def snapshot(name: str | None, list_: bool) -> None:  # noqa: FBT001
+    """Take a snapshot of the tasks directory.
+
+    Snapshots are stored under tasks/.quadro/snapshots and are near-instant:
+    files are cloned as copy-on-write reflinks when the filesystem supports
+    them, and as hardlinks otherwise, so a snapshot takes no extra space until
+    tasks change. Take one before risky bulk operations and bring the tree
+    back with 'quadro restore'.
+
+    When no name is given, the current UTC timestamp is used.
+
+    Examples
+    --------
+    ```bash
+    $ quadro snapshot
+    $ quadro snapshot before-cleanup
+    $ quadro snapshot --list
+    ```
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    if list_:
+        names = list_snapshots(storage=current_storage())
+        if not names:
+            console.print("[yellow]No snapshots found. Create one with 'quadro snapshot'[/yellow]")
+            return
+        for snapshot_name in names:
+            console.print(snapshot_name)
+        return
+
+    try:
+        snapshot_name, count = create_snapshot(name, storage=current_storage())
+    except SnapshotExistsError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise SystemExit(1) from None
+
+    console.print(f"[green]✓[/green] Created snapshot {snapshot_name} ({count} files)")
+
+
+@main.command("restore")
+@click.argument("name")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+@handle_exceptions
+def restore(name: str, yes: bool) -> None:  # noqa: FBT001
+    """Restore the tasks directory from a snapshot.
+
+    Replaces every task file with the contents of the named snapshot. Tasks
+    created after the snapshot was taken are removed. The snapshot itself is
+    kept, so it can be restored again.
+
+    WARNING: Changes made since the snapshot are lost. Take another snapshot
+    first if you may need them.
+
+    Examples
+    --------
+    ```bash
+    $ quadro restore before-cleanup
+    $ quadro restore before-cleanup --yes
+    ```
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    if not yes and not click.confirm(
+        f"Replace the tasks directory with snapshot {name}?", default=False
+    ):
+        console.print("[yellow]![/yellow] Restore cancelled")
+        return
+
+    try:
+        count = restore_snapshot(name, storage=current_storage())
+    except SnapshotNotFoundError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise SystemExit(1) from None
+
+    console.print(f"[green]✓[/green] Restored snapshot {name} ({count} files)")
+
+
+@main.command("export")
+@click.option("--format", "fmt", type=click.Choice(FORMATS), default="ndjson", help="Output format")
+@click.option("--milestone", default=None, help="Only export tasks of this milestone")
+@click.option("--output", "-o", type=click.File("w"), default="-", help="Output file")
+@handle_exceptions
+def export(fmt: str, milestone: str | None, output: TextIO) -> None:
+    """Export tasks as NDJSON or CSV.
+
+    Streams every task, one record per line, in ID order. Tasks are written
+    as soon as they are parsed, so exporting a large backlog starts
+    immediately and uses little memory. Writes to standard output unless
+    --output is given.
+
+    Each record has the fields id, title, description, status, milestone,
+    created, and completed.
+
+    Examples
+    --------
+    ```bash
+    $ quadro export > backlog.ndjson
+    $ quadro export --format csv --output backlog.csv
+    $ quadro export --milestone mvp | jq .title
+    ```
+    """
+    count = export_tasks(output, fmt=fmt, milestone=milestone, storage=current_storage())
+
+    if output.name != "<stdout>":
+        from rich.console import Console
+
+        console = Console()
+        console.print(f"[green]✓[/green] Exported {count} tasks to {output.name}")
+
+
+@main.command("import")
+@click.argument("source", type=click.File("r"), default="-")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    default=None,
+    help="Input format (default: csv for .csv files, ndjson otherwise)",
+)
+@handle_exceptions
+def import_(source: TextIO, fmt: str | None) -> None:
+    """Import tasks from an NDJSON or CSV file.
+
+    Reads records from SOURCE (standard input when omitted or '-') and creates
+    one task per record. Records need a title; description, status,
+    milestone, created, and completed are optional. Every imported task gets
+    a new ID after the highest existing one.
+
+    Input is processed as a stream and written in batches, so large imports
+    run in constant memory.
+
+    Examples
+    --------
+    ```bash
+    $ quadro import backlog.ndjson
+    $ quadro import backlog.csv
+    $ quadro export | ssh buildbox quadro import
+    ```
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    if fmt is None:
+        fmt = "csv" if source.name.endswith(".csv") else "ndjson"
+
+    count = import_tasks(source, fmt=fmt, storage=current_storage())
+
+    console.print(f"[green]✓[/green] Imported {count} tasks")
+
+
+@main.command("archive")
+@click.argument("milestone")
+@handle_exceptions
+def archive(milestone: str) -> None:
+    """Archive a finished milestone into a compressed bundle.
+
+    Packs every task of the milestone into tasks/.quadro/archive/MILESTONE.zip
+    and removes the milestone directory. Archived tasks are left out of
+    'quadro list' and 'quadro milestones', which keeps large backlogs fast,
+    but remain available: 'quadro show' finds them by ID and
+    'quadro list --milestone MILESTONE' lists them.
+
+    Archived tasks are read-only. Use 'quadro unarchive' to move the tasks
+    back before starting, completing, editing, moving or deleting them.
+
+    Examples
+    --------
+    ```bash
+    $ quadro archive v1.0
+    $ quadro list --milestone v1.0
+    ```
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    try:
+        count, path = archive_milestone(milestone, storage=current_storage())
+    except MilestoneNotFoundError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise SystemExit(1) from None
+
+    console.print(f"[green]✓[/green] Archived {count} tasks from {milestone}")
+    console.print(f"[dim]Archive: {path}[/dim]")
+
+
+@main.command("unarchive")
+@click.argument("milestone")
+@handle_exceptions
+def unarchive(milestone: str) -> None:
+    """Move an archived milestone back into the tasks directory.
+
+    Unpacks the milestone bundle into tasks/MILESTONE and removes it. Task
+    files that already exist in the milestone directory are kept.
+
+    Examples
+    --------
+    ```bash
+    $ quadro unarchive v1.0
+    ```
+    """
+    from rich.console import Console
+
+    console = Console()
+
+    try:
+        count = unarchive_milestone(milestone, storage=current_storage())
+    except MilestoneNotFoundError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise SystemExit(1) from None
+
+    console.print(f"[green]✓[/green] Restored {count} tasks to {milestone}")
+
+
+@main.command("sync")
+@click.argument("source", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("target", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--dry-run", is_flag=True, help="Show what would change without changing it")
+@handle_exceptions
+def sync(source: Path, target: Path, dry_run: bool) -> None:  # noqa: FBT001
+    """Synchronize two task directories in both directions.
+
+    Copies tasks created or edited on one side to the other, and deletes
+    tasks removed on one side from the other. Each side keeps a manifest of
+    content hashes cached by modification time, and the state after each
+    sync is recorded in both directories, so a sync only reads and copies
+    the files that changed since the previous one.
+
+    A task edited differently on both sides since the last sync is reported
+    as a conflict and left untouched. Resolve it by editing either copy so
+    both match, or by deleting one of them and syncing again. Exits with
+    status 1 when there are conflicts.
+
+    Archive bundles are copied like task files, so tasks archived on one
+    side move into the bundle on the other. Snapshots are not synchronized.
+
+    Examples
+    --------
+    ```bash
+    $ quadro sync tasks /mnt/buildbox/project/tasks
+    $ quadro sync tasks /mnt/buildbox/project/tasks --dry-run
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.renderer import Renderer
+
+    console = Console()
+    renderer = Renderer(console)
+
+    report = sync_tasks(target, dry_run=dry_run, storage=TaskStorage(source))
+
+    if dry_run:
+        console.print("[yellow]![/yellow] Dry run, no files changed")
+
+    renderer.render_sync_report(report)
+
+    if not report.ok:
+        raise SystemExit(1)
+
+
+@main.command("serve")
+@click.option("--host", default="127.0.0.1", help="Address to listen on")
+@click.option("--port", default=8000, type=int, help="Port to listen on")
+@handle_exceptions
+def serve(host: str, port: int) -> None:
+    """Serve tasks and milestone summaries as JSON over HTTP.
+
+    Starts a read-only HTTP server for dashboards and scripts that poll task
+    state. It answers GET /tasks (with optional milestone and status query
+    parameters), GET /tasks/ID and GET /milestones.
+
+    Every response carries an ETag. Clients that send it back in an
+    If-None-Match header get an empty 304 Not Modified response until the
+    underlying task files change, which keeps frequent polling cheap.
+
+    Listens on 127.0.0.1 by default. Press Ctrl+C to stop.
+
+    Examples
+    --------
+    ```bash
+    $ quadro serve
+    $ quadro serve --port 9000
+    $ curl "http://127.0.0.1:8000/tasks?milestone=mvp&status=todo"
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.server import TaskServer
+
+    console = Console()
+
+    with TaskServer((host, port), current_storage()) as server:
+        console.print(f"[green]✓[/green] Serving tasks on http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("[yellow]![/yellow] Server stopped")
+
+
+@main.command("daemon")
+@click.option("--stop", is_flag=True, help="Stop the daemon running for this directory")
+@handle_exceptions
+def daemon(stop: bool) -> None:  # noqa: FBT001
+    """Keep the task index warm in a background process.
+
+    The daemon listens on a Unix socket in 'tasks/.quadro/daemon.sock'.
+    While it runs, 'quadro' forwards add, list, start, done, show, search
+    and the other non-interactive commands to it instead of loading and
+    scanning everything itself. The daemon answers from parsed tasks and
+    counters it keeps in memory. It still notices edits made by other
+    programs, because every cached task is checked against its file's
+    modification time and size.
+
+    When no daemon is running, or QUADRO_NO_DAEMON is set, commands run
+    directly as usual. Interactive commands (edit, delete without --yes,
+    restore, ...) and commands that read or write local files always run
+    directly.
+
+    The daemon runs in the foreground until interrupted. Start it in the
+    background from a shell or a service manager.
+
+    Examples
+    --------
+    ```bash
+    $ quadro daemon &
+    $ quadro list
+    $ quadro daemon --stop
+    ```
+    """
+    from rich.console import Console
+
+    from quadro.client import socket_path
+    from quadro.client import stop_daemon
+    from quadro.daemon import TaskDaemon
+
+    console = Console()
+    storage = TaskStorage()
+    path = socket_path(storage.base_path)
+
+    if stop:
+        if stop_daemon(storage.base_path):
+            console.print(f"[green]✓[/green] Stopped daemon on {path}")
+        else:
+            console.print("[yellow]![/yellow] No daemon running")
+        return
+
+    try:
+        server = TaskDaemon(storage)
+    except FileExistsError:
+        console.print(f"[red]✗[/red] A daemon is already running on {path}")
+        raise SystemExit(1) from None
+
+    with server:
+        console.print(f"[green]✓[/green] Daemon listening on {path}")
+        with suppress(KeyboardInterrupt):
+            server.serve_forever()
+        console.print("[yellow]![/yellow] Daemon stopped")
+
+
+@main.command("shell")
+@handle_exceptions
+def shell() -> None:
+    """Run commands interactively on one loaded tasks directory.
+
+    Starts a prompt that accepts any quadro command without the 'quadro'
+    prefix. All commands share one storage, so tasks are read and parsed
+    once and each command only does its own work, which makes long triage
+    sessions fast.
+
+    Tab completes commands, options, task IDs and milestone names. The
+    command history is kept in 'tasks/.quadro/shell_history'. Leave with
+    'exit', 'quit' or Ctrl-D.
+
+    Examples
+    --------
+    ```bash
+    $ quadro shell
+    quadro> list --todo
+    quadro> start 12
+    quadro> move 12 --to mvp
+    quadro> exit
+    ```
+    """
+    from quadro.shell import TaskShell
+
+    TaskShell(current_storage()).run()
+
+
+@main.command("batch")
+@click.argument("script", type=click.File("r"), default="-")
+@click.option("--fail-fast", is_flag=True, help="Stop at the first command that fails")
+@handle_exceptions
+def batch(script: TextIO, fail_fast: bool) -> None:  # noqa: FBT001
+    """Run many commands from a script in one process.
+
+    Reads one quadro command per line from SCRIPT (standard input when
+    omitted or '-'), quoted as in a shell and with or without the 'quadro'
+    prefix. Blank lines and '#' comments are skipped. The whole script is
+    checked before anything runs.
+
+    All commands share one storage and run under a single lock. Tasks are
+    parsed once, the milestone counters are saved once, and changed files
+    are synced to disk once at the end, so a script of hundreds of adds and
+    moves runs in a fraction of the time of separate invocations.
+
+    Each command prints its usual output. Failed lines are reported with
+    their line number, and the batch exits with status 1 if any failed.
+
+    Examples
+    --------
+    ```bash
+    $ quadro batch changes.txt
+    $ printf 'add "Fix login" --milestone mvp\\ndone 12\\n' | quadro batch
+    $ quadro batch --fail-fast changes.txt
+    ```
+    """
+    import shlex
+
+    from rich.console import Console
+
+    from quadro.batch import parse_script
+    from quadro.batch import run_batch
+
+    console = Console()
+    results = run_batch(parse_script(script), current_storage(), fail_fast=fail_fast)
+    failed = [result for result in results if not result.ok]
+
+    for result in failed:
+        console.print(
+            f"[red]✗[/red] Line {result.line} failed with status {result.code}: "
+            f"{shlex.join(result.args)}"
+        )
+
+    if failed:
+        console.print(f"[red]✗[/red] {len(failed)} of {len(results)} commands failed")
+        raise SystemExit(1)
+
+    console.print(f"[green]✓[/green] Ran {len(results)} commands")
+
+
+def run_command(args: list[str], storage: TaskStorage, *, pager: bool | None = None) -> int:
+    """
+    Run a ``quadro`` command line in this process against an open storage.
+
+    Every command uses ``storage`` instead of opening its own, so the
+    parsed tasks and counters it caches are reused across command lines.
+    Output goes to ``sys.stdout`` and ``sys.stderr``.
+
+    Parameters
+    ----------
+    args : list[str]
+        The arguments after ``quadro``, such as ``["done", "12"]``.
+    storage : TaskStorage
+        The storage to run the command against.
+    pager : bool | None, optional
+        Whether ``list`` may page its output, by default when it overflows
+        the terminal.
+
+    Returns
+    -------
+    int
+        The exit status of the command.
+    """
+    try:
+        result = main.main(
+            args,
+            prog_name="quadro",
+            obj=storage,
+            default_map={"list": {"pager": pager}},
+            standalone_mode=False,
+        )
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+
+    return result if isinstance(result, int) else 0
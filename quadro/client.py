@@ -0,0 +1,178 @@
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+from typing import cast
+
+
+# Kept free of click, rich and the task modules: forwarding a command to a
+# running daemon only needs the standard library, so it starts in the time
+# it takes to launch the interpreter.
+
+SOCKET_NAME = "daemon.sock"
+NO_DAEMON_ENV = "QUADRO_NO_DAEMON"
+# Commands that neither prompt, open an editor, nor read or write files given
+# on the command line, and therefore run the same in the daemon.
+FORWARDED_COMMANDS = frozenset(
+    {
+        "add",
+        "archive",
+        "burndown",
+        "done",
+        "fsck",
+        "list",
+        "milestones",
+        "move",
+        "search",
+        "show",
+        "snapshot",
+        "start",
+        "stats",
+        "unarchive",
+        "update",
+    }
+)
+# Environment the daemon adopts while running a forwarded command, so that
+# output is laid out and colored for the client's terminal.
+FORWARDED_ENV = (
+    "COLORTERM",
+    "COLUMNS",
+    "FORCE_COLOR",
+    "LINES",
+    "NO_COLOR",
+    "QUADRO_WORKSPACE",
+    "TERM",
+)
+
+
+def socket_path(base_path: Path) -> Path:
+    """Return the path of the daemon socket of a tasks directory."""
+    # ".quadro" is `quadro.storage.STATE_DIR`, not imported to stay light.
+    return base_path / ".quadro" / SOCKET_NAME
+
+
+def forwardable(args: list[str]) -> bool:
+    """Tell whether a command line can run in the daemon instead of here."""
+    command = args[0] if args else "list"
+    return command in FORWARDED_COMMANDS and "--pager" not in args
+
+
+def _client_environ() -> dict[str, str]:
+    environ = {key: os.environ[key] for key in FORWARDED_ENV if key in os.environ}
+
+    try:
+        size = os.get_terminal_size(sys.stdout.fileno())
+    except (OSError, ValueError):
+        return environ
+
+    environ.setdefault("COLUMNS", str(size.columns))
+    environ.setdefault("LINES", str(size.lines))
+
+    return environ
+
+
+def _connect(path: Path) -> socket.socket | None:
+    if not path.exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(path))
+    except OSError:
+        client.close()
+        return None
+
+    return client
+
+
+def request(client: socket.socket, message: dict[str, Any]) -> dict[str, Any]:
+    """Send one request to the daemon and return its response."""
+    client.sendall(json.dumps(message).encode() + b"\n")
+
+    with client.makefile("rb") as response:
+        line = response.readline()
+
+    if not line:
+        msg = "Daemon closed the connection without responding"
+        raise ConnectionError(msg)
+
+    return cast("dict[str, Any]", json.loads(line))
+
+
+def forward(args: list[str], base_path: Path = Path("tasks")) -> int | None:
+    """
+    Run a command line in the daemon of ``base_path``, if one is running.
+
+    Parameters
+    ----------
+    args : list[str]
+        The arguments after ``quadro``.
+    base_path : Path, optional
+        The tasks directory, by default ``tasks``.
+
+    Returns
+    -------
+    int | None
+        The exit status of the command, after its output was written to
+        stdout and stderr. None when the command was not sent, because it
+        cannot run in the daemon, no daemon is running or ``QUADRO_NO_DAEMON``
+        is set, and should run in this process instead.
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not forwardable(args):
+        return None
+
+    client = _connect(socket_path(base_path))
+    if client is None:
+        return None
+
+    # Once sent, a command may have run even if no response arrives, so it
+    # is reported as failed instead of being run again here.
+    try:
+        with client:
+            response = request(
+                client, {"args": args, "tty": sys.stdout.isatty(), "env": _client_environ()}
+            )
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"✗ Daemon error: {e}\n")
+        return 1
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.stdout.flush()
+    return int(response["code"])
+
+
+def daemon_running(base_path: Path = Path("tasks")) -> bool:
+    """Tell whether a daemon is listening on the socket of ``base_path``."""
+    client = _connect(socket_path(base_path))
+    if client is None:
+        return False
+
+    client.close()
+    return True
+
+
+def stop_daemon(base_path: Path = Path("tasks")) -> bool:
+    """Ask the daemon of ``base_path`` to exit. Return False if none is running."""
+    client = _connect(socket_path(base_path))
+    if client is None:
+        return False
+
+    with client:
+        request(client, {"stop": True})
+
+    return True
+
+
+def main() -> None:
+    """Entry point of the ``quadro`` script."""
+    code = forward(sys.argv[1:])
+
+    if code is None:
+        from quadro.cli import main as cli  # noqa: PLC0415
+
+        cli()
+    else:
+        sys.exit(code)
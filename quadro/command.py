@@ -1,16 +1,54 @@
 from datetime import UTC
 from datetime import datetime
+from itertools import batched
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import TextIO
 
+from quadro import exchange
+from quadro.exceptions import MilestoneNotFoundError
 from quadro.exceptions import TaskAlreadyDoneError
 from quadro.exceptions import TaskAlreadyInProgressError
+from quadro.exceptions import TaskArchivedError
 from quadro.exceptions import TaskNotFoundError
 from quadro.models import Task
 from quadro.models import TaskStatus
+from quadro.rollup import BurndownPoint
+from quadro.storage import CheckReport
 from quadro.storage import TaskStorage
+from quadro.sync import SyncReport
+from quadro.table import TaskTable
 
 
-def add_task(title: str, description: str | None = None, milestone: str | None = None) -> Task:
+if TYPE_CHECKING:
+    from quadro.stats import TaskStats
+
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def _load_task_to_change(task_id: int, storage: TaskStorage) -> Task:
+    """Load a task from its task file, refusing tasks that are only archived."""
+    task = storage.load_task(task_id, archived=False)
+
+    if task is None:
+        archived = storage.load_task(task_id)
+        if archived is not None:
+            msg = f"Task #{task_id} is archived; unarchive milestone '{archived.milestone}' first"
+            raise TaskArchivedError(msg)
+
+        msg = f"Task #{task_id} not found"
+        raise TaskNotFoundError(msg)
+
+    return task
+
+
+def add_task(
+    title: str,
+    description: str | None = None,
+    milestone: str | None = None,
+    storage: TaskStorage | None = None,
+) -> Task:
     """
     Add a new task.
 
@@ -22,13 +60,15 @@ def add_task(title: str, description: str | None = None, milestone: str | None =
         The task description, by default None
     milestone : str | None, optional
         Milestone name for the task, by default None
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
     Task
         The newly created Task object
     """
-    storage = TaskStorage()
+    storage = storage or TaskStorage()
 
     task_id = storage.get_next_id()
     task = Task(
@@ -49,6 +89,7 @@ def add_task(title: str, description: str | None = None, milestone: str | None =
 def list_tasks(
     milestone: str | None = None,
     statuses: list[TaskStatus] | None = None,
+    storage: TaskStorage | None = None,
 ) -> list[Task]:
     """
     List all tasks with optional filters.
@@ -59,13 +100,15 @@ def list_tasks(
         Filter tasks by milestone. If None, tasks from all milestones are included.
     statuses : list[TaskStatus] | None
         Filter tasks by status. If None or empty, all statuses are included.
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
     list[Task]
         A list of filtered tasks sorted by ID. May be empty if no tasks match.
     """
-    storage = TaskStorage()
+    storage = storage or TaskStorage()
     tasks = storage.load_all_tasks(milestone=milestone)
 
     if statuses:
@@ -74,7 +117,68 @@ def list_tasks(
     return tasks
 
 
-def start_task(task_id: int) -> Task:
+def list_task_table(
+    milestone: str | None = None,
+    statuses: list[TaskStatus] | None = None,
+    storage: TaskStorage | None = None,
+) -> TaskTable:
+    """
+    List tasks with optional filters as a compact columnar table.
+
+    Takes the same filters as `list_tasks`, but tasks are packed into a
+    `TaskTable` as they are parsed, so listing a large backlog does not
+    hold a `Task` per task. Descriptions are not kept.
+
+    Parameters
+    ----------
+    milestone : str | None
+        Filter tasks by milestone. If None, tasks from all milestones are included.
+    statuses : list[TaskStatus] | None
+        Filter tasks by status. If None or empty, all statuses are included.
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    TaskTable
+        The filtered tasks sorted by ID. May be empty if no tasks match.
+    """
+    storage = storage or TaskStorage()
+    return storage.load_table(milestone=milestone, statuses=statuses)
+
+
+def search_tasks(
+    query: str,
+    milestone: str | None = None,
+    statuses: list[TaskStatus] | None = None,
+    storage: TaskStorage | None = None,
+) -> list[Task]:
+    """
+    Find tasks whose title or description contains the given text.
+
+    Parameters
+    ----------
+    query : str
+        Text to look for, matched case-insensitively.
+    milestone : str | None
+        Only search tasks of this milestone. If None, all milestones are searched.
+    statuses : list[TaskStatus] | None
+        Only search tasks with these statuses. If None or empty, all statuses are included.
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    list[Task]
+        The matching tasks sorted by ID. May be empty if nothing matches.
+    """
+    storage = storage or TaskStorage()
+    tasks = list_tasks(milestone=milestone, statuses=statuses, storage=storage)
+
+    return storage.search(tasks, query)
+
+
+def start_task(task_id: int, storage: TaskStorage | None = None) -> Task:
     """
     Start a task by changing its status to in progress.
 
@@ -82,6 +186,8 @@ def start_task(task_id: int) -> Task:
     ----------
     task_id : int
         The ID of the task to start
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -92,17 +198,15 @@ def start_task(task_id: int) -> Task:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     TaskAlreadyInProgressError
         If task is already in progress
     TaskAlreadyDoneError
         If task is already completed
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    task = _load_task_to_change(task_id, storage)
 
     if task.status == TaskStatus.PROGRESS:
         msg = f"Task #{task_id} is already in progress"
@@ -113,12 +217,12 @@ def start_task(task_id: int) -> Task:
         raise TaskAlreadyDoneError(msg)
 
     task.status = TaskStatus.PROGRESS
-    storage.save_task(task)
+    storage.save_task(task, patch=True)
 
     return task
 
 
-def complete_task(task_id: int) -> Task:
+def complete_task(task_id: int, storage: TaskStorage | None = None) -> Task:
     """
     Mark a task as completed.
 
@@ -126,6 +230,8 @@ def complete_task(task_id: int) -> Task:
     ----------
     task_id : int
         The ID of the task to complete
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -136,15 +242,13 @@ def complete_task(task_id: int) -> Task:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     TaskAlreadyDoneError
         If task is already completed
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    task = _load_task_to_change(task_id, storage)
 
     if task.status == TaskStatus.DONE:
         msg = f"Task #{task_id} is already done"
@@ -152,12 +256,12 @@ def complete_task(task_id: int) -> Task:
 
     task.status = TaskStatus.DONE
     task.completed = datetime.now(UTC)
-    storage.save_task(task)
+    storage.save_task(task, patch=True)
 
     return task
 
 
-def show_task(task_id: int) -> Task:
+def show_task(task_id: int, storage: TaskStorage | None = None, *, archived: bool = True) -> Task:
     """
     Retrieve a task by ID.
 
@@ -165,6 +269,11 @@ def show_task(task_id: int) -> Task:
     ----------
     task_id : int
         The ID of the task to retrieve
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+    archived : bool, optional
+        Include archived tasks, by default True. Pass False before changing
+        the task, to fail early for a task that is only archived.
 
     Returns
     -------
@@ -175,8 +284,13 @@ def show_task(task_id: int) -> Task:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If ``archived`` is False and the task only exists in an archive bundle
     """
-    storage = TaskStorage()
+    storage = storage or TaskStorage()
+    if not archived:
+        return _load_task_to_change(task_id, storage)
+
     task = storage.load_task(task_id)
 
     if task is None:
@@ -186,10 +300,15 @@ def show_task(task_id: int) -> Task:
     return task
 
 
-def list_milestones() -> list[Task]:
+def list_milestones(storage: TaskStorage | None = None) -> list[Task]:
     """
     List all tasks that belong to milestones.
 
+    Parameters
+    ----------
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
     Returns
     -------
     list[Task]
@@ -201,7 +320,7 @@ def list_milestones() -> list[Task]:
     TaskNotFoundError
         If no tasks exist in the system
     """
-    storage = TaskStorage()
+    storage = storage or TaskStorage()
     tasks = storage.load_all_tasks()
 
     if not tasks:
@@ -211,7 +330,43 @@ def list_milestones() -> list[Task]:
     return [t for t in tasks if t.milestone is not None]
 
 
-def move_task(task_id: int, to_milestone: str) -> tuple[str, str, str]:
+def milestone_counts(storage: TaskStorage | None = None) -> dict[str, dict[TaskStatus, int]]:
+    """
+    Count the tasks of every milestone per status without loading them.
+
+    The counts are read from the rollup counters maintained by the storage,
+    see `TaskStorage.rollups`.
+
+    Parameters
+    ----------
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    dict[str, dict[TaskStatus, int]]
+        The number of tasks in each status by milestone name, ordered by
+        name. May be empty if no tasks have milestones. Archived tasks are
+        not counted.
+
+    Raises
+    ------
+    TaskNotFoundError
+        If no tasks exist in the system
+    """
+    storage = storage or TaskStorage()
+    counts = storage.rollups().status_counts()
+
+    if not counts:
+        msg = "No tasks found"
+        raise TaskNotFoundError(msg)
+
+    return {milestone: count for milestone, count in counts.items() if milestone is not None}
+
+
+def move_task(
+    task_id: int, to_milestone: str, storage: TaskStorage | None = None
+) -> tuple[str, str, str]:
     """
     Move a task to a different milestone.
 
@@ -221,6 +376,8 @@ def move_task(task_id: int, to_milestone: str) -> tuple[str, str, str]:
         The ID of the task to move
     to_milestone : str
         Target milestone name, or "root" for no milestone
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -232,13 +389,11 @@ def move_task(task_id: int, to_milestone: str) -> tuple[str, str, str]:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    task = _load_task_to_change(task_id, storage)
 
     old_milestone = task.milestone or "root"
     target_milestone = None if to_milestone == "root" else to_milestone
@@ -249,7 +404,9 @@ def move_task(task_id: int, to_milestone: str) -> tuple[str, str, str]:
     return old_milestone, new_milestone, str(new_path)
 
 
-def get_task_markdown(task_id: int) -> str:
+def get_task_markdown(
+    task_id: int, storage: TaskStorage | None = None, *, archived: bool = True
+) -> str:
     """
     Get the markdown representation of a task for editing.
 
@@ -257,6 +414,11 @@ def get_task_markdown(task_id: int) -> str:
     ----------
     task_id : int
         The ID of the task to retrieve
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+    archived : bool, optional
+        Include archived tasks, by default True. Pass False before changing
+        the task, to fail early for a task that is only archived.
 
     Returns
     -------
@@ -267,8 +429,13 @@ def get_task_markdown(task_id: int) -> str:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If ``archived`` is False and the task only exists in an archive bundle
     """
-    storage = TaskStorage()
+    storage = storage or TaskStorage()
+    if not archived:
+        return _load_task_to_change(task_id, storage).to_markdown()
+
     task = storage.load_task(task_id)
 
     if task is None:
@@ -278,7 +445,9 @@ def get_task_markdown(task_id: int) -> str:
     return task.to_markdown()
 
 
-def update_task_from_markdown(task_id: int, markdown_content: str) -> Task:
+def update_task_from_markdown(
+    task_id: int, markdown_content: str, storage: TaskStorage | None = None
+) -> Task:
     """
     Update a task from its markdown representation.
 
@@ -288,6 +457,8 @@ def update_task_from_markdown(task_id: int, markdown_content: str) -> Task:
         The ID of the task to update
     markdown_content : str
         The new markdown content for the task
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -298,15 +469,13 @@ def update_task_from_markdown(task_id: int, markdown_content: str) -> Task:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     ValueError
         If the markdown content is invalid or malformed
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    _load_task_to_change(task_id, storage)
 
     updated_task = Task.from_markdown(markdown_content, task_id, "edited")
     storage.save_task(updated_task)
@@ -318,6 +487,7 @@ def update_task(
     task_id: int,
     title: str | None = None,
     description: str | None = None,
+    storage: TaskStorage | None = None,
 ) -> Task:
     """
     Update specific fields of a task.
@@ -330,6 +500,8 @@ def update_task(
         New title for the task, by default None
     description : str | None, optional
         New description for the task, by default None
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -340,13 +512,11 @@ def update_task(
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    task = _load_task_to_change(task_id, storage)
 
     if title is not None:
         task.title = title
@@ -359,7 +529,7 @@ def update_task(
     return task
 
 
-def delete_task(task_id: int) -> tuple[Task, Path]:
+def delete_task(task_id: int, storage: TaskStorage | None = None) -> tuple[Task, Path]:
     """
     Delete a task by ID.
 
@@ -367,6 +537,8 @@ def delete_task(task_id: int) -> tuple[Task, Path]:
     ----------
     task_id : int
         The ID of the task to delete
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
 
     Returns
     -------
@@ -377,13 +549,11 @@ def delete_task(task_id: int) -> tuple[Task, Path]:
     ------
     TaskNotFoundError
         If task with the specified ID does not exist
+    TaskArchivedError
+        If the task only exists in an archive bundle
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
-        msg = f"Task #{task_id} not found"
-        raise TaskNotFoundError(msg)
+    storage = storage or TaskStorage()
+    task = _load_task_to_change(task_id, storage)
 
     deleted_path = storage.delete_task(task_id)
 
@@ -392,3 +562,354 @@ def delete_task(task_id: int) -> tuple[Task, Path]:
         raise TaskNotFoundError(msg)
 
     return task, deleted_path
+
+
+def check_tasks(storage: TaskStorage | None = None) -> CheckReport:
+    """
+    Check the task tree for inconsistencies.
+
+    Parameters
+    ----------
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    CheckReport
+        The number of task files checked and the issues found, such as
+        unparsable files, duplicate IDs, or milestone/directory mismatches.
+    """
+    storage = storage or TaskStorage()
+
+    return storage.check()
+
+
+def create_snapshot(name: str | None = None, storage: TaskStorage | None = None) -> tuple[str, int]:
+    """
+    Snapshot the task tree.
+
+    Parameters
+    ----------
+    name : str | None, optional
+        Snapshot name, by default the current UTC timestamp
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    tuple[str, int]
+        A tuple of (name, file_count) for the created snapshot
+
+    Raises
+    ------
+    SnapshotExistsError
+        If a snapshot with the same name already exists
+    ValueError
+        If the name is not a valid snapshot name
+    """
+    storage = storage or TaskStorage()
+
+    return storage.create_snapshot(name)
+
+
+def restore_snapshot(name: str, storage: TaskStorage | None = None) -> int:
+    """
+    Replace the task tree with a snapshot.
+
+    Parameters
+    ----------
+    name : str
+        The name of the snapshot to restore
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    int
+        The number of files restored
+
+    Raises
+    ------
+    SnapshotNotFoundError
+        If no snapshot with that name exists
+    """
+    storage = storage or TaskStorage()
+
+    return storage.restore_snapshot(name)
+
+
+def list_snapshots(storage: TaskStorage | None = None) -> list[str]:
+    """
+    List the names of existing snapshots.
+
+    Parameters
+    ----------
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    list[str]
+        Snapshot names sorted alphabetically. May be empty.
+    """
+    storage = storage or TaskStorage()
+
+    return storage.list_snapshots()
+
+
+def export_tasks(
+    output: TextIO,
+    fmt: str = "ndjson",
+    milestone: str | None = None,
+    storage: TaskStorage | None = None,
+) -> int:
+    """
+    Stream tasks to a text stream as they are parsed.
+
+    Parameters
+    ----------
+    output : TextIO
+        The stream to write to
+    fmt : str, optional
+        Either "ndjson" or "csv", by default "ndjson"
+    milestone : str | None, optional
+        Only export tasks of this milestone, by default None
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    int
+        The number of tasks exported
+    """
+    storage = storage or TaskStorage()
+
+    return exchange.write_tasks(storage.iter_tasks(milestone=milestone), output, fmt)
+
+
+def import_tasks(
+    source: TextIO,
+    fmt: str = "ndjson",
+    storage: TaskStorage | None = None,
+) -> int:
+    """
+    Create tasks from a stream of NDJSON or CSV records.
+
+    Records are consumed as a stream and written in batches, so memory use
+    does not grow with the size of the input. Every imported task gets a new
+    ID; IDs are allocated in one block after the highest existing ID.
+
+    Parameters
+    ----------
+    source : TextIO
+        The stream to read records from
+    fmt : str, optional
+        Either "ndjson" or "csv", by default "ndjson"
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    int
+        The number of tasks imported
+
+    Raises
+    ------
+    ValueError
+        If a record is malformed. Batches before the invalid record are kept.
+    """
+    storage = storage or TaskStorage()
+
+    count = 0
+
+    with storage.batch(sync=False):
+        next_id = storage.get_next_id()
+
+        for batch in batched(exchange.read_records(source, fmt), IMPORT_BATCH_SIZE):
+            tasks = []
+            for record in batch:
+                try:
+                    tasks.append(Task.from_dict(record, task_id=next_id))
+                except (TypeError, ValueError) as e:
+                    msg = f"Invalid record #{count + len(tasks) + 1}: {e}"
+                    raise ValueError(msg) from e
+                next_id += 1
+
+            storage.save_tasks(tasks)
+            count += len(tasks)
+
+    return count
+
+
+def archive_milestone(milestone: str, storage: TaskStorage | None = None) -> tuple[int, Path]:
+    """
+    Pack a milestone's tasks into a compressed archive.
+
+    Archived tasks no longer appear in the full task list or in milestone
+    summaries, but can still be shown by ID and listed with their milestone.
+
+    Parameters
+    ----------
+    milestone : str
+        The milestone to archive
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    tuple[int, Path]
+        A tuple of (task_count, archive_path)
+
+    Raises
+    ------
+    MilestoneNotFoundError
+        If the milestone has no tasks to archive
+    """
+    storage = storage or TaskStorage()
+
+    path, count = storage.archive_milestone(milestone)
+
+    return count, path
+
+
+def unarchive_milestone(milestone: str, storage: TaskStorage | None = None) -> int:
+    """
+    Unpack an archived milestone back into its directory.
+
+    Parameters
+    ----------
+    milestone : str
+        The milestone to unpack
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    int
+        The number of tasks restored
+
+    Raises
+    ------
+    MilestoneNotFoundError
+        If the milestone is not archived
+    """
+    storage = storage or TaskStorage()
+
+    return storage.unarchive_milestone(milestone)
+
+
+def sync_tasks(
+    target: Path,
+    dry_run: bool = False,  # noqa: FBT001, FBT002
+    storage: TaskStorage | None = None,
+) -> SyncReport:
+    """
+    Synchronize tasks in both directions with another tasks directory.
+
+    Parameters
+    ----------
+    target : Path
+        The tasks directory to synchronize with
+    dry_run : bool, optional
+        Report the changes without applying them, by default False
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    SyncReport
+        The changes pushed to and pulled from ``target``, and the conflicting files
+
+    Raises
+    ------
+    FileNotFoundError
+        If either tasks directory does not exist
+    """
+    storage = storage or TaskStorage()
+
+    for path in (storage.base_path, target):
+        if not path.is_dir():
+            msg = f"Tasks directory not found: {path}"
+            raise FileNotFoundError(2, msg, str(path))
+
+    return storage.sync(TaskStorage(target), dry_run=dry_run)
+
+
+def task_stats(
+    milestone: str | None = None,
+    weeks: int = 8,
+    bins: int = 10,
+    storage: TaskStorage | None = None,
+) -> "TaskStats":
+    """
+    Compute lead time, weekly throughput and aging statistics.
+
+    Parameters
+    ----------
+    milestone : str | None, optional
+        Only include tasks of this milestone, archived ones included, by default None
+    weeks : int, optional
+        Number of weeks of throughput to report, by default 8
+    bins : int, optional
+        Number of histogram bins per distribution, by default 10
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    TaskStats
+        The statistics as of now
+
+    Raises
+    ------
+    ValueError
+        If ``weeks`` or ``bins`` is not positive
+    """
+    if weeks < 1 or bins < 1:
+        msg = "weeks and bins must be positive"
+        raise ValueError(msg)
+
+    # Imported here as it loads numpy, which only this command needs.
+    from quadro.stats import compute_stats  # noqa: PLC0415
+
+    storage = storage or TaskStorage()
+
+    return compute_stats(
+        storage.load_table(milestone=milestone), datetime.now(UTC), weeks=weeks, bins=bins
+    )
+
+
+def milestone_burndown(milestone: str, storage: TaskStorage | None = None) -> list[BurndownPoint]:
+    """
+    Get the daily scope and completed count of a milestone up to today.
+
+    The series is read from the rollup counters maintained by the storage,
+    so its cost does not depend on the number of tasks.
+
+    Parameters
+    ----------
+    milestone : str
+        The milestone name
+    storage : TaskStorage | None, optional
+        Storage to operate on, by default a new TaskStorage for ``tasks/``
+
+    Returns
+    -------
+    list[BurndownPoint]
+        One point per day from the creation of the milestone's first task,
+        archived tasks included
+
+    Raises
+    ------
+    MilestoneNotFoundError
+        If the milestone has no tasks
+    """
+    storage = storage or TaskStorage()
+
+    points = storage.rollups().burndown(milestone, until=datetime.now(UTC).date())
+
+    if not points:
+        msg = f"Milestone '{milestone}' has no tasks"
+        raise MilestoneNotFoundError(msg)
+
+    return points
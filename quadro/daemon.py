@@ -0,0 +1,136 @@
+import json
+import os
+import socketserver
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Any
+from typing import cast
+
+from quadro.cli import run_command
+from quadro.client import FORWARDED_ENV
+from quadro.client import daemon_running
+from quadro.client import forwardable
+from quadro.client import socket_path
+from quadro.storage import TaskStorage
+
+
+class _ClientStream(StringIO):
+    """Captured output that reports whether the client writes to a terminal."""
+
+    def __init__(self, tty: bool) -> None:  # noqa: FBT001
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+@contextmanager
+def _client_environ(environ: dict[str, str]) -> Iterator[None]:
+    saved = {key: os.environ.get(key) for key in FORWARDED_ENV}
+    for key in FORWARDED_ENV:
+        if key in environ:
+            os.environ[key] = environ[key]
+        else:
+            os.environ.pop(key, None)
+
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class TaskDaemon(socketserver.UnixStreamServer):
+    """
+    Runs forwarded ``quadro`` command lines against one long-lived storage.
+
+    The storage keeps parsed tasks, file hashes and rollup counters in
+    memory between commands, so a command only reads the files that
+    changed since the previous one. Requests are served one at a time:
+    commands write to the process-wide ``sys.stdout``, which is redirected
+    to the client's response while each one runs.
+
+    Notes
+    -----
+    A request is a single JSON line, either ``{"args": [...], "tty": bool,
+    "env": {...}}`` to run a command line, or ``{"stop": true}``. The
+    response is a single JSON line with the command's ``stdout``,
+    ``stderr`` and exit ``code``.
+    """
+
+    def __init__(self, storage: TaskStorage | None = None) -> None:
+        """
+        Listen on the socket of ``storage``'s tasks directory.
+
+        Raises
+        ------
+        FileExistsError
+            If a daemon is already listening on the socket.
+        """
+        self.storage = storage or TaskStorage()
+        path = socket_path(self.storage.base_path)
+
+        if path.exists():
+            # A socket left behind by a daemon that did not exit cleanly is
+            # replaced, one that still answers is not.
+            if daemon_running(self.storage.base_path):
+                msg = f"Daemon already running on {path}"
+                raise FileExistsError(msg)
+            path.unlink()
+
+        self.storage.make_state_dir()
+        super().__init__(str(path), DaemonRequestHandler)
+        path.chmod(0o600)
+
+        # Warm the caches the forwarded commands read from.
+        self.storage.rollups()
+        self.storage.load_all_tasks()
+
+    def server_close(self) -> None:
+        super().server_close()
+        socket_path(self.storage.base_path).unlink(missing_ok=True)
+
+    def run(self, args: list[str], tty: bool, environ: dict[str, str]) -> dict[str, Any]:  # noqa: FBT001
+        """Run a command line with captured output and return the response."""
+        if not forwardable(args):
+            return {"stdout": "", "stderr": f"✗ Cannot run in the daemon: {args}\n", "code": 2}
+
+        stdout = _ClientStream(tty)
+        stderr = _ClientStream(tty)
+
+        with _client_environ(environ), redirect_stdout(stdout), redirect_stderr(stderr):
+            code = run_command(args, self.storage, pager=False)
+
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "code": code}
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    @property
+    def daemon(self) -> TaskDaemon:
+        return cast("TaskDaemon", self.server)
+
+    def handle(self) -> None:
+        try:
+            message = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        if message.get("stop"):
+            response: dict[str, Any] = {}
+            # shutdown() waits for the serving loop, which is busy with this
+            # request, so it has to be called from another thread.
+            threading.Thread(target=self.daemon.shutdown, daemon=True).start()
+        else:
+            response = self.daemon.run(
+                message.get("args", []), bool(message.get("tty")), message.get("env", {})
+            )
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
@@ -6,9 +6,25 @@ class TaskNotFoundError(TaskError):
     """Raised when a task with the specified ID cannot be found."""
 
 
+class TaskArchivedError(TaskNotFoundError):
+    """Raised when attempting to modify a task that only exists in an archive bundle."""
+
+
 class TaskAlreadyInProgressError(TaskError):
     """Raised when attempting to start a task that is already in progress."""
 
 
 class TaskAlreadyDoneError(TaskError):
     """Raised when attempting to modify a task that is already completed."""
+
+
+class MilestoneNotFoundError(TaskError):
+    """Raised when a milestone has no tasks or no archive to operate on."""
+
+
+class SnapshotNotFoundError(TaskError):
+    """Raised when a snapshot with the specified name cannot be found."""
+
+
+class SnapshotExistsError(TaskError):
+    """Raised when creating a snapshot whose name is already taken."""
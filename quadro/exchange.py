@@ -0,0 +1,197 @@
+import csv
+import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import TextIO
+
+from quadro.models import Task
+from quadro.table import TaskRow
+from quadro.table import TaskTable
+
+
+FORMATS = ("ndjson", "csv")
+FIELDS = ["id", "title", "description", "status", "milestone", "created", "completed"]
+LIST_FORMATS = ("table", "plain", "tsv", "json")
+TABLE_LIST_FORMATS = ("plain", "tsv")
+TSV_COLUMNS = ("id", "status", "milestone", "title")
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        msg = f"Unsupported format: {fmt}"
+        raise ValueError(msg)
+
+
+def write_tasks(tasks: Iterable[Task], output: TextIO, fmt: str = "ndjson") -> int:
+    """
+    Write tasks to a text stream, one record per task.
+
+    Records are written as they are produced, so a lazy iterable such as
+    `TaskStorage.iter_tasks` is exported without holding the backlog in memory.
+
+    Parameters
+    ----------
+    tasks : Iterable[Task]
+        The tasks to write.
+    output : TextIO
+        The stream to write to.
+    fmt : str, optional
+        Either ``"ndjson"`` (one JSON object per line) or ``"csv"`` (with a
+        header row), by default ``"ndjson"``.
+
+    Returns
+    -------
+    int
+        The number of tasks written.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+    """
+    _check_format(fmt)
+    count = 0
+
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow(task.to_dict())
+            count += 1
+        return count
+
+    for task in tasks:
+        output.write(json.dumps(task.to_dict(), ensure_ascii=False) + "\n")
+        count += 1
+
+    return count
+
+
+def read_records(source: TextIO, fmt: str = "ndjson") -> Iterator[dict[str, Any]]:
+    """
+    Read task records from a text stream, one at a time.
+
+    Parameters
+    ----------
+    source : TextIO
+        The stream to read from.
+    fmt : str, optional
+        Either ``"ndjson"`` or ``"csv"``, by default ``"ndjson"``. Blank NDJSON
+        lines are skipped.
+
+    Yields
+    ------
+    dict[str, Any]
+        The next record, suitable for `Task.from_dict`.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported or an NDJSON line is not a JSON object.
+    """
+    _check_format(fmt)
+
+    if fmt == "csv":
+        yield from csv.DictReader(source)
+        return
+
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            msg = f"Invalid JSON on line {line_number}: {e.msg}"
+            raise ValueError(msg) from e
+
+        if not isinstance(record, dict):
+            msg = f"Expected a JSON object on line {line_number}"
+            raise ValueError(msg)  # noqa: TRY004
+
+        yield record
+
+
+def _plain_lines(rows: Iterable[tuple[str, Task | TaskRow]]) -> Iterator[str]:
+    for task_id, task in rows:
+        yield f"{task_id} {task.status.value} {task.milestone or '-'} {task.title}\n"
+
+
+def _tsv_lines(rows: Iterable[tuple[str, Task | TaskRow]]) -> Iterator[str]:
+    yield "\t".join(TSV_COLUMNS) + "\n"
+    for task_id, task in rows:
+        fields = (task_id, task.status.value, task.milestone or "", task.title)
+        yield "\t".join(field.translate(TSV_ESCAPES) for field in fields) + "\n"
+
+
+def _json_lines(rows: Iterable[tuple[str, Task]]) -> Iterator[str]:
+    separator = "[\n"
+    for task_id, task in rows:
+        record = task.to_dict()
+        if task_id != str(task.id):
+            record["id"] = task_id
+        yield separator + json.dumps(record, ensure_ascii=False)
+        separator = ",\n"
+    yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
+def write_task_list(rows: Iterable[tuple[str, Task]], output: TextIO, fmt: str) -> None:
+    """
+    Write tasks to a text stream as lines, without rich layout.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple[str, Task]]
+        The tasks with the ID to show for each, which is qualified by the
+        root name for workspace tasks.
+    output : TextIO
+        The stream to write to.
+    fmt : str
+        ``"plain"`` for one ``<id> <status> <milestone> <title>`` line per
+        task (``-`` for no milestone), ``"tsv"`` for tab-separated values
+        with a header row and backslash escapes, or ``"json"`` for an array
+        of task records.
+
+    Raises
+    ------
+    ValueError
+        If the format is not one of the above.
+    """
+    writers = {"plain": _plain_lines, "tsv": _tsv_lines, "json": _json_lines}
+    if fmt not in writers:
+        msg = f"Unsupported format: {fmt}"
+        raise ValueError(msg)
+
+    output.writelines(writers[fmt](rows))
+
+
+def write_task_table(table: TaskTable, output: TextIO, fmt: str) -> None:
+    """
+    Write the rows of a task table to a text stream as lines.
+
+    Rows are materialized one at a time, so a large table is written without
+    building a `Task` per row.
+
+    Parameters
+    ----------
+    table : TaskTable
+        The tasks to write.
+    output : TextIO
+        The stream to write to.
+    fmt : str
+        ``"plain"`` or ``"tsv"``, see `write_task_list`. JSON records hold
+        descriptions, which the table does not keep.
+
+    Raises
+    ------
+    ValueError
+        If the format is not one of the above.
+    """
+    if fmt not in TABLE_LIST_FORMATS:
+        msg = f"Unsupported format: {fmt}"
+        raise ValueError(msg)
+
+    writer = _plain_lines if fmt == "plain" else _tsv_lines
+    output.writelines(writer((str(row.id), row) for row in table.rows()))
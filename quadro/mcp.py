@@ -1,12 +1,20 @@
+import os
+from pathlib import Path
 from typing import Annotated
 
 from fastmcp import FastMCP
 from pydantic import Field
 
-from quadro import command
+from quadro import async_command
+from quadro.exceptions import TaskNotFoundError
 from quadro.models import Task
 from quadro.models import TaskStatus
+from quadro.rollup import BurndownPoint
+from quadro.stats import TaskStats
 from quadro.storage import TaskStorage
+from quadro.workspace import WORKSPACE_ENV
+from quadro.workspace import Workspace
+from quadro.workspace import WorkspaceTask
 
 
 mcp = FastMCP(
@@ -22,6 +30,9 @@ mcp = FastMCP(
     - Move tasks between milestones
     - Delete tasks permanently
     - View milestone summaries
+    - View lead time, weekly throughput and aging statistics
+    - Search tasks by text in their title or description
+    - Query every task directory of a workspace at once
 
     Tasks have three statuses: todo, progress, and done.
     Tasks can be organized into milestones for better project management.
@@ -31,9 +42,77 @@ mcp = FastMCP(
 __version__ = "1.0.1"
 __description__ = "Manage your tasks directly from the terminal using markdown"
 
+WRITE_DELAY_ENV = "QUADRO_WRITE_DELAY"
+
+_storages: dict[Path, TaskStorage] = {}
+_workspaces: dict[Path, Workspace] = {}
+
+
+def get_storage() -> TaskStorage:
+    """
+    Return the storage shared by all tools for the current ``tasks/`` directory.
+
+    Sharing one instance lets buffered writes coalesce across tool calls. Set
+    the ``QUADRO_WRITE_DELAY`` environment variable to a number of seconds to
+    enable write coalescing; it is disabled by default.
+
+    Returns
+    -------
+    TaskStorage
+        The storage for ``tasks/`` resolved against the working directory.
+    """
+    base_path = Path("tasks").resolve()
+    storage = _storages.get(base_path)
+
+    if storage is None:
+        write_delay = os.environ.get(WRITE_DELAY_ENV)
+        storage = TaskStorage(base_path, write_delay=float(write_delay) if write_delay else None)
+        _storages[base_path] = storage
+
+    return storage
+
+
+def get_workspace() -> Workspace:
+    """
+    Return the workspace shared by all tools, read from ``QUADRO_WORKSPACE``.
+
+    The workspace keeps each root's tasks cached between tool calls until
+    the root's files change.
+
+    Returns
+    -------
+    Workspace
+        The workspace loaded from the file named by ``QUADRO_WORKSPACE``.
+
+    Raises
+    ------
+    ValueError
+        If ``QUADRO_WORKSPACE`` is not set.
+    """
+    workspace_file = os.environ.get(WORKSPACE_ENV)
+
+    if not workspace_file:
+        msg = f"Set {WORKSPACE_ENV} to a workspace file to query multiple task directories"
+        raise ValueError(msg)
+
+    path = Path(workspace_file).resolve()
+    workspace = _workspaces.get(path)
+
+    if workspace is None:
+        workspace = Workspace.from_file(path)
+        _workspaces[path] = workspace
+
+    return workspace
+
+
+def flush_storages() -> None:
+    """Write any buffered changes of every shared storage to disk."""
+    for storage in _storages.values():
+        storage.flush()
+
 
 @mcp.tool(description="List tasks with optional milestone and status filters")
-def list_tasks(
+async def list_tasks(
     milestone: Annotated[
         str | None,
         Field(description="Filter by milestone name (case-sensitive)"),
@@ -56,11 +135,13 @@ def list_tasks(
         List of Task objects.
     """
     statuses = [status] if status is not None else None
-    return command.list_tasks(milestone=milestone, statuses=statuses)
+    return await async_command.list_tasks(
+        milestone=milestone, statuses=statuses, storage=get_storage()
+    )
 
 
 @mcp.tool(description="Get a specific task by ID")
-def get_task(
+async def get_task(
     task_id: Annotated[int, Field(description="The ID of the task to retrieve")],
 ) -> Task:
     """
@@ -81,11 +162,11 @@ def get_task(
     TaskNotFoundError
         If task with the specified ID does not exist.
     """
-    return command.show_task(task_id)
+    return await async_command.show_task(task_id, storage=get_storage())
 
 
 @mcp.tool(description="Create a new task with title, description, and optional milestone")
-def create_task(
+async def create_task(
     title: Annotated[str, Field(description="The title of the task")],
     description: Annotated[str, Field(description="The description of the task")] = "",
     milestone: Annotated[
@@ -110,11 +191,13 @@ def create_task(
     Task
         The newly created Task object.
     """
-    return command.add_task(title=title, description=description, milestone=milestone)
+    return await async_command.add_task(
+        title=title, description=description, milestone=milestone, storage=get_storage()
+    )
 
 
 @mcp.tool(description="Start a task by changing its status to in progress")
-def start_task(
+async def start_task(
     task_id: Annotated[int, Field(description="The ID of the task to start")],
 ) -> Task:
     """
@@ -139,11 +222,11 @@ def start_task(
     TaskAlreadyDoneError
         If task is already completed.
     """
-    return command.start_task(task_id)
+    return await async_command.start_task(task_id, storage=get_storage())
 
 
 @mcp.tool(description="Mark a task as completed")
-def complete_task(
+async def complete_task(
     task_id: Annotated[int, Field(description="The ID of the task to complete")],
 ) -> Task:
     """
@@ -166,11 +249,11 @@ def complete_task(
     TaskAlreadyDoneError
         If task is already completed.
     """
-    return command.complete_task(task_id)
+    return await async_command.complete_task(task_id, storage=get_storage())
 
 
 @mcp.tool(description="Move a task to a different milestone")
-def move_task(
+async def move_task(
     task_id: Annotated[int, Field(description="The ID of the task to move")],
     to_milestone: Annotated[
         str,
@@ -197,12 +280,12 @@ def move_task(
     TaskNotFoundError
         If task with the specified ID does not exist.
     """
-    command.move_task(task_id, to_milestone)
-    return command.show_task(task_id)
+    await async_command.move_task(task_id, to_milestone, storage=get_storage())
+    return await async_command.show_task(task_id, storage=get_storage())
 
 
 @mcp.tool(description="Update task content (title and description)")
-def update_task(
+async def update_task(
     task_id: Annotated[int, Field(description="The ID of the task to update")],
     title: Annotated[str | None, Field(description="New title for the task")] = None,
     description: Annotated[str | None, Field(description="New description for the task")] = None,
@@ -229,11 +312,13 @@ def update_task(
     TaskNotFoundError
         If task with the specified ID does not exist.
     """
-    return command.update_task(task_id, title=title, description=description)
+    return await async_command.update_task(
+        task_id, title=title, description=description, storage=get_storage()
+    )
 
 
 @mcp.tool(description="Delete a task permanently")
-def delete_task(
+async def delete_task(
     task_id: Annotated[int, Field(description="The ID of the task to delete")],
 ) -> Task:
     """
@@ -254,12 +339,12 @@ def delete_task(
     TaskNotFoundError
         If task with the specified ID does not exist.
     """
-    task, _ = command.delete_task(task_id)
+    task, _ = await async_command.delete_task(task_id, storage=get_storage())
     return task
 
 
 @mcp.tool(description="List all tasks that belong to milestones")
-def list_milestones() -> list[Task]:
+async def list_milestones() -> list[Task]:
     """
     List all tasks that belong to milestones.
 
@@ -274,11 +359,185 @@ def list_milestones() -> list[Task]:
     TaskNotFoundError
         If no tasks exist in the system.
     """
-    return command.list_milestones()
+    return await async_command.list_milestones(storage=get_storage())
+
+
+@mcp.tool(description="Count the tasks of every milestone per status")
+async def get_milestone_counts() -> dict[str, dict[TaskStatus, int]]:
+    """
+    Count the tasks of every milestone per status.
+
+    Returns
+    -------
+    dict[str, dict[TaskStatus, int]]
+        The number of todo, progress and done tasks by milestone name.
+        Archived tasks are not counted.
+
+    Raises
+    ------
+    TaskNotFoundError
+        If no tasks exist in the system.
+    """
+    return await async_command.milestone_counts(storage=get_storage())
+
+
+@mcp.tool(description="Get lead time, weekly throughput and aging statistics")
+async def get_stats(
+    milestone: Annotated[
+        str | None,
+        Field(description="Only include tasks of this milestone (case-sensitive)"),
+    ] = None,
+    weeks: Annotated[int, Field(description="Weeks of throughput to report", ge=1)] = 8,
+) -> TaskStats:
+    """
+    Get lead time, weekly throughput and aging statistics.
+
+    Parameters
+    ----------
+    milestone : str | None
+        Only include tasks of this milestone. If None, includes all tasks.
+    weeks : int
+        Number of weeks of throughput to report, ending with the current week.
+
+    Returns
+    -------
+    TaskStats
+        Lead time in days of completed tasks, completed tasks per week, and
+        the age in days of open tasks per milestone, each with mean,
+        percentiles and a histogram.
+    """
+    return await async_command.task_stats(milestone=milestone, weeks=weeks, storage=get_storage())
+
+
+@mcp.tool(description="Get the daily scope and completed count of a milestone")
+async def get_burndown(
+    milestone: Annotated[str, Field(description="The milestone name (case-sensitive)")],
+) -> list[BurndownPoint]:
+    """
+    Get the daily scope and completed count of a milestone.
+
+    Parameters
+    ----------
+    milestone : str
+        The milestone name.
+
+    Returns
+    -------
+    list[BurndownPoint]
+        One point per day from the creation of the milestone's first task up
+        to today, with the number of tasks created and completed so far.
+    """
+    return await async_command.milestone_burndown(milestone, storage=get_storage())
+
+
+@mcp.tool(description="Find tasks whose title or description contains the given text")
+async def search_tasks(
+    query: Annotated[str, Field(description="Text to look for (case-insensitive)")],
+    milestone: Annotated[
+        str | None,
+        Field(description="Filter by milestone name (case-sensitive)"),
+    ] = None,
+    status: Annotated[TaskStatus | None, Field(description="Filter by status")] = None,
+) -> list[Task]:
+    """
+    Find tasks whose title or description contains the given text.
+
+    Parameters
+    ----------
+    query : str
+        Text to look for, matched case-insensitively.
+    milestone : str | None
+        Filter tasks by milestone name. If None, searches tasks from all milestones.
+    status : TaskStatus | None
+        Filter tasks by status. If None, searches tasks with any status.
+
+    Returns
+    -------
+    list[Task]
+        The matching tasks sorted by ID.
+    """
+    statuses = [status] if status is not None else None
+    return await async_command.search_tasks(
+        query, milestone=milestone, statuses=statuses, storage=get_storage()
+    )
+
+
+@mcp.tool(description="List tasks of every task directory in the configured workspace")
+async def list_workspace_tasks(
+    milestone: Annotated[
+        str | None,
+        Field(description="Filter by milestone name (case-sensitive)"),
+    ] = None,
+    status: Annotated[TaskStatus | None, Field(description="Filter by status")] = None,
+) -> list[WorkspaceTask]:
+    """
+    List tasks of every root in the ``QUADRO_WORKSPACE`` workspace.
+
+    Parameters
+    ----------
+    milestone : str | None
+        Filter tasks by milestone name. If None, returns tasks from all milestones.
+    status : TaskStatus | None
+        Filter tasks by status. If None, returns tasks with any status.
+
+    Returns
+    -------
+    list[WorkspaceTask]
+        The tasks with their root and root-qualified ID, such as ``api:12``.
+    """
+    statuses = [status] if status is not None else None
+    return await async_command.run_in_executor(
+        get_workspace().list_tasks, milestone=milestone, statuses=statuses
+    )
+
+
+@mcp.tool(description="Search tasks of every task directory in the configured workspace")
+async def search_workspace_tasks(
+    query: Annotated[str, Field(description="Text to look for (case-insensitive)")],
+    milestone: Annotated[
+        str | None,
+        Field(description="Filter by milestone name (case-sensitive)"),
+    ] = None,
+    status: Annotated[TaskStatus | None, Field(description="Filter by status")] = None,
+) -> list[WorkspaceTask]:
+    """
+    Search tasks of every root in the ``QUADRO_WORKSPACE`` workspace.
+
+    Parameters
+    ----------
+    query : str
+        Text to look for in titles and descriptions, matched case-insensitively.
+    milestone : str | None
+        Filter tasks by milestone name. If None, searches tasks from all milestones.
+    status : TaskStatus | None
+        Filter tasks by status. If None, searches tasks with any status.
+
+    Returns
+    -------
+    list[WorkspaceTask]
+        The matching tasks with their root and root-qualified ID.
+    """
+    statuses = [status] if status is not None else None
+    return await async_command.run_in_executor(
+        get_workspace().search, query, milestone=milestone, statuses=statuses
+    )
+
+
+@mcp.tool(description="List milestone tasks of every task directory in the configured workspace")
+async def list_workspace_milestones() -> list[WorkspaceTask]:
+    """
+    List the milestone tasks of every root in the ``QUADRO_WORKSPACE`` workspace.
+
+    Returns
+    -------
+    list[WorkspaceTask]
+        Tasks that have a milestone assigned, with their root and root-qualified ID.
+    """
+    return await async_command.run_in_executor(get_workspace().list_milestones)
 
 
 @mcp.resource("quadro://task/{task_id}")
-def get_task_resource(task_id: int) -> str:
+async def get_task_resource(task_id: int) -> str:
     """
     Get the full markdown content of a task.
 
@@ -297,15 +556,15 @@ def get_task_resource(task_id: int) -> str:
     TaskNotFoundError
         If task with the specified ID does not exist.
     """
-    storage = TaskStorage()
-    task = storage.load_task(task_id)
-
-    if task is None:
+    try:
+        return await async_command.get_task_markdown(task_id, storage=get_storage())
+    except TaskNotFoundError as e:
         msg = f"Task {task_id} not found"
-        raise ValueError(msg)
-
-    return task.to_markdown()
+        raise ValueError(msg) from e
 
 
 if __name__ == "__main__":
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        flush_storages()
@@ -1,10 +1,59 @@
+import re
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 
-import frontmatter
+
+if TYPE_CHECKING:
+    from frontmatter.default_handlers import YAMLHandler
+
+
+# Output of `datetime.isoformat`, which YAML would read back as a timestamp
+# and therefore quotes when it is dumped as a string.
+_QUOTED_TIMESTAMP = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d{6})?([+-]\d\d:\d\d)?")
+
+
+@lru_cache(maxsize=1)
+def _yaml_handler() -> "YAMLHandler":
+    # frontmatter pulls in YAML, which is slow to import, so it is only
+    # imported once a task is actually parsed or serialized.
+    from frontmatter.default_handlers import YAMLHandler  # noqa: PLC0415
+
+    return YAMLHandler()
+
+
+def _yaml_line(key: str, value: object) -> str:
+    return _yaml_handler().export({key: value})
+
+
+@lru_cache(maxsize=1024)
+def _milestone_line(milestone: str) -> str:
+    return _yaml_line("milestone", milestone)
+
+
+def _timestamp_line(key: str, value: datetime) -> str:
+    text = value.isoformat()
+    if _QUOTED_TIMESTAMP.fullmatch(text):
+        return f"{key}: '{text}'"
+    return _yaml_line(key, text)
+
+
+def _parse_datetime(value: Any) -> datetime | None:  # noqa: ANN401
+    if not value:
+        return None
+
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+
+    return parsed
 
 
 class TaskStatus(str, Enum):
@@ -13,8 +62,27 @@ class TaskStatus(str, Enum):
     DONE = "done"
 
 
-@dataclass
+def _check_completed(status: TaskStatus, completed: datetime | None) -> datetime | None:
+    if status == TaskStatus.DONE and completed is None:
+        return datetime.now(UTC)
+    if status != TaskStatus.DONE and completed is not None:
+        msg = "Only completed tasks can have a 'completed' timestamp"
+        raise ValueError(msg)
+
+    return completed
+
+
+@dataclass(slots=True)
 class Task:
+    """
+    A task with its metadata.
+
+    Tasks are slotted, so they hold no per-instance ``__dict__``. Tasks
+    parsed from files are built with `_trusted`, which checks the status
+    and completion timestamp while parsing instead of in
+    ``__post_init__``, and share one interned string per milestone name.
+    """
+
     id: int
     title: str
     description: str
@@ -24,14 +92,34 @@ class Task:
     completed: datetime | None = None
 
     def __post_init__(self) -> None:
-        if self.status == TaskStatus.DONE and self.completed is None:
-            self.completed = datetime.now(UTC)
-        elif self.status != TaskStatus.DONE and self.completed is not None:
-            msg = "Only completed tasks can have a 'completed' timestamp"
-            raise ValueError(msg)
+        self.completed = _check_completed(self.status, self.completed)
+
+    @classmethod
+    def _trusted(  # noqa: PLR0913
+        cls,
+        task_id: int,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        milestone: str | None,
+        created: datetime,
+        completed: datetime | None,
+    ) -> "Task":
+        """Build a task from fields that already satisfy ``__post_init__``."""
+        task = object.__new__(cls)
+        task.id = task_id
+        task.title = title
+        task.description = description
+        task.status = status
+        task.milestone = milestone
+        task.created = created
+        task.completed = completed
+        return task
 
     @classmethod
     def from_markdown(cls, content: str, task_id: int, file_path: str | Path) -> "Task":
+        import frontmatter  # noqa: PLC0415
+
         doc = frontmatter.loads(content)
 
         if "status" not in doc.metadata:
@@ -42,26 +130,16 @@ class Task:
             raise ValueError(msg)
 
         milestone = doc.get("milestone")
+        if isinstance(milestone, str):
+            milestone = sys.intern(milestone)
+
         status = TaskStatus(doc["status"])
-        created_raw = doc["created"]
-        created = (
-            created_raw
-            if isinstance(created_raw, datetime)
-            else datetime.fromisoformat(created_raw)
-        )
-        if created.tzinfo is None:
-            created = created.replace(tzinfo=UTC)
-
-        completed_raw = doc.get("completed")
-        completed = (
-            completed_raw
-            if isinstance(completed_raw, datetime)
-            else datetime.fromisoformat(completed_raw)
-            if completed_raw
-            else None
-        )
-        if completed and completed.tzinfo is None:
-            completed = completed.replace(tzinfo=UTC)
+        created = _parse_datetime(doc["created"])
+        if created is None:
+            msg = f"Missing 'created' in frontmatter: {file_path}"
+            raise ValueError(msg)
+
+        completed = _check_completed(status, _parse_datetime(doc.get("completed")))
 
         lines = doc.content.strip().split("\n")
         title = ""
@@ -81,32 +159,87 @@ class Task:
 
         description = "\n".join(description_lines).strip()
 
+        return cls._trusted(task_id, title, description, status, milestone, created, completed)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], task_id: int | None = None) -> "Task":
+        """
+        Build a task from a flat record, as produced by `to_dict`.
+
+        Empty values are treated as missing. ``status`` defaults to todo and
+        ``created`` to the current time.
+
+        Parameters
+        ----------
+        data : Mapping[str, Any]
+            The record with ``title`` and optional ``id``, ``description``,
+            ``status``, ``milestone``, ``created`` and ``completed`` fields.
+        task_id : int | None, optional
+            ID to assign, overriding ``data["id"]``, by default None.
+
+        Returns
+        -------
+        Task
+            The task built from the record.
+
+        Raises
+        ------
+        ValueError
+            If the title or ID is missing, or a field has an invalid value.
+        """
+        if not data.get("title"):
+            msg = "Missing 'title' in record"
+            raise ValueError(msg)
+
+        if task_id is None:
+            if not data.get("id"):
+                msg = "Missing 'id' in record"
+                raise ValueError(msg)
+            task_id = int(data["id"])
+
         return cls(
             id=task_id,
-            title=title,
-            description=description,
-            status=status,
-            milestone=milestone,
-            created=created,
-            completed=completed,
+            title=data["title"],
+            description=data.get("description") or "",
+            status=TaskStatus(data.get("status") or TaskStatus.TODO),
+            milestone=data.get("milestone") or None,
+            created=_parse_datetime(data.get("created")) or datetime.now(UTC),
+            completed=_parse_datetime(data.get("completed")),
         )
 
-    def to_markdown(self) -> str:
-        metadata = {
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
             "status": self.status.value,
+            "milestone": self.milestone,
             "created": self.created.isoformat(),
+            "completed": self.completed.isoformat() if self.completed else None,
         }
 
-        if self.milestone is not None:
-            metadata["milestone"] = self.milestone
+    def to_markdown(self) -> str:
+        """
+        Serialize the task as a markdown file with YAML frontmatter.
+
+        The frontmatter is written field by field, in the sorted key order
+        and with the quoting that a YAML dump of the same fields produces.
+        The YAML dumper only runs once per distinct milestone name, whose
+        line is cached, and for timestamps it would not quote.
+        """
+        lines = ["---"]
 
         if self.completed is not None:
-            metadata["completed"] = self.completed.isoformat()
+            lines.append(_timestamp_line("completed", self.completed))
+
+        lines.append(_timestamp_line("created", self.created))
+
+        if self.milestone is not None:
+            lines.append(_milestone_line(self.milestone))
 
-        post = frontmatter.Post(content="", **metadata)
-        frontmatter_str = frontmatter.dumps(post).strip()
+        lines.extend([f"status: {self.status.value}", "---"])
 
-        parts = [frontmatter_str, "", f"# {self.title}"]
+        parts = ["\n".join(lines), "", f"# {self.title}"]
 
         if self.description:
             parts.extend(["", self.description])
@@ -0,0 +1,71 @@
+import os
+import shlex
+import subprocess  # nosec B404
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextlib import suppress
+from typing import TextIO
+from typing import cast
+
+from rich.console import Console
+
+
+PAGER_ENV = "PAGER"
+DEFAULT_PAGER = "less -FRX"
+
+
+class _PagerConsole(Console):
+    def on_broken_pipe(self) -> None:
+        # Rich exits the process by default. Stop printing to the closed
+        # pager instead, leaving the process's own stdout alone.
+        self.quiet = True
+        raise BrokenPipeError
+
+
+@contextmanager
+def pager_console(console: Console) -> Iterator[Console]:
+    """
+    Open a console that writes to a pager as output is printed.
+
+    Unlike ``Console.pager``, which buffers everything and starts the pager
+    at the end, the pager is started first and reads each chunk as soon as it
+    is printed, so the first screen shows while the rest is still rendered.
+    The pager command is taken from ``$PAGER``, by default ``less -FRX``.
+    When the pager cannot be started, ``console`` itself is yielded. Output
+    printed after the user quits the pager is discarded.
+
+    Parameters
+    ----------
+    console : Console
+        The console whose width and colors the pager console copies.
+
+    Yields
+    ------
+    Console
+        The console to print to.
+    """
+    command = shlex.split(os.environ.get(PAGER_ENV) or DEFAULT_PAGER)
+
+    try:
+        # The command is the user's own pager setting, run without a shell.
+        process = subprocess.Popen(  # noqa: S603 # nosec B603
+            command, stdin=subprocess.PIPE, text=True, encoding="utf-8"
+        )
+    except OSError:
+        yield console
+        return
+
+    stdin = cast("TextIO", process.stdin)
+
+    try:
+        with suppress(BrokenPipeError):
+            yield _PagerConsole(
+                file=stdin,
+                width=console.width,
+                force_terminal=console.is_terminal,
+                color_system=console.color_system,  # type: ignore[arg-type]
+            )
+    finally:
+        with suppress(BrokenPipeError):
+            stdin.close()
+        process.wait()
@@ -1,15 +1,41 @@
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from rich.cells import cell_len
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.progress_bar import ProgressBar
+from rich.segment import Segments
 from rich.table import Table
 
+from quadro.cache import MarkdownCache
 from quadro.models import Task
 from quadro.models import TaskStatus
+from quadro.rollup import BurndownPoint
+from quadro.storage import CheckReport
+from quadro.sync import PUSH
+from quadro.sync import SyncReport
+
+
+if TYPE_CHECKING:
+    from quadro.stats import Distribution
+    from quadro.stats import TaskStats
+
+
+STREAM_CHUNK_SIZE = 500
+TASK_COLUMNS = ("Milestone", "ID", "Title", "Status")
+MIN_TITLE_WIDTH = 10
+
+# Shared by every renderer in the process, so long-running sessions reuse
+# descriptions rendered by earlier commands.
+MARKDOWN_CACHE = MarkdownCache()
 
 
 class Renderer:
-    def __init__(self, console: Console | None = None) -> None:
+    def __init__(
+        self, console: Console | None = None, markdown_cache: MarkdownCache | None = None
+    ) -> None:
         self.console = console or Console()
+        self.markdown_cache = markdown_cache or MARKDOWN_CACHE
 
     @staticmethod
     def status_symbol(status: TaskStatus) -> str:
@@ -20,19 +46,20 @@ class Renderer:
         return "○"
 
     def render_task_list(self, tasks: list[Task]) -> None:
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Milestone", style="cyan")
-        table.add_column("ID", style="yellow")
-        table.add_column("Title", style="white")
-        table.add_column("Status", style="green")
-
-        for task in tasks:
-            milestone_display = task.milestone or "-"
-            status_display = f"{self.status_symbol(task.status)} {task.status.value}"
-            table.add_row(milestone_display, str(task.id), task.title, status_display)
+        self.render_task_rows([(str(task.id), task) for task in tasks])
 
-        self.console.print(table)
+    def render_task_rows(
+        self, rows: list[tuple[str, Task]], chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> None:
+        if len(rows) > chunk_size:
+            self._stream_task_table(rows, chunk_size)
+        else:
+            table = self._task_table()
+            for task_id, task in rows:
+                table.add_row(*self._task_cells(task_id, task))
+            self.console.print(table)
 
+        tasks = [task for _, task in rows]
         total = len(tasks)
         done_count = sum(1 for t in tasks if t.status == TaskStatus.DONE)
         progress_count = sum(1 for t in tasks if t.status == TaskStatus.PROGRESS)
@@ -43,6 +70,53 @@ class Renderer:
         )
         self.console.print(f"\n[dim]{summary}[/dim]")
 
+    def _stream_task_table(self, rows: list[tuple[str, Task]], chunk_size: int) -> None:
+        """
+        Print a task table in chunks of rows, without building it all at once.
+
+        Column widths are measured over every row up front, so each chunk is
+        a table with the same fixed widths. The borders between chunks are
+        dropped, which makes the output match a single table while the first
+        rows appear right away.
+        """
+        widths = [cell_len(header) for header in TASK_COLUMNS]
+        for task_id, task in rows:
+            for i, cell in enumerate(self._task_cells(task_id, task)):
+                widths[i] = max(widths[i], cell_len(cell))
+
+        borders = 3 * len(widths) + 1
+        widths[2] = max(
+            MIN_TITLE_WIDTH, min(widths[2], self.console.width - borders - sum(widths) + widths[2])
+        )
+
+        for start in range(0, len(rows), chunk_size):
+            table = self._task_table(widths, show_header=start == 0)
+            for task_id, task in rows[start : start + chunk_size]:
+                table.add_row(*self._task_cells(task_id, task))
+
+            lines = self.console.render_lines(table, pad=False, new_lines=True)
+            if start > 0:
+                lines = lines[1:]
+            if start + chunk_size < len(rows):
+                lines = lines[:-1]
+
+            self.console.print(Segments(chain.from_iterable(lines)), end="")
+
+    @staticmethod
+    def _task_table(widths: list[int] | None = None, *, show_header: bool = True) -> Table:
+        table = Table(show_header=show_header, header_style="bold magenta")
+        styles = ("cyan", "yellow", "white", "green")
+
+        for i, (header, style) in enumerate(zip(TASK_COLUMNS, styles, strict=True)):
+            width = None if widths is None else widths[i]
+            table.add_column(header, style=style, width=width)
+
+        return table
+
+    def _task_cells(self, task_id: str, task: Task) -> tuple[str, str, str, str]:
+        status_display = f"{self.status_symbol(task.status)} {task.status.value}"
+        return task.milestone or "-", task_id, task.title, status_display
+
     def render_task_detail(self, task: Task) -> None:
         self.console.print()
         self.console.print(f"[bold cyan]#{task.id}[/bold cyan]")
@@ -62,19 +136,21 @@ class Renderer:
         self.console.print(f"[bold]{task.title}[/bold]")
 
         self.console.print()
-        self.console.print(Markdown(task.description))
+        rendered = self.markdown_cache.render(self.console, task.description)
+        for page in rendered.pages(self.console.height):
+            self.console.print(Segments(chain.from_iterable(page)), end="")
         self.console.print()
 
     def render_milestones(self, tasks: list[Task]) -> None:
-        milestone_data: dict[str, dict[str, int]] = {}
+        counts: dict[str, dict[TaskStatus, int]] = {}
         for task in tasks:
             milestone_name = task.milestone or "No Milestone"
-            if milestone_name not in milestone_data:
-                milestone_data[milestone_name] = {"total": 0, "done": 0}
-            milestone_data[milestone_name]["total"] += 1
-            if task.status == TaskStatus.DONE:
-                milestone_data[milestone_name]["done"] += 1
+            milestone_counts = counts.setdefault(milestone_name, dict.fromkeys(TaskStatus, 0))
+            milestone_counts[task.status] += 1
+
+        self.render_milestone_counts(counts)
 
+    def render_milestone_counts(self, counts: dict[str, dict[TaskStatus, int]]) -> None:
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Milestone", style="cyan")
         table.add_column("Tasks", style="yellow")
@@ -82,10 +158,9 @@ class Renderer:
         table.add_column("Progress", style="white")
         table.add_column("Completion", style="white")
 
-        for milestone_name in sorted(milestone_data.keys()):
-            data = milestone_data[milestone_name]
-            total = data["total"]
-            done = data["done"]
+        for milestone_name in sorted(counts.keys()):
+            total = sum(counts[milestone_name].values())
+            done = counts[milestone_name].get(TaskStatus.DONE, 0)
             completion_pct = (done / total * 100) if total > 0 else 0
 
             progress_bar = ProgressBar(total=total, completed=done, width=40)
@@ -99,3 +174,94 @@ class Renderer:
             )
 
         self.console.print(table)
+
+    def render_check_report(self, report: CheckReport) -> None:
+        for issue in report.issues:
+            self.console.print(f"[red]✗[/red] {issue.path}: {issue.message}")
+
+        if report.ok:
+            self.console.print(f"[green]✓[/green] Checked {report.checked} tasks, no issues found")
+        else:
+            self.console.print(
+                f"\n[dim]Checked {report.checked} tasks • {len(report.issues)} issues[/dim]"
+            )
+
+    def render_sync_report(self, report: SyncReport) -> None:
+        for change in report.changes:
+            arrow = "→" if change.direction == PUSH else "←"
+            suffix = " [dim](deleted)[/dim]" if change.deleted else ""
+            self.console.print(f"{arrow} {change.path}{suffix}")
+
+        for path in report.conflicts:
+            self.console.print(f"[red]✗[/red] {path}: changed on both sides")
+
+        if report.ok:
+            self.console.print(f"[green]✓[/green] Synced {len(report.changes)} files")
+        else:
+            self.console.print(
+                f"\n[dim]Synced {len(report.changes)} files • "
+                f"{len(report.conflicts)} conflicts[/dim]"
+            )
+
+    def render_stats(self, stats: "TaskStats") -> None:
+        table = Table(show_header=True, header_style="bold magenta", title="Days")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Tasks", style="yellow", justify="right")
+        for key in ("mean", "p50", "p85", "p95"):
+            table.add_column(key, style="white", justify="right")
+
+        self._add_distribution_row(table, "Lead time", stats.lead_time)
+        for milestone, distribution in stats.aging.items():
+            self._add_distribution_row(table, f"Age of open ({milestone})", distribution)
+
+        self.console.print(table)
+
+        if stats.lead_time.histogram:
+            self.console.print("\n[bold]Lead time[/bold] [dim](days)[/dim]")
+            self._render_bars(
+                [(f"{b.start:6.1f} - {b.end:6.1f}", b.count) for b in stats.lead_time.histogram]
+            )
+
+        self.console.print("\n[bold]Completed per week[/bold]")
+        self._render_bars([(w.week.isoformat(), w.completed) for w in stats.throughput])
+
+    def render_burndown(self, milestone: str, points: list[BurndownPoint], width: int = 40) -> None:
+        table = Table(show_header=True, header_style="bold magenta", title=f"Burndown: {milestone}")
+        table.add_column("Day", style="cyan")
+        table.add_column("Scope", style="white", justify="right")
+        table.add_column("Done", style="green", justify="right")
+        table.add_column("Remaining", style="yellow", justify="right")
+        table.add_column("", style="yellow")
+
+        peak = max((point.scope for point in points), default=0)
+
+        for point in points:
+            bar = "█" * round(point.remaining / peak * width) if peak else ""
+            table.add_row(
+                point.day.isoformat(),
+                str(point.scope),
+                str(point.done),
+                str(point.remaining),
+                bar,
+            )
+
+        self.console.print(table)
+
+    @staticmethod
+    def _add_distribution_row(table: Table, label: str, distribution: "Distribution") -> None:
+        values = [
+            distribution.mean,
+            *(distribution.percentiles.get(k) for k in ("p50", "p85", "p95")),
+        ]
+        table.add_row(
+            label,
+            str(distribution.count),
+            *("-" if value is None else f"{value:.1f}" for value in values),
+        )
+
+    def _render_bars(self, rows: list[tuple[str, int]], width: int = 40) -> None:
+        peak = max((count for _, count in rows), default=0)
+
+        for label, count in rows:
+            bar = "█" * round(count / peak * width) if peak else ""
+            self.console.print(f"{label}  [green]{bar}[/green] {count}")
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from quadro.models import Task
+from quadro.models import TaskStatus
+
+
+SIGNATURE_MODULUS = 2**64
+CREATED = "created"
+COMPLETED = "completed"
+NO_MILESTONE_KEY = ""
+
+
+def file_token(key: str, stat: os.stat_result) -> int:
+    """Hash a file's key, mtime and size into a term of a rollup signature."""
+    digest = hashlib.blake2b(
+        f"{key}:{stat.st_mtime_ns}:{stat.st_size}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest)
+
+
+def _day(value: datetime) -> str:
+    return value.astimezone(UTC).date().isoformat()
+
+
+@dataclass
+class BurndownPoint:
+    day: date
+    scope: int
+    done: int
+
+    @property
+    def remaining(self) -> int:
+        return self.scope - self.done
+
+
+class Rollups:
+    """
+    Task counters per milestone: tasks created and completed per day, and
+    current tasks per status.
+
+    The counters are updated with deltas as tasks are written and deleted,
+    so a burndown or a milestone summary is read from them without scanning
+    any task. Day counters include archived tasks, status counters only
+    count the task files. Status counters of tasks without a milestone are
+    kept under an empty name. The
+    signature is the sum of `file_token` over every task file and archive
+    bundle the counters were computed from. Being a sum, it is updated in
+    constant time along with the counters. A signature that no longer
+    matches the files means they were changed by something else, such as a
+    hand edit, and the counters must be rebuilt.
+    """
+
+    def __init__(
+        self,
+        signature: int = 0,
+        milestones: dict[str, Any] | None = None,
+        statuses: dict[str, Any] | None = None,
+    ) -> None:
+        self.signature = signature
+        self.milestones: dict[str, dict[str, dict[str, int]]] = milestones or {}
+        self.statuses: dict[str, dict[str, int]] = statuses or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "Rollups | None":
+        try:
+            data = json.loads(path.read_text())
+            return cls(int(data["signature"]), data["milestones"], data["statuses"])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "signature": self.signature,
+                    "milestones": self.milestones,
+                    "statuses": self.statuses,
+                },
+                sort_keys=True,
+            )
+        )
+        temp_path.replace(path)
+
+    def add(self, task: Task, sign: int = 1, *, archived: bool = False) -> None:
+        """Count a task, or uncount it with ``sign=-1``."""
+        if not archived:
+            key = task.milestone or NO_MILESTONE_KEY
+            counts = self.statuses.setdefault(key, {})
+            self._bump(counts, task.status.value, sign)
+            if not counts:
+                del self.statuses[key]
+
+        if task.milestone is None:
+            return
+
+        buckets = self.milestones.setdefault(task.milestone, {CREATED: {}, COMPLETED: {}})
+        self._bump(buckets[CREATED], _day(task.created), sign)
+        if task.completed is not None:
+            self._bump(buckets[COMPLETED], _day(task.completed), sign)
+
+        if not buckets[CREATED] and not buckets[COMPLETED]:
+            del self.milestones[task.milestone]
+
+    def remove(self, task: Task) -> None:
+        self.add(task, sign=-1)
+
+    @staticmethod
+    def _bump(counts: dict[str, int], day: str, sign: int) -> None:
+        count = counts.get(day, 0) + sign
+        if count:
+            counts[day] = count
+        else:
+            counts.pop(day, None)
+
+    def replace_token(self, old: int | None, new: int | None) -> None:
+        """Swap one file's term of the signature for another."""
+        self.signature = (self.signature - (old or 0) + (new or 0)) % SIGNATURE_MODULUS
+
+    def status_counts(self) -> dict[str | None, dict[TaskStatus, int]]:
+        """
+        Count current tasks per status for every milestone.
+
+        Returns
+        -------
+        dict[str | None, dict[TaskStatus, int]]
+            Counts of every status by milestone name, ordered by name, with
+            tasks without a milestone under None. Archived tasks are not
+            counted.
+        """
+        return {
+            name or None: {status: counts.get(status.value, 0) for status in TaskStatus}
+            for name, counts in sorted(self.statuses.items())
+        }
+
+    def burndown(self, milestone: str, until: date | None = None) -> list[BurndownPoint]:
+        """
+        Return the cumulative scope and completed count of a milestone per day.
+
+        Parameters
+        ----------
+        milestone : str
+            The milestone name.
+        until : date | None, optional
+            Last day of the series, by default the last day with activity.
+
+        Returns
+        -------
+        list[BurndownPoint]
+            One point per day from the first task's creation, empty if the
+            milestone has no tasks.
+        """
+        buckets = self.milestones.get(milestone)
+        if not buckets or not buckets[CREATED]:
+            return []
+
+        created = {date.fromisoformat(day): count for day, count in buckets[CREATED].items()}
+        completed = {date.fromisoformat(day): count for day, count in buckets[COMPLETED].items()}
+
+        day = min([*created, *completed])
+        last = until or max([*created, *completed])
+        scope = done = 0
+        points = []
+
+        while day <= last:
+            scope += created.get(day, 0)
+            done += completed.get(day, 0)
+            points.append(BurndownPoint(day, scope, done))
+            day += timedelta(days=1)
+
+        return points
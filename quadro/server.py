@@ -0,0 +1,162 @@
+import json
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import cast
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from quadro.models import TaskStatus
+from quadro.storage import TaskStorage
+
+
+TASK_PATH_PATTERN = re.compile(r"^/tasks/(\d+)$")
+
+
+def _etag(signature: int) -> str:
+    return f'"{signature & 0xFFFFFFFFFFFFFFFF:016x}"'
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if header is None:
+        return False
+
+    candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class TaskServer(ThreadingHTTPServer):
+    """
+    A read-only JSON API over a tasks directory.
+
+    Every response carries an ETag derived from the stat signature of the
+    files it was built from: `TaskStorage.task_signature` for a single task
+    and `TaskStorage.tree_signature` for collections. A client that sends the
+    ETag back in ``If-None-Match`` gets an empty ``304 Not Modified`` while
+    nothing has changed, without any task file being read.
+
+    Notes
+    -----
+    The server answers ``GET`` requests on three routes:
+
+    - ``/tasks``: all tasks, filtered by the optional ``milestone`` and
+      ``status`` query parameters. ``status`` may be repeated.
+    - ``/tasks/<id>``: a single task.
+    - ``/milestones``: task counts per status for every milestone.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], storage: TaskStorage | None = None) -> None:
+        super().__init__(address, TaskRequestHandler)
+        self.storage = storage or TaskStorage()
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    server_version = "quadro"
+
+    @property
+    def storage(self) -> TaskStorage:
+        return cast("TaskServer", self.server).storage
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/tasks":
+            self._send_tasks(query)
+            return
+
+        if url.path == "/milestones":
+            self._send_milestones()
+            return
+
+        match = TASK_PATH_PATTERN.match(url.path)
+        if match:
+            self._send_task(int(match.group(1)))
+            return
+
+        self._send_error(HTTPStatus.NOT_FOUND, f"Not found: {url.path}")
+
+    def _send_tasks(self, query: dict[str, list[str]]) -> None:
+        try:
+            statuses = [TaskStatus(status) for status in query.get("status", [])]
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        etag = _etag(self.storage.tree_signature())
+        if self._not_modified(etag):
+            return
+
+        milestone = query.get("milestone", [None])[0]
+        tasks = self.storage.load_all_tasks(milestone=milestone)
+        if statuses:
+            tasks = self.storage.filter_by_status(tasks, statuses)
+
+        self._send_json([task.to_dict() for task in tasks], etag)
+
+    def _send_task(self, task_id: int) -> None:
+        signature = self.storage.task_signature(task_id)
+        if signature is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Task #{task_id} not found")
+            return
+
+        etag = _etag(signature)
+        if self._not_modified(etag):
+            return
+
+        task = self.storage.load_task(task_id)
+        if task is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Task #{task_id} not found")
+            return
+
+        self._send_json(task.to_dict(), etag)
+
+    def _send_milestones(self) -> None:
+        etag = _etag(self.storage.tree_signature())
+        if self._not_modified(etag):
+            return
+
+        summaries = [
+            {
+                "milestone": milestone,
+                "total": sum(counts.values()),
+                **{status.value: count for status, count in counts.items()},
+            }
+            for milestone, counts in self.storage.rollups().status_counts().items()
+            if milestone is not None
+        ]
+
+        self._send_json(summaries, etag)
+
+    def _not_modified(self, etag: str) -> bool:
+        if not _etag_matches(self.headers.get("If-None-Match"), etag):
+            return False
+
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.end_headers()
+        return True
+
+    def _send_json(
+        self,
+        data: Any,  # noqa: ANN401
+        etag: str | None = None,
+        status: HTTPStatus = HTTPStatus.OK,
+    ) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json({"error": message}, status=status)
@@ -0,0 +1,183 @@
+import cmd
+import shlex
+from contextlib import suppress
+from pathlib import Path
+from typing import IO
+
+import click
+from rich.console import Console
+
+from quadro.cli import main
+from quadro.cli import run_command
+from quadro.storage import STATE_DIR
+from quadro.storage import TaskStorage
+
+
+try:
+    import readline
+except ImportError:  # pragma: no cover
+    readline = None  # type: ignore[assignment]
+
+
+HISTORY_FILE = "shell_history"
+HISTORY_LENGTH = 1000
+EXIT_COMMANDS = ("exit", "quit")
+# Commands that would start another session or block the shell.
+UNAVAILABLE_COMMANDS = frozenset({"daemon", "shell"})
+TASK_ID_COMMANDS = frozenset({"delete", "done", "edit", "move", "show", "start", "update"})
+MILESTONE_COMMANDS = frozenset({"archive", "burndown"})
+MILESTONE_OPTIONS = frozenset({"--milestone", "--to"})
+
+
+class TaskShell(cmd.Cmd):
+    """
+    An interactive prompt running ``quadro`` commands in one process.
+
+    Every command line runs against the same `TaskStorage`, so tasks are
+    parsed and counted once and later commands only read the files that
+    changed. Tab completes command names, options, task IDs and milestone
+    names, and the history is kept in ``tasks/.quadro/shell_history``.
+
+    Examples
+    --------
+    >>> TaskShell(TaskStorage()).run()
+    quadro> add "Fix login" --milestone mvp
+    ✓ Created task #12
+    quadro> done 12
+    ✓ Completed task #12: Fix login
+    """
+
+    intro = "Quadro shell. Type 'help' for commands, 'exit' or Ctrl-D to leave."
+    prompt = "quadro> "
+
+    def __init__(
+        self,
+        storage: TaskStorage | None = None,
+        stdin: IO[str] | None = None,
+        stdout: IO[str] | None = None,
+    ) -> None:
+        super().__init__(stdin=stdin, stdout=stdout)
+        self.storage = storage or TaskStorage()
+        self.console = Console(file=stdout)
+        if stdin is not None:
+            self.use_rawinput = False
+
+    @property
+    def history_path(self) -> Path:
+        return self.storage.base_path / STATE_DIR / HISTORY_FILE
+
+    def run(self) -> None:
+        """Read and run command lines until ``exit`` or end of input."""
+        delims = None
+        if readline is not None:
+            with suppress(OSError):
+                readline.read_history_file(self.history_path)
+            readline.set_history_length(HISTORY_LENGTH)
+            # Milestone names may contain "-" and ":", which readline splits
+            # words on by default.
+            delims = readline.get_completer_delims()
+            readline.set_completer_delims(" \t\n")
+
+        intro = self.intro
+        try:
+            while True:
+                try:
+                    self.cmdloop(intro)
+                except KeyboardInterrupt:
+                    self.stdout.write("\n")
+                    intro = ""
+                else:
+                    return
+        finally:
+            if readline is not None and delims is not None:
+                readline.set_completer_delims(delims)
+                with suppress(OSError):
+                    self.storage.make_state_dir()
+                    readline.write_history_file(self.history_path)
+
+    def emptyline(self) -> bool:
+        return False
+
+    def default(self, line: str) -> None:
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.console.print(f"[red]✗[/red] {e}")
+            return
+
+        if args and args[0] == "quadro":
+            args = args[1:]
+        if not args:
+            return
+
+        if args[0] in UNAVAILABLE_COMMANDS:
+            self.console.print(f"[yellow]![/yellow] '{args[0]}' is not available in the shell")
+            return
+
+        run_command(args, self.storage)
+
+    def do_exit(self, _arg: str) -> bool:
+        return True
+
+    def do_quit(self, _arg: str) -> bool:
+        return True
+
+    def do_help(self, arg: str) -> None:
+        run_command([*shlex.split(arg), "--help"], self.storage)
+
+    def do_EOF(self, _arg: str) -> bool:  # noqa: N802
+        self.stdout.write("\n")
+        return True
+
+    def completenames(self, text: str, *_ignored: object) -> list[str]:
+        names = [*main.commands, *EXIT_COMMANDS, "help"]
+        return sorted(name for name in names if name.startswith(text))
+
+    def completedefault(self, text: str, line: str, begidx: int, _endidx: int) -> list[str]:
+        try:
+            words = shlex.split(line[:begidx])
+        except ValueError:
+            return []
+
+        if words and words[0] == "quadro":
+            words = words[1:]
+        if not words:
+            return self.completenames(text)
+
+        return sorted(
+            candidate
+            for candidate in self._candidates(words[0], words[1:], text)
+            if candidate.startswith(text)
+        )
+
+    def _candidates(self, name: str, words: list[str], text: str) -> list[str]:
+        command = main.commands.get(name)
+        if command is None:
+            return []
+
+        if text.startswith("-"):
+            return [option for param in command.params for option in _option_names(param)]
+
+        if words and words[-1] in MILESTONE_OPTIONS:
+            return self.storage.get_milestones()
+
+        # Only the first positional argument is completed.
+        if any(not word.startswith("-") for word in words):
+            return []
+
+        sources = {
+            **dict.fromkeys(TASK_ID_COMMANDS, self._task_ids),
+            **dict.fromkeys(MILESTONE_COMMANDS, self.storage.get_milestones),
+            "unarchive": self.storage.list_archived_milestones,
+        }
+        source = sources.get(name)
+        return source() if source is not None else []
+
+    def _task_ids(self) -> list[str]:
+        return [str(task.id) for task in self.storage.load_all_tasks()]
+
+
+def _option_names(param: click.Parameter) -> list[str]:
+    if not isinstance(param, click.Option):
+        return []
+    return [*param.opts, *param.secondary_opts]
@@ -0,0 +1,240 @@
+import math
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from quadro.models import TaskStatus
+from quadro.table import NO_MILESTONE
+from quadro.table import NO_TIMESTAMP
+from quadro.table import STATUSES
+from quadro.table import TaskTable
+from quadro.table import from_micros
+from quadro.table import to_micros
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+DAY_MICROS = 86_400_000_000
+WEEK_MICROS = 7 * DAY_MICROS
+PERCENTILES = (50, 85, 95)
+NO_MILESTONE_LABEL = "-"
+
+
+@dataclass
+class HistogramBin:
+    start: float
+    end: float
+    count: int
+
+
+@dataclass
+class Distribution:
+    count: int = 0
+    mean: float | None = None
+    percentiles: dict[str, float] = field(default_factory=dict)
+    histogram: list[HistogramBin] = field(default_factory=list)
+
+
+@dataclass
+class WeeklyThroughput:
+    week: date
+    completed: int
+
+
+@dataclass
+class TaskStats:
+    lead_time: Distribution
+    throughput: list[WeeklyThroughput]
+    aging: dict[str, Distribution]
+
+
+def _percentile_key(percentile: int) -> str:
+    return f"p{percentile}"
+
+
+def _python_distribution(values: Sequence[float], bins: int) -> Distribution:
+    if not values:
+        return Distribution()
+
+    ordered = sorted(values)
+    count = len(ordered)
+    percentiles = {}
+
+    for percentile in PERCENTILES:
+        position = (count - 1) * percentile / 100
+        low, high = math.floor(position), math.ceil(position)
+        percentiles[_percentile_key(percentile)] = ordered[low] + (ordered[high] - ordered[low]) * (
+            position - low
+        )
+
+    start, end = ordered[0], ordered[-1]
+    if start == end:
+        start, end = start - 0.5, end + 0.5
+
+    width = (end - start) / bins
+    counts = [0] * bins
+    for value in ordered:
+        counts[min(int((value - start) / width), bins - 1)] += 1
+
+    return Distribution(
+        count=count,
+        mean=math.fsum(ordered) / count,
+        percentiles=percentiles,
+        histogram=[
+            HistogramBin(start + width * i, start + width * (i + 1), counts[i]) for i in range(bins)
+        ],
+    )
+
+
+def _numpy_distribution(values: "np.ndarray", bins: int) -> Distribution:
+    if values.size == 0:
+        return Distribution()
+
+    counts, edges = np.histogram(values, bins=bins)
+    percentiles = np.percentile(values, PERCENTILES)
+
+    return Distribution(
+        count=int(values.size),
+        mean=float(values.mean()),
+        percentiles={
+            _percentile_key(percentile): float(value)
+            for percentile, value in zip(PERCENTILES, percentiles, strict=True)
+        },
+        histogram=[
+            HistogramBin(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(bins)
+        ],
+    )
+
+
+def _week_start(now: datetime) -> datetime:
+    day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def _python_stats(
+    table: TaskTable, now_micros: int, first_week: int, weeks: int, bins: int
+) -> TaskStats:
+    done = STATUSES.index(TaskStatus.DONE)
+    lead_times = []
+    throughput = [0] * weeks
+    ages: dict[int, list[float]] = defaultdict(list)
+
+    for i in range(len(table)):
+        created, completed = table.created[i], table.completed[i]
+
+        if completed != NO_TIMESTAMP:
+            lead_times.append((completed - created) / DAY_MICROS)
+            week = (completed - first_week) // WEEK_MICROS
+            if 0 <= week < weeks:
+                throughput[week] += 1
+
+        if table.statuses[i] != done:
+            ages[table.milestone_codes[i]].append((now_micros - created) / DAY_MICROS)
+
+    return TaskStats(
+        lead_time=_python_distribution(lead_times, bins),
+        throughput=_throughput(first_week, throughput),
+        aging={
+            _milestone_label(table, code): _python_distribution(values, bins)
+            for code, values in ages.items()
+        },
+    )
+
+
+def _numpy_stats(
+    table: TaskTable, now_micros: int, first_week: int, weeks: int, bins: int
+) -> TaskStats:
+    created = np.frombuffer(table.created, dtype=np.int64)
+    completed = np.frombuffer(table.completed, dtype=np.int64)
+    statuses = np.frombuffer(table.statuses, dtype=np.int8)
+    milestones = np.frombuffer(table.milestone_codes, dtype=np.int32)
+
+    finished = completed != NO_TIMESTAMP
+    lead_times = (completed[finished] - created[finished]) / DAY_MICROS
+
+    week = (completed[finished] - first_week) // WEEK_MICROS
+    throughput = np.bincount(week[(week >= 0) & (week < weeks)], minlength=weeks)
+
+    open_ = statuses != STATUSES.index(TaskStatus.DONE)
+    ages = (now_micros - created[open_]) / DAY_MICROS
+    open_milestones = milestones[open_]
+
+    return TaskStats(
+        lead_time=_numpy_distribution(lead_times, bins),
+        throughput=_throughput(first_week, [int(count) for count in throughput]),
+        aging={
+            _milestone_label(table, int(code)): _numpy_distribution(
+                ages[open_milestones == code], bins
+            )
+            for code in np.unique(open_milestones)
+        },
+    )
+
+
+def _milestone_label(table: TaskTable, code: int) -> str:
+    return NO_MILESTONE_LABEL if code == NO_MILESTONE else table.milestones[code]
+
+
+def _throughput(first_week: int, counts: list[int]) -> list[WeeklyThroughput]:
+    return [
+        WeeklyThroughput(from_micros(first_week + WEEK_MICROS * i).date(), count)
+        for i, count in enumerate(counts)
+    ]
+
+
+def compute_stats(
+    table: TaskTable,
+    now: datetime,
+    weeks: int = 8,
+    bins: int = 10,
+) -> TaskStats:
+    """
+    Compute lead time, weekly throughput and aging over a task table.
+
+    The columns of the table are aggregated with NumPy when it is installed
+    (``pip install qdr[stats]``), reading the arrays in place without
+    copying them, and with plain Python loops otherwise. Both produce the
+    same results.
+
+    Parameters
+    ----------
+    table : TaskTable
+        The tasks to analyze.
+    now : datetime
+        The reference time for aging and for the throughput window.
+    weeks : int, optional
+        Number of weeks of throughput to report, ending with the current
+        week, by default 8.
+    bins : int, optional
+        Number of equal-width histogram bins per distribution, by default 10.
+
+    Returns
+    -------
+    TaskStats
+        Lead time in days of completed tasks, completed tasks per week
+        (weeks start on Monday, UTC), and the age in days of open tasks
+        per milestone (``"-"`` for tasks without a milestone). Each
+        distribution has its mean, 50th/85th/95th percentiles and a
+        histogram.
+    """
+    now_micros = to_micros(now)
+    first_week = to_micros(_week_start(now)) - WEEK_MICROS * (weeks - 1)
+
+    if HAS_NUMPY:
+        stats = _numpy_stats(table, now_micros, first_week, weeks, bins)
+    else:
+        stats = _python_stats(table, now_micros, first_week, weeks, bins)
+
+    stats.aging = dict(sorted(stats.aging.items()))
+
+    return stats
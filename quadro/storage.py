@@ -1,106 +1,766 @@
+import atexit
+import hashlib
+import heapq
+import os
 import re
+import shutil
+import sys
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from datetime import UTC
+from datetime import datetime
 from pathlib import Path
 
+from quadro.archive import MilestoneArchive
+from quadro.cache import TaskCache
+from quadro.exceptions import MilestoneNotFoundError
+from quadro.exceptions import SnapshotExistsError
+from quadro.exceptions import SnapshotNotFoundError
 from quadro.models import Task
 from quadro.models import TaskStatus
+from quadro.rollup import SIGNATURE_MODULUS
+from quadro.rollup import Rollups
+from quadro.rollup import file_token
+from quadro.sync import PUSH
+from quadro.sync import Manifest
+from quadro.sync import SyncReport
+from quadro.sync import plan
+from quadro.sync import read_base
+from quadro.sync import write_base
+from quadro.table import TaskTable
+
+
+@dataclass
+class CheckIssue:
+    path: Path
+    message: str
+
+
+@dataclass
+class CheckReport:
+    checked: int = 0
+    issues: list[CheckIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+@dataclass
+class _Batch:
+    """State deferred to the end of `TaskStorage.batch`."""
+
+    sync: bool = True
+    rollups: Rollups | None = None
+    rollups_changed: bool = False
+    next_id: int | None = None
+    # Files to sync at the end, only recorded when ``sync`` is set.
+    changed: set[Path] = field(default_factory=set)
+
+
+TASK_FILE_PATTERN = re.compile(r"^(\d+)\.md$")
+STATE_DIR = ".quadro"
+ARCHIVE_DIR = f"{STATE_DIR}/archive"
+# The state directory holds caches and machine-local state that should not
+# be committed along with the task files, except for archived milestones.
+STATE_GITIGNORE = "*\n!.gitignore\n!archive/\n!archive/*.zip\n"
+SNAPSHOT_NAME_PATTERN = re.compile(r"^[\w-][\w.-]*$")
+FICLONE = 0x40049409
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _patch_frontmatter(content: str, fields: dict[str, str | None]) -> str | None:
+    """
+    Replace, add or remove top-level frontmatter lines, keeping all other bytes.
+
+    Added lines go before the first top-level key that sorts after them, so
+    files with sorted keys stay sorted. Returns None if the content does not
+    start with a frontmatter block.
+    """
+    lines = content.splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != "---":
+        return None
+
+    end = next((i for i in range(1, len(lines)) if lines[i].rstrip() == "---"), None)
+    if end is None:
+        return None
+
+    newline = lines[0][len(lines[0].rstrip("\r\n")) :]
+    missing = sorted(
+        (key, value)
+        for key, value in fields.items()
+        if value is not None and not any(line.startswith(f"{key}:") for line in lines[1:end])
+    )
+    head = [lines[0]]
+
+    for line in lines[1:end]:
+        key = line.split(":", 1)[0] if line[:1] not in " \t#-" and ":" in line else None
+
+        while key is not None and missing and missing[0][0] < key:
+            missing_key, missing_value = missing.pop(0)
+            head.append(f"{missing_key}: {missing_value}{newline}")
+
+        if key not in fields:
+            head.append(line)
+        elif (value := fields[key]) is not None:
+            head.append(f"{key}: {value}{newline}")
+
+    head.extend(f"{key}: {value}{newline}" for key, value in missing)
+
+    return "".join([*head, *lines[end:]])
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if sys.platform != "linux":
+        return False
+
+    import fcntl  # noqa: PLC0415
+
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+    shutil.copystat(source, target)
+    return True
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """Clone a file as a reflink when supported, else as a hardlink, else as a copy."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    if _reflink(source, target):
+        return
+
+    try:
+        target.hardlink_to(source)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _fsync(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _iter_files(root: Path) -> Iterator[Path]:
+    """Yield every regular file under ``root``, skipping hidden files and directories."""
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+
+        for file_name in file_names:
+            if not file_name.startswith("."):
+                yield Path(dir_path) / file_name
+
+
+def _iter_snapshot_files(root: Path) -> Iterator[Path]:
+    """Yield the files a snapshot holds: every visible file plus the archive bundles."""
+    yield from _iter_files(root)
+    yield from sorted((root / ARCHIVE_DIR).glob("*.zip"))
 
 
 class TaskStorage:
-    def __init__(self, base_path: Path = Path("tasks")) -> None:
+    def __init__(
+        self,
+        base_path: Path = Path("tasks"),
+        write_delay: float | None = None,
+        cache: TaskCache | None = None,
+    ) -> None:
+        """
+        Create a storage rooted at ``base_path``.
+
+        Parameters
+        ----------
+        base_path : Path, optional
+            Directory holding the task files, by default ``tasks``.
+        write_delay : float | None, optional
+            When set, ``save_task`` buffers rewrites of existing task files
+            for this many seconds and coalesces repeated saves of the same
+            task into a single write. New task files are always written right
+            away, so other processes see their IDs. Buffered writes are
+            flushed when the delay expires, before any read that scans the
+            directory, and at interpreter shutdown. By default None (write
+            immediately).
+        cache : TaskCache | None, optional
+            Cache of parsed tasks consulted before reading a task file, by
+            default a new `TaskCache` with the default budget.
+        """
         self.base_path = base_path
+        self.write_delay = write_delay
+        self._pending: dict[int, Task] = {}
+        self._patches: set[int] = set()
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._hashes: dict[Path, tuple[int, int, str]] = {}
+        self._archives: dict[Path, MilestoneArchive] = {}
+        self._batch: _Batch | None = None
+        self.cache = cache or TaskCache()
+
+        if write_delay is not None:
+            atexit.register(self.flush)
+
+    def flush(self) -> list[Path]:
+        """
+        Write all buffered tasks to disk.
+
+        Returns
+        -------
+        list[Path]
+            The paths written, in task ID order. Tasks whose file already holds
+            identical content are not written and not listed.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending = sorted(self._pending.values(), key=lambda t: t.id)
+            patches = self._patches
+            self._pending.clear()
+            self._patches = set()
+
+            return [
+                path
+                for path, written in (
+                    self.write_task(task, patch=task.id in patches) for task in pending
+                )
+                if written
+            ]
+
+    def make_state_dir(self) -> Path:
+        """
+        Create the ``.quadro`` state directory if needed and return its path.
+
+        A ``.gitignore`` is written along with it, so caches, snapshots and
+        sync state do not show up as changes in a committed tasks directory.
+        Archive bundles are not ignored, since they hold the archived tasks.
+        """
+        state_path = self.base_path / STATE_DIR
+        gitignore = state_path / ".gitignore"
+
+        if not gitignore.exists():
+            state_path.mkdir(parents=True, exist_ok=True)
+            gitignore.write_text(STATE_GITIGNORE)
+
+        return state_path
+
+    @contextmanager
+    def batch(self, *, sync: bool = True) -> Iterator[None]:
+        """
+        Group many changes into one, holding the storage lock throughout.
+
+        Inside the block, the rollup counters are updated in memory and
+        saved once at the end instead of after every write, and the next
+        task ID is found with a single scan. On exit, buffered writes are
+        flushed and, with ``sync``, every file written, along with the
+        directories of files written or removed, is synced to disk. Nested
+        blocks join the outermost one.
+
+        Parameters
+        ----------
+        sync : bool, optional
+            Sync the changed files to disk at the end, by default True.
+
+        Examples
+        --------
+        >>> storage = TaskStorage()
+        >>> with storage.batch():
+        ...     for title in titles:
+        ...         add_task(title, storage=storage)
+        """
+        with self._lock:
+            if self._batch is not None:
+                yield
+                return
+
+            self._batch = _Batch(sync=sync)
+            try:
+                yield
+            finally:
+                self.flush()
+                batch, self._batch = self._batch, None
+                self._finish_batch(batch)
+
+    def _finish_batch(self, batch: _Batch) -> None:
+        if batch.rollups is not None and batch.rollups_changed:
+            self.make_state_dir()
+            batch.rollups.save(self.rollups_path)
+            batch.changed.add(self.rollups_path)
+
+        if not batch.sync:
+            return
+
+        for path in sorted(batch.changed):
+            with suppress(FileNotFoundError):
+                _fsync(path)
+
+        # Directories cannot be opened for syncing on every platform.
+        for directory in sorted({path.parent for path in batch.changed}):
+            with suppress(OSError):
+                _fsync(directory)
 
     def get_next_id(self) -> int:
+        self.flush()
+
+        if self._batch is not None and self._batch.next_id is not None:
+            return self._batch.next_id
+
         if not self.base_path.exists():
             return 1
 
-        max_id = 0
-        pattern = re.compile(r"^(\d+)\.md$")
+        max_id = max((task_id for task_id, _ in self._iter_task_files()), default=0)
 
-        for file_path in self.base_path.rglob("*.md"):
-            match = pattern.match(file_path.name)
-            if match:
-                task_id = int(match.group(1))
-                max_id = max(max_id, task_id)
+        for archive in self._iter_archives():
+            max_id = max([max_id, *archive.ids()])
+
+        if self._batch is not None:
+            self._batch.next_id = max_id + 1
 
         return max_id + 1
 
-    def save_task(self, task: Task) -> Path:
-        if task.milestone is not None:
-            task_dir = self.base_path / task.milestone
-            task_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            task_dir = self.base_path
-            task_dir.mkdir(parents=True, exist_ok=True)
+    def _iter_task_files(self) -> Iterator[tuple[int, Path]]:
+        """Yield the ID and path of every task file, skipping hidden directories."""
+        for dir_path, dir_names, file_names in os.walk(self.base_path):
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
 
-        file_path = task_dir / f"{task.id}.md"
-        file_path.write_text(task.to_markdown())
+            for file_name in file_names:
+                match = TASK_FILE_PATTERN.match(file_name)
+                if match:
+                    yield int(match.group(1)), Path(dir_path) / file_name
+
+    def tree_signature(self) -> int:
+        """
+        Fingerprint the task files without reading them.
+
+        The value changes whenever a task file or archive bundle is added,
+        removed, moved or modified, so callers can cache anything derived from
+        the tree and reuse it while the signature stays the same. It is the
+        signature the rollups are checked against, and stays the same across
+        processes.
+
+        Returns
+        -------
+        int
+            A hash of every task file's and archive bundle's path, mtime and size.
+        """
+        self.flush()
+
+        if not self.base_path.exists():
+            return 0
+
+        return self._rollup_signature()
+
+    def task_signature(self, task_id: int) -> int | None:
+        """
+        Fingerprint a single task without reading it.
+
+        Only the file the task is saved in is looked up, in the tasks
+        directory or a milestone directory, then in the archive bundles.
+
+        Parameters
+        ----------
+        task_id : int
+            The ID of the task.
+
+        Returns
+        -------
+        int | None
+            A hash of the path, mtime and size of the file holding the task,
+            or of its archive bundle when archived. None if the task does not
+            exist.
+        """
+        self.flush()
+
+        if not self.base_path.exists():
+            return None
+
+        file_path = self._find_task_file(task_id)
+
+        if file_path is None:
+            file_path = next(
+                (archive.path for archive in self._iter_archives() if task_id in archive.index()),
+                None,
+            )
+
+        if file_path is None:
+            return None
+
+        return self._rollup_token(file_path)
+
+    def _find_task_file(self, task_id: int) -> Path | None:
+        """Look up a task file where `save_task` puts it, without walking the tree."""
+        file_name = f"{task_id}.md"
+        candidates = [self.base_path / file_name]
+
+        with os.scandir(self.base_path) as entries:
+            candidates.extend(
+                Path(entry.path) / file_name
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+
+        return next((path for path in candidates if path.is_file()), None)
+
+    def save_task(self, task: Task, *, patch: bool = False) -> Path:
+        """
+        Save a task, buffered when the storage has a write delay.
+
+        Only rewrites of an existing task file are buffered. A task saved to a
+        new file, because it was just created or changed milestone, is written
+        at once: another process allocating the next ID must see the file, or
+        both would save a task under the same ID.
+
+        Parameters
+        ----------
+        task : Task
+            The task to save.
+        patch : bool, optional
+            Only rewrite the ``status`` and ``completed`` lines of the existing
+            file, see `write_task`. By default False.
+
+        Returns
+        -------
+        Path
+            The task file path.
+        """
+        if self.write_delay is None:
+            file_path, _ = self.write_task(task, patch=patch)
+            return file_path
+
+        with self._lock:
+            file_path = self._task_path(task)
+
+            if not file_path.exists():
+                self._pending.pop(task.id, None)
+                self._patches.discard(task.id)
+                self.write_task(task, patch=patch)
+                return file_path
+
+            self._pending[task.id] = replace(task)
+            if patch:
+                self._patches.add(task.id)
+            else:
+                self._patches.discard(task.id)
+
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
 
         return file_path
 
-    def load_task(self, task_id: int) -> Task | None:
+    def _task_path(self, task: Task) -> Path:
+        task_dir = self.base_path if task.milestone is None else self.base_path / task.milestone
+
+        return task_dir / f"{task.id}.md"
+
+    def write_task(self, task: Task, *, patch: bool = False) -> tuple[Path, bool]:
+        """
+        Write a task to disk immediately, skipping writes that change nothing.
+
+        The file is replaced atomically, so snapshots sharing its inode are
+        never modified. The serialized task is compared against the content hash recorded when
+        the file was last loaded or written by this storage. If the file was
+        changed since then, its current content is hashed instead. Identical
+        content is not rewritten, so the file's mtime is left untouched.
+
+        Parameters
+        ----------
+        task : Task
+            The task to write. Bypasses the write buffer.
+        patch : bool, optional
+            Rewrite only the ``status`` and ``completed`` lines of the task's
+            existing file and copy everything else unchanged, preserving the
+            formatting of hand-written files. The patch is only kept if the
+            patched file parses back to exactly ``task``. Otherwise, such as
+            when other fields changed, the task is serialized in full.
+            By default False.
+
+        Returns
+        -------
+        tuple[Path, bool]
+            The task file path and whether the file was written.
+
+        Examples
+        --------
+        >>> storage = TaskStorage()
+        >>> task = storage.load_task(1)
+        >>> storage.write_task(task)
+        (PosixPath('tasks/1.md'), False)
+        """
+        file_path = self._task_path(task)
+        patched = self._patched_markdown(task, file_path) if patch else None
+        content = task.to_markdown() if patched is None else patched
+        digest = _content_hash(content)
+
+        if self._stored_hash(file_path) == digest:
+            return file_path, False
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_text(content, newline=None if patched is None else "")
+        self._track_rollups(task.id, file_path, task, lambda: temp_path.replace(file_path))
+        self.cache.discard(file_path)
+        self._remember_hash(file_path, digest)
+
+        if self._batch is not None:
+            if self._batch.sync:
+                self._batch.changed.add(file_path)
+            if self._batch.next_id is not None:
+                self._batch.next_id = max(self._batch.next_id, task.id + 1)
+
+        return file_path, True
+
+    @staticmethod
+    def _patched_markdown(task: Task, file_path: Path) -> str | None:
+        try:
+            content = file_path.read_bytes().decode()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+        completed = None if task.completed is None else f"'{task.completed.isoformat()}'"
+        patched = _patch_frontmatter(content, {"status": task.status.value, "completed": completed})
+        if patched is None:
+            return None
+
+        try:
+            parsed = Task.from_markdown(patched, task.id, file_path)
+        except Exception:  # noqa: BLE001
+            return None
+
+        return patched if parsed == task else None
+
+    def _stored_hash(self, file_path: Path) -> str | None:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+
+        known = self._hashes.get(file_path)
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+
+        return _content_hash(file_path.read_text())
+
+    def _remember_hash(self, file_path: Path, digest: str) -> None:
+        stat = file_path.stat()
+        self._hashes[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    def _forget(self, file_path: Path) -> None:
+        self._hashes.pop(file_path, None)
+        self.cache.discard(file_path)
+
+        if self._batch is not None:
+            if self._batch.sync:
+                self._batch.changed.add(file_path)
+            # Removed or replaced files may change the highest task ID.
+            self._batch.next_id = None
+
+    def _read_task_file(self, task_id: int, file_path: Path) -> Task:
+        """Parse a task file, or return its cached task if the file is unchanged."""
+        stat = file_path.stat()
+        task = self.cache.get(file_path, stat.st_mtime_ns, stat.st_size)
+
+        if task is None:
+            content = file_path.read_text()
+            task = Task.from_markdown(content, task_id, str(file_path))
+            self.cache.put(file_path, stat.st_mtime_ns, stat.st_size, task)
+            self._hashes[file_path] = (stat.st_mtime_ns, stat.st_size, _content_hash(content))
+
+        return task
+
+    def load_task(self, task_id: int, *, archived: bool = True) -> Task | None:
+        """
+        Load a task by ID, from its task file or else from an archive bundle.
+
+        Parameters
+        ----------
+        task_id : int
+            The ID of the task.
+        archived : bool, optional
+            Fall back to the archive bundles when no task file has the ID.
+            Pass False before changing a task, since an archived task has no
+            file to change. By default True.
+
+        Returns
+        -------
+        Task | None
+            The task, or None if it does not exist.
+        """
+        with self._lock:
+            pending = self._pending.get(task_id)
+
+        if pending is not None:
+            return replace(pending)
+
         if not self.base_path.exists():
             return None
 
-        pattern = re.compile(r"^(\d+)\.md$")
+        for file_id, file_path in self._iter_task_files():
+            if file_id == task_id:
+                return self._read_task_file(task_id, file_path)
+
+        if not archived:
+            return None
 
-        for file_path in self.base_path.rglob("*.md"):
-            match = pattern.match(file_path.name)
-            if match and int(match.group(1)) == task_id:
-                content = file_path.read_text()
-                return Task.from_markdown(content, task_id, str(file_path))
+        for archive in self._iter_archives():
+            task = archive.read_task(task_id)
+            if task is not None:
+                return task
 
         return None
 
     def load_all_tasks(self, milestone: str | None = None) -> list[Task]:
+        return list(self.iter_tasks(milestone))
+
+    def iter_tasks(self, milestone: str | None = None) -> Iterator[Task]:
+        """
+        Stream tasks in ID order, parsing each file only when it is reached.
+
+        Only the list of file paths is held in memory, so iterating over a
+        large tree uses constant memory regardless of task contents. When a
+        milestone is given, its archived tasks are included too; a task file
+        in the milestone directory takes precedence over its archived copy.
+
+        Parameters
+        ----------
+        milestone : str | None, optional
+            Only yield tasks stored in this milestone's directory, by default None.
+
+        Yields
+        ------
+        Task
+            The next task by ID.
+
+        Examples
+        --------
+        >>> storage = TaskStorage()
+        >>> for task in storage.iter_tasks(milestone="mvp"):
+        ...     print(task.id, task.title)
+        """
+        self.flush()
+
         if not self.base_path.exists():
-            return []
+            return
 
-        tasks = []
-        pattern = re.compile(r"^(\d+)\.md$")
+        archive = None
 
         if milestone is not None:
             search_path = self.base_path / milestone
-            if not search_path.exists():
-                return []
-            file_paths = search_path.glob("*.md")
+            file_paths = [
+                (int(match.group(1)), file_path)
+                for file_path in search_path.glob("*.md")
+                if (match := TASK_FILE_PATTERN.match(file_path.name))
+            ]
+            archive = self._archive(milestone)
         else:
-            file_paths = self.base_path.rglob("*.md")
+            file_paths = list(self._iter_task_files())
+
+        file_paths.sort(key=lambda item: item[0])
+        tasks = self._read_tasks(file_paths)
+
+        if archive is None:
+            yield from tasks
+            return
+
+        hot_ids = {task_id for task_id, _ in file_paths}
+        archived = archive.iter_tasks(i for i in archive.ids() if i not in hot_ids)
+        yield from heapq.merge(tasks, archived, key=lambda task: task.id)
+
+    def load_table(
+        self, milestone: str | None = None, statuses: list[TaskStatus] | None = None
+    ) -> TaskTable:
+        """
+        Load task metadata into a compact columnar table.
+
+        Tasks are streamed from `iter_tasks` and packed one at a time, so
+        only the table itself is held in memory. Descriptions are dropped.
+
+        Parameters
+        ----------
+        milestone : str | None, optional
+            Only load tasks of this milestone, by default None.
+        statuses : list[TaskStatus] | None, optional
+            Only load tasks with one of these statuses, by default None (all).
+
+        Returns
+        -------
+        TaskTable
+            The metadata of the tasks in ID order.
+        """
+        tasks = self.iter_tasks(milestone)
+        if statuses:
+            tasks = (task for task in tasks if task.status in statuses)
 
-        for file_path in file_paths:
-            match = pattern.match(file_path.name)
-            if match:
-                task_id = int(match.group(1))
-                content = file_path.read_text()
-                task = Task.from_markdown(content, task_id, str(file_path))
-                tasks.append(task)
+        return TaskTable.from_tasks(tasks)
 
-        return sorted(tasks, key=lambda t: t.id)
+    def _read_tasks(self, file_paths: Iterable[tuple[int, Path]]) -> Iterator[Task]:
+        for task_id, file_path in file_paths:
+            yield self._read_task_file(task_id, file_path)
+
+    def save_tasks(self, tasks: Iterable[Task]) -> list[Path]:
+        """
+        Write a batch of tasks to disk immediately.
+
+        The tasks are written in one `batch`, so the rollup counters are
+        saved once for all of them.
+
+        Parameters
+        ----------
+        tasks : Iterable[Task]
+            The tasks to write. Bypasses the write buffer.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the task files, in input order.
+        """
+        with self.batch(sync=False):
+            self.flush()
+            return [self.write_task(task)[0] for task in tasks]
 
     def move_task(self, task_id: int, to_milestone: str | None) -> Path:
+        self.flush()
         task = self.load_task(task_id)
 
         if task is None:
             msg = f"Task {task_id} not found"
             raise ValueError(msg)
 
-        pattern = re.compile(r"^(\d+)\.md$")
-        old_file_path = None
-
-        for file_path in self.base_path.rglob("*.md"):
-            match = pattern.match(file_path.name)
-            if match and int(match.group(1)) == task_id:
-                old_file_path = file_path
-                break
+        old_file_path = next(
+            (file_path for file_id, file_path in self._iter_task_files() if file_id == task_id),
+            None,
+        )
 
         if old_file_path is None:
             msg = f"Task file for {task_id} not found"
             raise ValueError(msg)
 
         task.milestone = to_milestone
-        new_file_path = self.save_task(task)
+        new_file_path, _ = self.write_task(task)
 
         if old_file_path != new_file_path:
-            old_file_path.unlink()
+            self._track_rollups(task_id, old_file_path, None, old_file_path.unlink)
+            self._forget(old_file_path)
 
         return new_file_path
 
@@ -126,27 +786,613 @@ class TaskStorage:
         >>> if deleted_path:
         ...     print(f"Deleted: {deleted_path}")
         """
+        self.flush()
+
         if not self.base_path.exists():
             return None
 
-        pattern = re.compile(r"^(\d+)\.md$")
-
-        for file_path in self.base_path.rglob("*.md"):
-            match = pattern.match(file_path.name)
-            if match and int(match.group(1)) == task_id:
-                file_path.unlink()
+        for file_id, file_path in self._iter_task_files():
+            if file_id == task_id:
+                self._track_rollups(task_id, file_path, None, file_path.unlink)
+                self._forget(file_path)
                 return file_path
 
         return None
 
+    def check(self, max_workers: int | None = None) -> CheckReport:
+        """
+        Verify the consistency of the task tree.
+
+        Every task file is read and parsed in a thread pool. Files that fail
+        to parse, task IDs that appear in more than one file or both in a
+        file and an archive bundle, and tasks whose frontmatter ``milestone``
+        does not match their directory are reported.
+
+        The derived state is rebuilt from the task files: the rollup counters
+        are recounted, or dropped when issues are found, and the cached
+        manifest hashes are dropped, so the next sync hashes every file again.
+
+        Parameters
+        ----------
+        max_workers : int | None, optional
+            Maximum number of worker threads, by default None (executor default).
+
+        Returns
+        -------
+        CheckReport
+            The number of files checked and the issues found, ordered by path.
+
+        Examples
+        --------
+        >>> storage = TaskStorage()
+        >>> report = storage.check()
+        >>> for issue in report.issues:
+        ...     print(f"{issue.path}: {issue.message}")
+        """
+        self.flush()
+        report = CheckReport()
+
+        if not self.base_path.exists():
+            return report
+
+        file_paths = [file_path for _, file_path in self._iter_task_files()]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._check_file, file_paths))
+
+        paths_by_id: dict[int, list[Path]] = defaultdict(list)
+
+        for file_path, issue in zip(file_paths, results, strict=True):
+            report.checked += 1
+            paths_by_id[int(file_path.stem)].append(file_path)
+            if issue is not None:
+                report.issues.append(issue)
+
+        for task_id, paths in paths_by_id.items():
+            if len(paths) > 1:
+                locations = ", ".join(str(path) for path in sorted(paths))
+                report.issues.extend(
+                    CheckIssue(path, f"Duplicate task #{task_id} (found in {locations})")
+                    for path in sorted(paths)
+                )
+
+        for archive in self._iter_archives():
+            for task_id in archive.ids():
+                report.issues.extend(
+                    CheckIssue(path, f"Task #{task_id} is also archived in {archive.path}")
+                    for path in sorted(paths_by_id.get(task_id, []))
+                )
+
+        report.issues.sort(key=lambda issue: str(issue.path))
+
+        # The counters are recounted by the next read once broken files are fixed.
+        self._discard_rollups()
+        if report.ok:
+            self.rollups()
+        self.manifest_path.unlink(missing_ok=True)
+
+        return report
+
+    def _check_file(self, file_path: Path) -> CheckIssue | None:
+        try:
+            task = Task.from_markdown(file_path.read_text(), int(file_path.stem), file_path)
+        except Exception as e:  # noqa: BLE001
+            return CheckIssue(file_path, f"Cannot parse task: {e}")
+
+        relative_dir = file_path.parent.relative_to(self.base_path)
+        expected = None if relative_dir == Path() else relative_dir.as_posix()
+
+        if task.milestone != expected:
+            return CheckIssue(
+                file_path,
+                f"Milestone '{task.milestone or 'root'}' does not match "
+                f"directory '{expected or 'root'}'",
+            )
+
+        return None
+
+    @property
+    def snapshots_path(self) -> Path:
+        return self.base_path / STATE_DIR / "snapshots"
+
+    def create_snapshot(self, name: str | None = None) -> tuple[str, int]:
+        """
+        Snapshot the task tree.
+
+        The snapshot holds every visible file and the archive bundles. Files
+        are cloned as reflinks when the filesystem supports copy-on-write
+        and as hardlinks otherwise, so a snapshot is near-instant and takes no
+        extra space until the files change. Task files are always replaced
+        atomically by this storage, which keeps hardlinked snapshots intact.
+
+        Parameters
+        ----------
+        name : str | None, optional
+            Snapshot name, by default the current UTC timestamp.
+
+        Returns
+        -------
+        tuple[str, int]
+            The snapshot name and the number of files it contains.
+
+        Raises
+        ------
+        ValueError
+            If the name is not a valid snapshot name.
+        SnapshotExistsError
+            If a snapshot with the same name already exists.
+
+        Examples
+        --------
+        >>> storage = TaskStorage()
+        >>> storage.create_snapshot("before-cleanup")
+        ('before-cleanup', 42)
+        """
+        self.flush()
+
+        name = name or datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        if not SNAPSHOT_NAME_PATTERN.match(name):
+            msg = f"Invalid snapshot name: {name}"
+            raise ValueError(msg)
+
+        snapshot_path = self.snapshots_path / name
+        if snapshot_path.exists():
+            msg = f"Snapshot '{name}' already exists"
+            raise SnapshotExistsError(msg)
+
+        self.make_state_dir()
+        snapshot_path.mkdir(parents=True)
+        count = 0
+
+        for file_path in _iter_snapshot_files(self.base_path):
+            _clone_file(file_path, snapshot_path / file_path.relative_to(self.base_path))
+            count += 1
+
+        return name, count
+
+    def restore_snapshot(self, name: str) -> int:
+        """
+        Replace the task tree with the contents of a snapshot.
+
+        Every file outside hidden directories and every archive bundle is
+        removed, then the snapshot files are cloned back. The snapshot itself
+        is kept.
+
+        Parameters
+        ----------
+        name : str
+            The name of the snapshot to restore.
+
+        Returns
+        -------
+        int
+            The number of files restored.
+
+        Raises
+        ------
+        SnapshotNotFoundError
+            If no snapshot with that name exists.
+        """
+        snapshot_path = self.snapshots_path / name
+        if not SNAPSHOT_NAME_PATTERN.match(name) or not snapshot_path.is_dir():
+            msg = f"Snapshot '{name}' not found"
+            raise SnapshotNotFoundError(msg)
+
+        self.flush()
+
+        for file_path in list(_iter_snapshot_files(self.base_path)):
+            file_path.unlink()
+
+        directories = []
+        for dir_path, dir_names, _ in os.walk(self.base_path):
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+            directories.append(Path(dir_path))
+
+        for directory in reversed(directories[1:]):
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+        count = 0
+        for file_path in _iter_snapshot_files(snapshot_path):
+            _clone_file(file_path, self.base_path / file_path.relative_to(snapshot_path))
+            count += 1
+
+        self._hashes.clear()
+        self._archives.clear()
+        self.cache.clear()
+        if self._batch is not None:
+            self._batch.next_id = None
+
+        return count
+
+    def list_snapshots(self) -> list[str]:
+        if not self.snapshots_path.exists():
+            return []
+
+        return sorted(item.name for item in self.snapshots_path.iterdir() if item.is_dir())
+
+    @property
+    def archive_path(self) -> Path:
+        return self.base_path / ARCHIVE_DIR
+
+    def _archive(self, milestone: str) -> MilestoneArchive | None:
+        path = self.archive_path / f"{milestone}.zip"
+
+        if not path.is_file():
+            self._archives.pop(path, None)
+            return None
+
+        return self._archives.setdefault(path, MilestoneArchive(path))
+
+    def _iter_archives(self) -> Iterator[MilestoneArchive]:
+        if not self.archive_path.exists():
+            return
+
+        for path in sorted(self.archive_path.glob("*.zip")):
+            archive = self._archive(path.stem)
+            if archive is not None:
+                yield archive
+
+    def archive_milestone(self, milestone: str) -> tuple[Path, int]:
+        """
+        Pack a milestone's tasks into a compressed bundle.
+
+        The task files are moved into ``.quadro/archive/<milestone>.zip``, out
+        of the directory scans used by `load_all_tasks` and `get_milestones`.
+        Archived tasks stay readable through `load_task` and through
+        `iter_tasks` with the milestone given. Archiving a milestone that
+        already has a bundle merges the new tasks into it.
+
+        Parameters
+        ----------
+        milestone : str
+            The milestone to archive.
+
+        Returns
+        -------
+        tuple[Path, int]
+            The bundle path and the number of task files archived.
+
+        Raises
+        ------
+        MilestoneNotFoundError
+            If the milestone directory holds no tasks.
+        """
+        self.flush()
+
+        milestone_dir = self.base_path / milestone
+        file_paths = sorted(
+            (int(match.group(1)), file_path)
+            for file_path in milestone_dir.glob("*.md")
+            if (match := TASK_FILE_PATTERN.match(file_path.name))
+        )
+
+        if not file_paths:
+            msg = f"Milestone '{milestone}' has no tasks to archive"
+            raise MilestoneNotFoundError(msg)
+
+        contents: dict[int, str] = {}
+        archive = self._archive(milestone)
+        if archive is not None:
+            contents.update(archive.iter_contents())
+
+        for task_id, file_path in file_paths:
+            contents[task_id] = file_path.read_text()
+
+        path = self.archive_path / f"{milestone}.zip"
+        self.make_state_dir()
+        MilestoneArchive.write(
+            path,
+            (
+                (Task.from_markdown(content, task_id, f"{path}:{task_id}.md"), content)
+                for task_id, content in contents.items()
+            ),
+        )
+
+        for _, file_path in file_paths:
+            file_path.unlink()
+            self._forget(file_path)
+
+        if not any(milestone_dir.iterdir()):
+            milestone_dir.rmdir()
+
+        return path, len(file_paths)
+
+    def unarchive_milestone(self, milestone: str) -> int:
+        """
+        Unpack a milestone bundle back into the milestone directory.
+
+        Task files already present in the directory are kept. The bundle is
+        removed afterwards.
+
+        Parameters
+        ----------
+        milestone : str
+            The milestone to unpack.
+
+        Returns
+        -------
+        int
+            The number of task files restored.
+
+        Raises
+        ------
+        MilestoneNotFoundError
+            If the milestone has no bundle.
+        """
+        archive = self._archive(milestone)
+
+        if archive is None:
+            msg = f"Milestone '{milestone}' is not archived"
+            raise MilestoneNotFoundError(msg)
+
+        milestone_dir = self.base_path / milestone
+        milestone_dir.mkdir(parents=True, exist_ok=True)
+        count = 0
+
+        for task_id, content in archive.iter_contents():
+            file_path = milestone_dir / f"{task_id}.md"
+            if not file_path.exists():
+                file_path.write_text(content)
+                count += 1
+
+        archive.path.unlink()
+        self._archives.pop(archive.path, None)
+
+        return count
+
+    def list_archived_milestones(self) -> list[str]:
+        return [archive.milestone for archive in self._iter_archives()]
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.base_path / STATE_DIR / "manifest.json"
+
+    def manifest(self) -> dict[str, str]:
+        """
+        Hash every task file, reading only files changed since the last call.
+
+        Archive bundles are included as whole files, so that archiving a
+        milestone on one side of a sync moves its tasks instead of deleting
+        them on the other.
+
+        Returns
+        -------
+        dict[str, str]
+            The content hash of every task file and archive bundle by path
+            relative to the tasks directory.
+        """
+        self.flush()
+
+        files = [file_path for _, file_path in self._iter_task_files()]
+        files.extend(archive.path for archive in self._iter_archives())
+        self.make_state_dir()
+
+        return Manifest(self.manifest_path).build(self.base_path, files)
+
+    def _sync_base_path(self, other: "TaskStorage") -> Path:
+        key = hashlib.blake2b(str(other.base_path.resolve()).encode(), digest_size=8).hexdigest()
+        return self.base_path / STATE_DIR / "sync" / f"{key}.json"
+
+    def sync(self, other: "TaskStorage", dry_run: bool = False) -> SyncReport:  # noqa: FBT001, FBT002
+        """
+        Synchronize task files in both directions with another tasks directory.
+
+        Both trees are compared through their manifests against the state
+        recorded after the previous sync between the two, so only files that
+        changed on either side are copied or deleted. Files changed on both
+        sides are reported as conflicts and left untouched on both sides.
+        Archive bundles are synchronized like task files, snapshots are not.
+
+        Parameters
+        ----------
+        other : TaskStorage
+            The storage to synchronize with.
+        dry_run : bool, optional
+            Report the changes without applying them, by default False.
+
+        Returns
+        -------
+        SyncReport
+            The changes applied, pushed to ``other`` or pulled from it, and
+            the conflicting paths.
+
+        Examples
+        --------
+        >>> laptop = TaskStorage()
+        >>> report = laptop.sync(TaskStorage(Path("/mnt/buildbox/tasks")))
+        >>> report.ok
+        True
+        """
+        other.flush()
+
+        base_path = self._sync_base_path(other)
+        changes, conflicts, new_base = plan(self.manifest(), other.manifest(), read_base(base_path))
+        report = SyncReport(changes, conflicts)
+
+        if dry_run:
+            return report
+
+        for change in changes:
+            source, target = (self, other) if change.direction == PUSH else (other, self)
+            target_path = target.base_path / change.path
+
+            if change.deleted:
+                target_path.unlink(missing_ok=True)
+            else:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+                shutil.copyfile(source.base_path / change.path, temp_path)
+                temp_path.replace(target_path)
+
+            target._forget(target_path)  # noqa: SLF001
+
+        write_base(base_path, new_base)
+        write_base(other._sync_base_path(self), new_base)  # noqa: SLF001
+
+        return report
+
+    @property
+    def rollups_path(self) -> Path:
+        return self.base_path / STATE_DIR / "rollups.json"
+
+    def _rollup_token(self, file_path: Path) -> int:
+        return file_token(file_path.relative_to(self.base_path).as_posix(), file_path.stat())
+
+    def _rollup_signature(self) -> int:
+        file_paths = [file_path for _, file_path in self._iter_task_files()]
+        file_paths.extend(archive.path for archive in self._iter_archives())
+
+        return sum(map(self._rollup_token, file_paths)) % SIGNATURE_MODULUS
+
+    def rollups(self) -> Rollups:
+        """
+        Return the day and status counters of every milestone.
+
+        The counters are persisted in ``.quadro/rollups.json`` and kept up to
+        date by every task write, move and delete made through a storage, so
+        reading them only takes a stat of each task file to confirm they are
+        current. They are rebuilt from all tasks, archived ones included
+        unless a task file with the same ID exists, the first time and
+        whenever files were changed by other means, such as hand edits,
+        syncs or snapshot restores.
+
+        Returns
+        -------
+        Rollups
+            The current counters.
+        """
+        self.flush()
+
+        with self._lock:
+            rollups = self._load_rollups()
+            signature = self._rollup_signature() if self.base_path.exists() else 0
+
+            if rollups is None or rollups.signature != signature:
+                rollups = Rollups(signature)
+                file_ids = set()
+                for task in self.iter_tasks():
+                    rollups.add(task)
+                    file_ids.add(task.id)
+                # A task file takes precedence over its archived copy.
+                for archive in self._iter_archives():
+                    archived_ids = [task_id for task_id in archive.ids() if task_id not in file_ids]
+                    for task in archive.iter_tasks(archived_ids):
+                        rollups.add(task, archived=True)
+
+                # The counters are only a cache, so reading a tree that
+                # cannot be written to still works.
+                if self.base_path.exists():
+                    with suppress(OSError):
+                        self._save_rollups(rollups)
+
+            return rollups
+
+    def _load_rollups(self) -> Rollups | None:
+        if self._batch is not None and self._batch.rollups is not None:
+            return self._batch.rollups
+
+        rollups = Rollups.load(self.rollups_path)
+        if self._batch is not None:
+            self._batch.rollups = rollups
+
+        return rollups
+
+    def _save_rollups(self, rollups: Rollups) -> None:
+        """Save the rollup counters, or keep them in memory until the batch ends."""
+        if self._batch is None:
+            self.make_state_dir()
+            rollups.save(self.rollups_path)
+        else:
+            self._batch.rollups = rollups
+            self._batch.rollups_changed = True
+
+    def _discard_rollups(self) -> None:
+        self.rollups_path.unlink(missing_ok=True)
+        if self._batch is not None:
+            self._batch.rollups = None
+            self._batch.rollups_changed = False
+
+    def _track_rollups(
+        self, task_id: int, file_path: Path, task: Task | None, change: Callable[[], object]
+    ) -> None:
+        """Apply a change to a task file and the same change to the rollup counters."""
+        with self._lock:
+            rollups = self._load_rollups()
+
+            if rollups is None:
+                change()
+                return
+
+            old = None
+            if file_path.exists():
+                try:
+                    old = (self._rollup_token(file_path), self._read_task_file(task_id, file_path))
+                except ValueError:
+                    self._discard_rollups()
+                    change()
+                    return
+
+            # An archived copy is counted only while no task file has its ID.
+            shadowing = (old is None) != (task is None)
+            archived = self._archived_copies(task_id) if shadowing else []
+
+            change()
+
+            if old is not None:
+                rollups.replace_token(old[0], None)
+                rollups.remove(old[1])
+            for copy in archived:
+                rollups.add(copy, sign=-1 if old is None else 1, archived=True)
+
+            if task is not None:
+                rollups.replace_token(None, self._rollup_token(file_path))
+                rollups.add(task)
+
+            self._save_rollups(rollups)
+
+    def _archived_copies(self, task_id: int) -> list[Task]:
+        copies = (archive.read_task(task_id) for archive in self._iter_archives())
+        return [task for task in copies if task is not None]
+
     def get_milestones(self) -> list[str]:
+        self.flush()
+
         if not self.base_path.exists():
             return []
 
-        milestones = [item.name for item in self.base_path.iterdir() if item.is_dir()]
+        milestones = [
+            item.name
+            for item in self.base_path.iterdir()
+            if item.is_dir() and not item.name.startswith(".")
+        ]
 
         return sorted(milestones)
 
+    def search(self, tasks: list[Task], query: str) -> list[Task]:
+        """
+        Filter tasks whose title or description contains ``query``.
+
+        Parameters
+        ----------
+        tasks : list[Task]
+            The list of tasks to search.
+        query : str
+            Text to look for, matched case-insensitively.
+
+        Returns
+        -------
+        list[Task]
+            The matching tasks, in their original order.
+        """
+        needle = query.casefold()
+
+        return [
+            task
+            for task in tasks
+            if needle in task.title.casefold() or needle in task.description.casefold()
+        ]
+
     def filter_by_status(self, tasks: list[Task], statuses: list[TaskStatus]) -> list[Task]:
         """
         Filter tasks by status.
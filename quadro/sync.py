@@ -0,0 +1,161 @@
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+
+PUSH = "push"
+PULL = "pull"
+
+
+@dataclass
+class SyncChange:
+    path: str
+    direction: str
+    deleted: bool = False
+
+
+@dataclass
+class SyncReport:
+    changes: list[SyncChange] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.conflicts
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(data, sort_keys=True))
+    temp_path.replace(path)
+
+
+class Manifest:
+    """
+    Content hashes of the task files under a root, keyed by relative path.
+
+    Hashes are cached in a JSON file together with each file's mtime and
+    size, so rebuilding the manifest only reads files that changed since the
+    previous build.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+
+    def build(self, root: Path, files: Iterable[Path]) -> dict[str, str]:
+        """
+        Hash the given files, reusing cached hashes of unchanged files.
+
+        Parameters
+        ----------
+        root : Path
+            Directory the manifest paths are relative to.
+        files : Iterable[Path]
+            The files to include.
+
+        Returns
+        -------
+        dict[str, str]
+            The content hash of every file by POSIX path relative to ``root``.
+        """
+        cache = _read_json(self.cache_path)
+        entries = {}
+        hashes = {}
+
+        for file_path in files:
+            key = file_path.relative_to(root).as_posix()
+            stat = file_path.stat()
+            cached = cache.get(key)
+
+            if cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+                entries[key] = cached
+            else:
+                entries[key] = [stat.st_mtime_ns, stat.st_size, _file_hash(file_path)]
+
+            hashes[key] = entries[key][2]
+
+        if entries != cache:
+            _write_json(self.cache_path, entries)
+
+        return hashes
+
+
+def read_base(path: Path) -> dict[str, str]:
+    """Read the manifest recorded at the end of the previous sync, if any."""
+    return _read_json(path)
+
+
+def write_base(path: Path, manifest: dict[str, str]) -> None:
+    _write_json(path, manifest)
+
+
+def plan(
+    source: dict[str, str], target: dict[str, str], base: dict[str, str]
+) -> tuple[list[SyncChange], list[str], dict[str, str]]:
+    """
+    Compare two manifests against the state both sides had after the last sync.
+
+    A side whose hash still matches the base is unchanged, so the other
+    side's version wins, including deletions. When both sides changed a file
+    differently, or a file was created on both sides with different content,
+    the file is a conflict and neither side is touched.
+
+    Parameters
+    ----------
+    source : dict[str, str]
+        Manifest of the source root.
+    target : dict[str, str]
+        Manifest of the target root.
+    base : dict[str, str]
+        Manifest recorded after the previous sync, empty on the first sync.
+
+    Returns
+    -------
+    tuple[list[SyncChange], list[str], dict[str, str]]
+        The changes to apply, the conflicting paths, and the base to record
+        once the changes are applied.
+    """
+    changes = []
+    conflicts = []
+    new_base = {}
+
+    for path in sorted(source.keys() | target.keys() | base.keys()):
+        source_hash = source.get(path)
+        target_hash = target.get(path)
+        base_hash = base.get(path)
+
+        if source_hash == target_hash:
+            if source_hash is not None:
+                new_base[path] = source_hash
+        elif target_hash == base_hash:
+            changes.append(SyncChange(path, PUSH, deleted=source_hash is None))
+            if source_hash is not None:
+                new_base[path] = source_hash
+        elif source_hash == base_hash:
+            changes.append(SyncChange(path, PULL, deleted=target_hash is None))
+            if target_hash is not None:
+                new_base[path] = target_hash
+        else:
+            conflicts.append(path)
+            if base_hash is not None:
+                new_base[path] = base_hash
+
+    return changes, conflicts, new_base
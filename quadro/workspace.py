@@ -0,0 +1,192 @@
+import threading
+import tomllib
+from collections.abc import Callable
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.storage import TaskStorage
+
+
+WORKSPACE_ENV = "QUADRO_WORKSPACE"
+
+
+@dataclass
+class WorkspaceTask:
+    qualified_id: str
+    root: str
+    task: Task
+
+    @classmethod
+    def from_task(cls, root: str, task: Task) -> "WorkspaceTask":
+        return cls(f"{root}:{task.id}", root, task)
+
+
+class Workspace:
+    """
+    A set of named task directories queried together.
+
+    Every root is scanned concurrently. The tasks of each root, and of each
+    milestone queried in it, are cached together with the root's
+    `TaskStorage.tree_signature`, so a root whose files have not changed is
+    not parsed again by the same instance.
+
+    Examples
+    --------
+    A workspace file lists the roots by name, relative to the file:
+
+    ```toml
+    [roots]
+    api = "../api/tasks"
+    web = "../web/tasks"
+    ```
+
+    >>> workspace = Workspace.from_file(Path("quadro-workspace.toml"))
+    >>> for entry in workspace.list_tasks(statuses=[TaskStatus.TODO]):
+    ...     print(entry.qualified_id, entry.task.title)
+    """
+
+    def __init__(self, roots: Mapping[str, Path], max_workers: int = 16) -> None:
+        self.storages = {name: TaskStorage(path) for name, path in roots.items()}
+        self.max_workers = max_workers
+        self._cache: dict[tuple[str, str | None], tuple[int, list[Task]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "Workspace":
+        """
+        Load a workspace from a TOML file with a ``[roots]`` table.
+
+        Parameters
+        ----------
+        path : Path
+            The workspace file. Relative root paths are resolved against
+            its directory.
+
+        Returns
+        -------
+        Workspace
+            The workspace with one storage per root.
+
+        Raises
+        ------
+        ValueError
+            If the file has no roots or a root path is not a string.
+        """
+        with path.open("rb") as file:
+            data = tomllib.load(file)
+
+        roots = data.get("roots")
+        if not isinstance(roots, dict) or not roots:
+            msg = f"No roots defined in workspace file: {path}"
+            raise ValueError(msg)
+
+        resolved = {}
+        for name, root in roots.items():
+            if not isinstance(root, str):
+                msg = f"Root '{name}' must be a path string in workspace file: {path}"
+                raise ValueError(msg)  # noqa: TRY004
+            resolved[name] = path.parent / root
+
+        return cls(resolved)
+
+    def _root_tasks(self, name: str, milestone: str | None = None) -> list[Task]:
+        storage = self.storages[name]
+        signature = storage.tree_signature()
+        key = (name, milestone)
+
+        with self._lock:
+            cached = self._cache.get(key)
+
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # Archived tasks are only loaded for a given milestone, as for a single root.
+        tasks = storage.load_all_tasks(milestone=milestone)
+
+        with self._lock:
+            self._cache[key] = (signature, tasks)
+
+        return tasks
+
+    def _query(
+        self,
+        select: Callable[[TaskStorage, list[Task]], list[Task]],
+        milestone: str | None = None,
+    ) -> list[WorkspaceTask]:
+        def run(name: str) -> list[WorkspaceTask]:
+            tasks = select(self.storages[name], self._root_tasks(name, milestone))
+            return [WorkspaceTask.from_task(name, task) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(run, sorted(self.storages))
+
+        return [entry for entries in results for entry in entries]
+
+    def list_tasks(
+        self,
+        milestone: str | None = None,
+        statuses: list[TaskStatus] | None = None,
+    ) -> list[WorkspaceTask]:
+        """
+        List tasks of every root, ordered by root name and then by ID.
+
+        Parameters
+        ----------
+        milestone : str | None, optional
+            Only include tasks of this milestone, by default None.
+        statuses : list[TaskStatus] | None, optional
+            Only include tasks with one of these statuses, by default None.
+
+        Returns
+        -------
+        list[WorkspaceTask]
+            The matching tasks with the root they belong to.
+        """
+        return self._query(lambda storage, tasks: _filter(storage, tasks, statuses), milestone)
+
+    def list_milestones(self) -> list[WorkspaceTask]:
+        """List the tasks of every root that belong to a milestone."""
+        return self._query(lambda _, tasks: [task for task in tasks if task.milestone is not None])
+
+    def search(
+        self,
+        query: str,
+        milestone: str | None = None,
+        statuses: list[TaskStatus] | None = None,
+    ) -> list[WorkspaceTask]:
+        """
+        Find tasks of every root whose title or description contains ``query``.
+
+        Parameters
+        ----------
+        query : str
+            Text to look for, matched case-insensitively.
+        milestone : str | None, optional
+            Only search tasks of this milestone, by default None.
+        statuses : list[TaskStatus] | None, optional
+            Only search tasks with one of these statuses, by default None.
+
+        Returns
+        -------
+        list[WorkspaceTask]
+            The matching tasks with the root they belong to.
+        """
+        return self._query(
+            lambda storage, tasks: storage.search(_filter(storage, tasks, statuses), query),
+            milestone,
+        )
+
+
+def _filter(
+    storage: TaskStorage,
+    tasks: list[Task],
+    statuses: list[TaskStatus] | None,
+) -> list[Task]:
+    if statuses:
+        tasks = storage.filter_by_status(tasks, statuses)
+
+    return tasks
@@ -0,0 +1,133 @@
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import complete_task
+from quadro.command import delete_task
+from quadro.command import list_tasks
+from quadro.command import move_task
+from quadro.command import show_task
+from quadro.command import start_task
+from quadro.command import unarchive_milestone
+from quadro.command import update_task
+from quadro.exceptions import MilestoneNotFoundError
+from quadro.exceptions import TaskArchivedError
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestArchiveMilestone:
+    def test_archive_milestone_valid(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="v1")
+            add_task("Task 2")
+
+            count, path = archive_milestone("v1")
+
+            assert count == 1
+            assert str(path) == "tasks/.quadro/archive/v1.zip"
+            assert [task.id for task in list_tasks()] == [2]
+            assert [task.id for task in list_tasks(milestone="v1")] == [1]
+            assert show_task(1).title == "Task 1"
+
+    def test_archive_milestone_not_found(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            pytest.raises(MilestoneNotFoundError, match="has no tasks to archive"),
+        ):
+            archive_milestone("v1")
+
+    def test_unarchive_milestone(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="v1")
+            archive_milestone("v1")
+
+            assert unarchive_milestone("v1") == 1
+            assert [task.id for task in list_tasks()] == [1]
+
+    def test_archived_task_cannot_be_changed(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="v1")
+            archive_milestone("v1")
+
+            for change in (
+                lambda: start_task(1),
+                lambda: complete_task(1),
+                lambda: update_task(1, title="Renamed"),
+                lambda: move_task(1, "root"),
+                lambda: delete_task(1),
+                lambda: show_task(1, archived=False),
+            ):
+                with pytest.raises(
+                    TaskArchivedError, match=r"Task #1 is archived; unarchive milestone 'v1' first"
+                ):
+                    change()
+
+            assert list_tasks() == []
+            assert show_task(1).title == "Task 1"
+
+
+class TestArchiveCommandCLI:
+    def test_archive_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "--milestone", "v1"])
+
+            result = runner.invoke(main, ["archive", "v1"])
+
+            assert result.exit_code == 0
+            assert result.output == (
+                "✓ Archived 1 tasks from v1\nArchive: tasks/.quadro/archive/v1.zip\n"
+            )
+
+    def test_archive_command_not_found(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["archive", "v1"])
+
+            assert result.exit_code == 1
+            assert result.output == "✗ Milestone 'v1' has no tasks to archive\n"
+
+    def test_show_archived_task(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "--milestone", "v1"])
+            runner.invoke(main, ["archive", "v1"])
+
+            result = runner.invoke(main, ["show", "1"])
+
+            assert result.exit_code == 0
+            assert "Task 1" in result.output
+
+    @pytest.mark.parametrize(
+        "args",
+        [["start", "1"], ["done", "1"], ["move", "1", "--to", "root"], ["delete", "1"]],
+    )
+    def test_archived_task_command_fails(self, runner: CliRunner, args: list[str]) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "--milestone", "v1"])
+            runner.invoke(main, ["archive", "v1"])
+
+            result = runner.invoke(main, args)
+
+            assert result.exit_code == 1
+            assert result.output == "✗ Task #1 is archived; unarchive milestone 'v1' first\n"
+
+    def test_unarchive_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "--milestone", "v1"])
+            runner.invoke(main, ["archive", "v1"])
+
+            result = runner.invoke(main, ["unarchive", "v1"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Restored 1 tasks to v1\n"
+
+    def test_unarchive_command_not_archived(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["unarchive", "v1"])
+
+            assert result.exit_code == 1
+            assert result.output == "✗ Milestone 'v1' is not archived\n"
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestBatchCommandCLI:
+    def test_batch_command_runs_lines_from_stdin(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            script = 'add "Fix login" --milestone mvp\n# then\nadd Two\ndone 1\n'
+            result = runner.invoke(main, ["batch"], input=script)
+
+            assert result.exit_code == 0
+            assert "✓ Created task #1" in result.output
+            assert "✓ Created task #2" in result.output
+            assert "✓ Completed task #1: Fix login" in result.output
+            assert "✓ Ran 3 commands" in result.output
+            assert Path("tasks/mvp/1.md").exists()
+
+    def test_batch_command_runs_lines_from_file(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            Path("changes.txt").write_text("quadro add One\nquadro add Two\n")
+            result = runner.invoke(main, ["batch", "changes.txt"])
+
+            assert result.exit_code == 0
+            assert "✓ Ran 2 commands" in result.output
+            assert Path("tasks/2.md").exists()
+
+    def test_batch_command_reports_failed_lines(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["batch"], input="add One\ndone 9\nstart 1\n")
+
+            assert result.exit_code == 1
+            assert "✗ Line 2 failed with status 1: done 9" in result.output
+            assert "✗ 1 of 3 commands failed" in result.output
+            assert "status: progress" in Path("tasks/1.md").read_text()
+
+    def test_batch_command_fail_fast(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["batch", "--fail-fast"], input="done 9\nadd One\n")
+
+            assert result.exit_code == 1
+            assert "✗ 1 of 1 commands failed" in result.output
+            assert not Path("tasks/1.md").exists()
+
+    def test_batch_command_checks_script_before_running(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["batch"], input="add One\nshell\n")
+
+            assert result.exit_code == 1
+            assert "Line 2: 'shell' is not available in a batch" in result.output
+            assert not Path("tasks").exists()
@@ -0,0 +1,66 @@
+import pytest
+from click.testing import CliRunner
+from freezegun import freeze_time
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import complete_task
+from quadro.command import milestone_burndown
+from quadro.exceptions import MilestoneNotFoundError
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestMilestoneBurndown:
+    def test_milestone_burndown(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            with freeze_time("2025-10-01 12:00:00"):
+                add_task("Task 1", milestone="mvp")
+                add_task("Task 2", milestone="mvp")
+                add_task("Task 3", milestone="beta")
+            with freeze_time("2025-10-02 12:00:00"):
+                complete_task(1)
+
+            with freeze_time("2025-10-04 12:00:00"):
+                points = milestone_burndown("mvp")
+
+            assert [(p.day.isoformat(), p.scope, p.done) for p in points] == [
+                ("2025-10-01", 2, 0),
+                ("2025-10-02", 2, 1),
+                ("2025-10-03", 2, 1),
+                ("2025-10-04", 2, 1),
+            ]
+
+    def test_milestone_burndown_raises_for_unknown_milestone(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+
+            with pytest.raises(MilestoneNotFoundError, match="has no tasks"):
+                milestone_burndown("beta")
+
+
+class TestBurndownCommandCLI:
+    def test_burndown_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            with freeze_time("2025-10-01 12:00:00"):
+                add_task("Task 1", milestone="mvp")
+                add_task("Task 2", milestone="mvp")
+            with freeze_time("2025-10-03 12:00:00"):
+                complete_task(1)
+                result = runner.invoke(main, ["burndown", "mvp", "--days", "2"])
+
+            assert result.exit_code == 0
+            assert "Burndown: mvp" in result.output
+            assert "2025-10-01" not in result.output
+            assert "2025-10-02" in result.output
+            assert "2025-10-03" in result.output
+
+    def test_burndown_command_for_unknown_milestone(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["burndown", "mvp"])
+
+            assert result.exit_code == 1
+            assert "has no tasks" in result.output
@@ -0,0 +1,61 @@
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.daemon import TaskDaemon
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestDaemonCommandCLI:
+    def test_daemon_command_listens_and_stops_on_interrupt(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            patch("quadro.daemon.TaskDaemon.serve_forever", side_effect=KeyboardInterrupt),
+        ):
+            result = runner.invoke(main, ["daemon"])
+
+            assert result.exit_code == 0
+            assert "✓ Daemon listening on tasks/.quadro/daemon.sock" in result.output
+            assert "! Daemon stopped" in result.output
+            assert not Path("tasks/.quadro/daemon.sock").exists()
+
+    def test_daemon_command_refuses_second_daemon(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            server = TaskDaemon(TaskStorage())
+            try:
+                result = runner.invoke(main, ["daemon"])
+            finally:
+                server.server_close()
+
+            assert result.exit_code == 1
+            assert "✗ A daemon is already running on tasks/.quadro/daemon.sock" in result.output
+
+    def test_daemon_command_stop(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            server = TaskDaemon(TaskStorage())
+            thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+            thread.start()
+
+            result = runner.invoke(main, ["daemon", "--stop"])
+
+            thread.join(timeout=5)
+            server.server_close()
+            assert result.exit_code == 0
+            assert "✓ Stopped daemon on tasks/.quadro/daemon.sock" in result.output
+            assert not thread.is_alive()
+
+    def test_daemon_command_stop_without_daemon(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["daemon", "--stop"])
+
+            assert result.exit_code == 0
+            assert "! No daemon running" in result.output
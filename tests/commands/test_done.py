@@ -30,6 +30,22 @@ class TestCompleteTask:
             assert task.title == "Test task"
             assert task.completed is not None
 
+    def test_complete_task_preserves_hand_written_formatting(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            task_path = Path("tasks/1.md")
+            task_path.parent.mkdir()
+            task_path.write_text(
+                "---\nstatus: todo  # triaged\ncreated: 2025-10-03T09:00:00\n---\n\n"
+                "# Test task\n\n*   Keep   this\n"
+            )
+
+            complete_task(1)
+
+            content = task_path.read_text()
+            assert content.startswith("---\ncompleted: '")
+            assert "\nstatus: done\ncreated: 2025-10-03T09:00:00\n" in content
+            assert content.endswith("---\n\n# Test task\n\n*   Keep   this\n")
+
     def test_complete_task_not_found(self, runner: CliRunner) -> None:
         with (
             runner.isolated_filesystem(),
@@ -0,0 +1,75 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from freezegun import freeze_time
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import export_tasks
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestExportTasks:
+    def test_export_tasks_ndjson(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+            output = StringIO()
+
+            count = export_tasks(output)
+
+            assert count == 2
+            records = [json.loads(line) for line in output.getvalue().splitlines()]
+            assert [record["title"] for record in records] == ["Task 1", "Task 2"]
+
+    def test_export_tasks_by_milestone(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+            output = StringIO()
+
+            assert export_tasks(output, milestone="mvp") == 1
+
+    def test_export_tasks_empty(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            output = StringIO()
+
+            assert export_tasks(output) == 0
+            assert output.getvalue() == ""
+
+
+class TestExportCommandCLI:
+    @freeze_time("2025-10-06 12:00:00")
+    def test_export_command_to_stdout(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+
+            result = runner.invoke(main, ["export"])
+
+            assert result.exit_code == 0
+            assert json.loads(result.output) == {
+                "id": 1,
+                "title": "Task 1",
+                "description": "",
+                "status": "todo",
+                "milestone": None,
+                "created": "2025-10-06T12:00:00+00:00",
+                "completed": None,
+            }
+
+    def test_export_command_csv_to_file(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+
+            result = runner.invoke(main, ["export", "--format", "csv", "-o", "out.csv"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Exported 1 tasks to out.csv\n"
+            assert Path("out.csv").read_text().startswith("id,title,description,status")
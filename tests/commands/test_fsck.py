@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import check_tasks
+from quadro.command import milestone_counts
+from quadro.models import TaskStatus
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestCheckTasks:
+    def test_check_tasks_no_issues(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+            add_task("Task 2", milestone="mvp")
+
+            report = check_tasks()
+
+            assert report.ok
+            assert report.checked == 2
+
+    def test_check_tasks_reports_issues(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            Path("tasks/mvp/1.md").rename("tasks/1.md")
+
+            report = check_tasks()
+
+            assert not report.ok
+            assert report.issues[0].path == Path("tasks/1.md")
+
+
+class TestFsckCommandCLI:
+    def test_fsck_command_no_issues(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+
+            result = runner.invoke(main, ["fsck"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Checked 1 tasks, no issues found\n"
+
+    def test_fsck_command_with_issues(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+            Path("tasks/2.md").write_text("not a task")
+
+            result = runner.invoke(main, ["fsck"])
+
+            assert result.exit_code == 1
+            assert "✗ tasks/2.md: Cannot parse task" in result.output
+            assert "Checked 2 tasks • 1 issues" in result.output
+
+    def test_fsck_command_rebuilds_corrupted_rollups(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "--milestone", "mvp"])
+            runner.invoke(main, ["milestones"])
+            rollups_path = Path("tasks/.quadro/rollups.json")
+            data = json.loads(rollups_path.read_text())
+            data["statuses"] = {"mvp": {"done": 7}}
+            rollups_path.write_text(json.dumps(data))
+
+            result = runner.invoke(main, ["fsck"])
+
+            assert result.exit_code == 0
+            assert milestone_counts()["mvp"][TaskStatus.DONE] == 0
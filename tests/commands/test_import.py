@@ -0,0 +1,133 @@
+from io import StringIO
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quadro import command
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import import_tasks
+from quadro.command import list_tasks
+from quadro.models import TaskStatus
+from quadro.rollup import Rollups
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestImportTasks:
+    def test_import_tasks_allocates_ids_after_existing(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Existing")
+            source = StringIO(
+                dedent("""\
+                    {"id": 1, "title": "Imported 1", "milestone": "mvp"}
+                    {"title": "Imported 2", "status": "done"}
+                """)
+            )
+
+            count = import_tasks(source)
+
+            tasks = list_tasks()
+            assert count == 2
+            assert [(task.id, task.title) for task in tasks] == [
+                (1, "Existing"),
+                (2, "Imported 1"),
+                (3, "Imported 2"),
+            ]
+            assert tasks[1].milestone == "mvp"
+            assert tasks[2].status == TaskStatus.DONE
+            assert tasks[2].completed is not None
+
+    def test_import_tasks_csv(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            source = StringIO("title,milestone,status\nTask A,mvp,progress\nTask B,,\n")
+
+            assert import_tasks(source, fmt="csv") == 2
+
+            tasks = list_tasks()
+            assert [(task.title, task.milestone, task.status) for task in tasks] == [
+                ("Task A", "mvp", TaskStatus.PROGRESS),
+                ("Task B", None, TaskStatus.TODO),
+            ]
+
+    def test_import_tasks_in_batches(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(command, "IMPORT_BATCH_SIZE", 2)
+
+        with runner.isolated_filesystem():
+            source = StringIO("".join(f'{{"title": "Task {i}"}}\n' for i in range(5)))
+
+            assert import_tasks(source) == 5
+            assert [task.id for task in list_tasks()] == [1, 2, 3, 4, 5]
+
+    def test_import_tasks_saves_rollups_once(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            storage = TaskStorage()
+            add_task("Existing", milestone="mvp", storage=storage)
+            storage.rollups()
+            source = StringIO(
+                "".join(f'{{"title": "Task {i}", "milestone": "mvp"}}\n' for i in range(5))
+            )
+
+            with patch.object(Rollups, "save", autospec=True, side_effect=Rollups.save) as save:
+                assert import_tasks(source, storage=storage) == 5
+
+            assert save.call_count == 1
+            assert TaskStorage().rollups().statuses == {"mvp": {"todo": 6}}
+
+    def test_import_tasks_invalid_record(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            source = StringIO('{"title": "Task 1"}\n{"title": "Task 2", "status": "bogus"}\n')
+
+            with pytest.raises(ValueError, match="Invalid record #2"):
+                import_tasks(source)
+
+
+class TestImportCommandCLI:
+    def test_import_command_from_file(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            Path("backlog.csv").write_text("title\nTask 1\nTask 2\n")
+
+            result = runner.invoke(main, ["import", "backlog.csv"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Imported 2 tasks\n"
+            assert len(list_tasks()) == 2
+
+    def test_import_command_from_stdin(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["import"], input='{"title": "Task 1"}\n')
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Imported 1 tasks\n"
+
+    def test_import_command_invalid_data(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["import"], input="not json\n")
+
+            assert result.exit_code == 1
+            assert "✗ Invalid data" in result.output
+            assert "Invalid JSON on line 1" in result.output
+
+    def test_export_import_round_trip(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1", "-d", "Details", "--milestone", "mvp"])
+            runner.invoke(main, ["done", "1"])
+            exported = runner.invoke(main, ["export"]).output
+            runner.invoke(main, ["delete", "1", "--yes"])
+
+            runner.invoke(main, ["import"], input=exported)
+
+            task = list_tasks()[0]
+            assert (task.title, task.description, task.milestone) == ("Task 1", "Details", "mvp")
+            assert task.status == TaskStatus.DONE
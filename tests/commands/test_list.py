@@ -1,5 +1,8 @@
+import json
+import sys
 from datetime import UTC
 from datetime import datetime
+from pathlib import Path
 from textwrap import dedent
 from unittest.mock import patch
 
@@ -88,7 +91,7 @@ class TestListCommandCLI:
             runner.invoke(main, ["add", "Task 2"])
             runner.invoke(main, ["add", "Task 3", "--milestone", "mvp"])
 
-            result = runner.invoke(main, ["list"])
+            result = runner.invoke(main, ["list", "--format", "table"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━┓
@@ -105,13 +108,87 @@ class TestListCommandCLI:
             assert result.exit_code == 0
             assert result.output.strip() == expected.strip()
 
+    def test_list_command_writes_plain_lines_when_piped(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            result = runner.invoke(main, ["list"])
+
+            assert result.exit_code == 0
+            assert result.output == "1 todo mvp Task 1\n2 todo - Task 2\n"
+
+    def test_list_command_lines_come_from_task_table(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            with patch("quadro.storage.TaskStorage.load_all_tasks") as load_all_tasks:
+                result = runner.invoke(main, ["list", "--todo", "--format", "plain"])
+
+            assert result.exit_code == 0
+            assert result.output == "1 todo mvp Task 1\n2 todo - Task 2\n"
+            load_all_tasks.assert_not_called()
+
+    def test_list_command_with_tsv_format(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task\t1", milestone="mvp")
+            add_task("Task 2")
+
+            result = runner.invoke(main, ["list", "--format", "tsv"])
+
+            assert result.exit_code == 0
+            assert result.output == (
+                "id\tstatus\tmilestone\ttitle\n1\ttodo\tmvp\tTask\\t1\n2\ttodo\t\tTask 2\n"
+            )
+
+    def test_list_command_with_json_format(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            result = runner.invoke(main, ["list", "--format", "json", "--milestone", "mvp"])
+
+            assert result.exit_code == 0
+            records = json.loads(result.output)
+            assert [(record["id"], record["title"]) for record in records] == [(1, "Task 1")]
+
+    def test_list_command_with_json_format_and_no_tasks(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["list", "--format", "json"])
+
+            assert result.exit_code == 0
+            assert result.stdout == "[]\n"
+            assert "No tasks found" in result.stderr
+
+    def test_list_command_with_pager(self, runner: CliRunner, tmp_path: Path) -> None:
+        paged = tmp_path / "paged.txt"
+        script = tmp_path / "pager.py"
+        script.write_text(
+            f"import shutil, sys\nshutil.copyfileobj(sys.stdin, open({str(paged)!r}, 'w'))\n"
+        )
+
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+
+            result = runner.invoke(
+                main,
+                ["list", "--pager", "--format", "table"],
+                env={"PAGER": f"{sys.executable} {script}"},
+            )
+
+            assert result.exit_code == 0
+            assert result.output == ""
+            assert "│ -         │ 1  │ Task 1 │ ○ todo │" in paged.read_text()
+            assert "1 tasks" in paged.read_text()
+
     def test_list_command_with_milestone_filter(self, runner: CliRunner) -> None:
         with runner.isolated_filesystem():
             runner.invoke(main, ["add", "Task 1", "--milestone", "mvp"])
             runner.invoke(main, ["add", "Task 2"])
             runner.invoke(main, ["add", "Task 3", "--milestone", "mvp"])
 
-            result = runner.invoke(main, ["list", "--milestone", "mvp"])
+            result = runner.invoke(main, ["list", "--format", "table", "--milestone", "mvp"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━┓
@@ -130,7 +207,7 @@ class TestListCommandCLI:
     def test_list_command_permission_error(self, runner: CliRunner) -> None:
         with (
             runner.isolated_filesystem(),
-            patch("quadro.storage.TaskStorage.load_all_tasks") as mock_load,
+            patch("quadro.storage.TaskStorage.iter_tasks") as mock_load,
         ):
             perm_error = PermissionError("tasks")
             perm_error.filename = "tasks"
@@ -152,7 +229,7 @@ class TestListCommandCLI:
             runner.invoke(main, ["start", "2"])
             runner.invoke(main, ["done", "3"])
 
-            result = runner.invoke(main, ["list", "--todo"])
+            result = runner.invoke(main, ["list", "--format", "table", "--todo"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━┓
@@ -175,7 +252,7 @@ class TestListCommandCLI:
             runner.invoke(main, ["start", "2"])
             runner.invoke(main, ["done", "3"])
 
-            result = runner.invoke(main, ["list", "--progress"])
+            result = runner.invoke(main, ["list", "--format", "table", "--progress"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━━━━━┓
@@ -198,7 +275,7 @@ class TestListCommandCLI:
             runner.invoke(main, ["start", "2"])
             runner.invoke(main, ["done", "3"])
 
-            result = runner.invoke(main, ["list", "--done"])
+            result = runner.invoke(main, ["list", "--format", "table", "--done"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━┓
@@ -222,7 +299,7 @@ class TestListCommandCLI:
             runner.invoke(main, ["start", "2"])
             runner.invoke(main, ["done", "3"])
 
-            result = runner.invoke(main, ["list", "--todo", "--progress"])
+            result = runner.invoke(main, ["list", "--format", "table", "--todo", "--progress"])
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━━━━━┓
@@ -247,7 +324,9 @@ class TestListCommandCLI:
             runner.invoke(main, ["start", "1"])
             runner.invoke(main, ["done", "2"])
 
-            result = runner.invoke(main, ["list", "--done", "--milestone", "mvp"])
+            result = runner.invoke(
+                main, ["list", "--format", "table", "--done", "--milestone", "mvp"]
+            )
 
             expected = dedent("""
                 ┏━━━━━━━━━━━┳━━━━┳━━━━━━━━┳━━━━━━━━┓
@@ -9,7 +9,11 @@ from freezegun import freeze_time
 
 from quadro.cli import main
 from quadro.command import add_task
+from quadro.command import complete_task
 from quadro.command import list_milestones
+from quadro.command import milestone_counts
+from quadro.command import move_task
+from quadro.command import start_task
 from quadro.exceptions import TaskNotFoundError
 from quadro.models import Task
 from quadro.models import TaskStatus
@@ -66,6 +70,36 @@ class TestListMilestones:
             )
 
 
+class TestMilestoneCounts:
+    def test_milestone_counts_no_tasks(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            pytest.raises(TaskNotFoundError, match="No tasks found"),
+        ):
+            milestone_counts()
+
+    def test_milestone_counts_no_milestones(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task without milestone")
+
+            assert milestone_counts() == {}
+
+    def test_milestone_counts_follow_mutations(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="v2.0")
+            add_task("Task 2", milestone="mvp")
+            add_task("Task 3", milestone="mvp")
+            assert list(milestone_counts()) == ["mvp", "v2.0"]
+
+            start_task(2)
+            complete_task(3)
+            move_task(1, "mvp")
+
+            assert milestone_counts() == {
+                "mvp": {TaskStatus.TODO: 1, TaskStatus.PROGRESS: 1, TaskStatus.DONE: 1}
+            }
+
+
 class TestMilestonesCommandCLI:
     def test_milestones_command_with_no_tasks(self, runner: CliRunner) -> None:
         with runner.isolated_filesystem():
@@ -107,7 +141,7 @@ class TestMilestonesCommandCLI:
     def test_milestones_command_permission_error(self, runner: CliRunner) -> None:
         with (
             runner.isolated_filesystem(),
-            patch("quadro.storage.TaskStorage.load_all_tasks") as mock_load,
+            patch("quadro.storage.TaskStorage.rollups") as mock_load,
         ):
             mock_load.side_effect = PermissionError("tasks")
             result = runner.invoke(main, ["milestones"])
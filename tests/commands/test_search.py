@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import complete_task
+from quadro.command import search_tasks
+from quadro.models import TaskStatus
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+def write_workspace() -> None:
+    add_task("Login endpoint", milestone="mvp", storage=TaskStorage(Path("api/tasks")))
+    add_task("Login page", storage=TaskStorage(Path("web/tasks")))
+    Path("workspace.toml").write_text('[roots]\napi = "api/tasks"\nweb = "web/tasks"\n')
+
+
+class TestSearchTasks:
+    def test_search_tasks_matches_title(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Implement login")
+            add_task("Write docs")
+
+            tasks = search_tasks("LOGIN")
+
+            assert [task.id for task in tasks] == [1]
+
+    def test_search_tasks_matches_description(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", "Uses a rate limiter")
+            add_task("Task 2")
+
+            tasks = search_tasks("rate limit")
+
+            assert [task.id for task in tasks] == [1]
+
+    def test_search_tasks_applies_filters(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Login API", milestone="mvp")
+            add_task("Login page", milestone="mvp")
+            add_task("Login audit")
+            complete_task(2)
+
+            tasks = search_tasks("login", milestone="mvp", statuses=[TaskStatus.TODO])
+
+            assert [task.id for task in tasks] == [1]
+
+    def test_search_tasks_returns_empty_when_nothing_matches(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+
+            assert search_tasks("missing") == []
+
+
+class TestSearchCommandCLI:
+    def test_search_command_lists_matches(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Implement login")
+            add_task("Write docs")
+
+            result = runner.invoke(main, ["search", "login", "--format", "table"])
+
+            assert result.exit_code == 0
+            assert "Implement login" in result.output
+            assert "Write docs" not in result.output
+            assert "1 tasks" in result.output
+
+    def test_search_command_with_no_matches(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Write docs")
+
+            result = runner.invoke(main, ["search", "login"])
+
+            assert result.exit_code == 0
+            assert "No tasks matching 'login' found" in result.output
+
+    def test_search_command_with_workspace(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            write_workspace()
+
+            result = runner.invoke(
+                main, ["search", "login", "--workspace", "workspace.toml", "--format", "table"]
+            )
+
+            assert result.exit_code == 0
+            assert "api:1" in result.output
+            assert "web:1" in result.output
+            assert "2 tasks" in result.output
+
+    def test_search_command_with_workspace_as_json(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            write_workspace()
+
+            result = runner.invoke(
+                main, ["search", "login", "--workspace", "workspace.toml", "--format", "json"]
+            )
+
+            assert result.exit_code == 0
+            assert [record["id"] for record in json.loads(result.output)] == ["api:1", "web:1"]
+
+    def test_list_command_with_workspace_env(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            write_workspace()
+
+            result = runner.invoke(
+                main, ["list", "--milestone", "mvp"], env={"QUADRO_WORKSPACE": "workspace.toml"}
+            )
+
+            assert result.exit_code == 0
+            assert "api:1" in result.output
+            assert "web:1" not in result.output
+
+    def test_milestones_command_with_workspace(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            write_workspace()
+
+            result = runner.invoke(main, ["milestones", "--workspace", "workspace.toml"])
+
+            assert result.exit_code == 0
+            assert "api:mvp" in result.output
+
+    def test_list_command_with_invalid_workspace(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            Path("workspace.toml").write_text("")
+
+            result = runner.invoke(main, ["list", "--workspace", "workspace.toml"])
+
+            assert result.exit_code == 1
+            assert "No roots defined in workspace file" in result.output
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestServeCommandCLI:
+    def test_serve_command_prints_address_and_stops_on_interrupt(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            patch("quadro.server.TaskServer.serve_forever", side_effect=KeyboardInterrupt),
+        ):
+            result = runner.invoke(main, ["serve", "--port", "0"])
+
+            assert result.exit_code == 0
+            assert "✓ Serving tasks on http://127.0.0.1:" in result.output
+            assert "! Server stopped" in result.output
+
+    def test_serve_command_with_port_in_use(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            patch("quadro.server.TaskServer.server_bind", side_effect=OSError("Address in use")),
+        ):
+            result = runner.invoke(main, ["serve"])
+
+            assert result.exit_code == 1
+            assert "Address in use" in result.output
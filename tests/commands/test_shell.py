@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestShellCommandCLI:
+    def test_shell_command_runs_lines_from_input(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["shell"], input="add Task\ndone 1\nexit\n")
+
+            assert result.exit_code == 0
+            assert "✓ Created task #1" in result.output
+            assert "✓ Completed task #1: Task" in result.output
+            assert Path("tasks/1.md").exists()
+
+    def test_shell_command_exits_at_end_of_input(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["shell"], input="list\n")
+
+            assert result.exit_code == 0
+            assert result.output.rstrip().endswith("quadro>")
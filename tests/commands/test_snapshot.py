@@ -0,0 +1,100 @@
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import create_snapshot
+from quadro.command import list_snapshots
+from quadro.command import list_tasks
+from quadro.command import restore_snapshot
+from quadro.command import update_task
+from quadro.exceptions import SnapshotNotFoundError
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestSnapshot:
+    def test_create_and_restore_snapshot(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+
+            assert create_snapshot("before") == ("before", 1)
+
+            update_task(1, title="Changed")
+            add_task("Task 2")
+
+            assert restore_snapshot("before") == 1
+            assert [task.title for task in list_tasks()] == ["Task 1"]
+            assert list_snapshots() == ["before"]
+
+    def test_restore_snapshot_not_found(self, runner: CliRunner) -> None:
+        with (
+            runner.isolated_filesystem(),
+            pytest.raises(SnapshotNotFoundError, match="Snapshot 'missing' not found"),
+        ):
+            restore_snapshot("missing")
+
+
+class TestSnapshotCommandCLI:
+    def test_snapshot_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+
+            result = runner.invoke(main, ["snapshot", "before"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Created snapshot before (1 files)\n"
+
+    def test_snapshot_command_already_exists(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["snapshot", "before"])
+
+            result = runner.invoke(main, ["snapshot", "before"])
+
+            assert result.exit_code == 1
+            assert result.output == "✗ Snapshot 'before' already exists\n"
+
+    def test_snapshot_command_list(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            empty = runner.invoke(main, ["snapshot", "--list"])
+            runner.invoke(main, ["snapshot", "a"])
+            runner.invoke(main, ["snapshot", "b"])
+
+            result = runner.invoke(main, ["snapshot", "--list"])
+
+            assert empty.output == "No snapshots found. Create one with 'quadro snapshot'\n"
+            assert result.output == "a\nb\n"
+
+    def test_restore_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+            runner.invoke(main, ["snapshot", "before"])
+            runner.invoke(main, ["add", "Task 2"])
+
+            result = runner.invoke(main, ["restore", "before", "--yes"])
+
+            assert result.exit_code == 0
+            assert result.output == "✓ Restored snapshot before (1 files)\n"
+            assert len(list_tasks()) == 1
+
+    def test_restore_command_cancelled(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            runner.invoke(main, ["add", "Task 1"])
+            runner.invoke(main, ["snapshot", "before"])
+            runner.invoke(main, ["add", "Task 2"])
+
+            result = runner.invoke(main, ["restore", "before"], input="n\n")
+
+            assert result.exit_code == 0
+            assert "Restore cancelled" in result.output
+            assert len(list_tasks()) == 2
+
+    def test_restore_command_not_found(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["restore", "missing", "--yes"])
+
+            assert result.exit_code == 1
+            assert result.output == "✗ Snapshot 'missing' not found\n"
@@ -0,0 +1,76 @@
+import pytest
+from click.testing import CliRunner
+from freezegun import freeze_time
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import complete_task
+from quadro.command import task_stats
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestTaskStats:
+    def test_task_stats(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            with freeze_time("2025-10-01 12:00:00"):
+                add_task("Task 1", milestone="mvp")
+                add_task("Task 2", milestone="mvp")
+                add_task("Task 3")
+            with freeze_time("2025-10-03 12:00:00"):
+                complete_task(1)
+
+            with freeze_time("2025-10-08 12:00:00"):
+                stats = task_stats(weeks=2)
+
+            assert stats.lead_time.count == 1
+            assert stats.lead_time.mean == pytest.approx(2.0)
+            assert [week.completed for week in stats.throughput] == [1, 0]
+            assert stats.aging["mvp"].mean == pytest.approx(7.0)
+            assert list(stats.aging) == ["-", "mvp"]
+
+    def test_task_stats_with_milestone(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            stats = task_stats(milestone="mvp")
+
+            assert list(stats.aging) == ["mvp"]
+
+    def test_task_stats_rejects_non_positive_weeks(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem(), pytest.raises(ValueError, match="must be positive"):
+            task_stats(weeks=0)
+
+
+class TestStatsCommandCLI:
+    @freeze_time("2025-10-08 12:00:00")
+    def test_stats_command(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            complete_task(1)
+            add_task("Task 2", milestone="mvp")
+
+            result = runner.invoke(main, ["stats", "--weeks", "2"])
+
+            assert result.exit_code == 0
+            assert "Lead time" in result.output
+            assert "Age of open (mvp)" in result.output
+            assert "Completed per week" in result.output
+            assert "2025-10-06" in result.output
+
+    def test_stats_command_without_tasks(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["stats"])
+
+            assert result.exit_code == 0
+            assert "Completed per week" in result.output
+
+    def test_stats_command_rejects_zero_weeks(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, ["stats", "--weeks", "0"])
+
+            assert result.exit_code == 2
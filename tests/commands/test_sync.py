@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from quadro.cli import main
+from quadro.command import add_task
+from quadro.command import sync_tasks
+from quadro.command import update_task
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestSyncTasks:
+    def test_sync_tasks_with_target(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+            Path("mirror").mkdir()
+
+            report = sync_tasks(Path("mirror"))
+
+            assert report.ok
+            task = TaskStorage(Path("mirror")).load_task(1)
+            assert task is not None
+            assert task.title == "Task 1"
+
+    def test_sync_tasks_raises_for_missing_directory(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+
+            with pytest.raises(FileNotFoundError, match="Tasks directory not found"):
+                sync_tasks(Path("missing"))
+
+
+class TestSyncCommandCLI:
+    def test_sync_command_lists_changes(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            mirror = TaskStorage(Path("mirror"))
+            add_task("Task 2", storage=mirror)
+
+            result = runner.invoke(main, ["sync", "tasks", "mirror"])
+
+            assert result.exit_code == 0
+            assert "← 1.md" in result.output
+            assert "→ mvp/1.md" in result.output
+            assert "✓ Synced 2 files" in result.output
+
+    def test_sync_command_dry_run(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+            Path("mirror").mkdir()
+
+            result = runner.invoke(main, ["sync", "tasks", "mirror", "--dry-run"])
+
+            assert result.exit_code == 0
+            assert "Dry run, no files changed" in result.output
+            assert "→ 1.md" in result.output
+            assert not Path("mirror/1.md").exists()
+
+    def test_sync_command_with_conflict(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+            Path("mirror").mkdir()
+            runner.invoke(main, ["sync", "tasks", "mirror"])
+            update_task(1, title="Here")
+            update_task(1, title="There", storage=TaskStorage(Path("mirror")))
+
+            result = runner.invoke(main, ["sync", "tasks", "mirror"])
+
+            assert result.exit_code == 1
+            assert "✗ 1.md: changed on both sides" in result.output
+            assert "0 files • 1 conflicts" in result.output
+
+    def test_sync_command_with_missing_target(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1")
+
+            result = runner.invoke(main, ["sync", "tasks", "missing"])
+
+            assert result.exit_code == 2
+            assert "does not exist" in result.output
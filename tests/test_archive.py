@@ -0,0 +1,58 @@
+import zipfile
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+from quadro.archive import MilestoneArchive
+from quadro.models import Task
+from quadro.models import TaskStatus
+
+
+def make_task(task_id: int, title: str) -> Task:
+    return Task(
+        id=task_id,
+        title=title,
+        description="Description",
+        status=TaskStatus.DONE,
+        milestone="v1",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        completed=datetime(2025, 10, 4, 9, 0, 0, tzinfo=UTC),
+    )
+
+
+def test_write_and_read_archive(tmp_path: Path) -> None:
+    tasks = [make_task(2, "Second"), make_task(1, "First")]
+    path = tmp_path / "archive" / "v1.zip"
+
+    archive = MilestoneArchive.write(path, ((task, task.to_markdown()) for task in tasks))
+
+    assert archive.milestone == "v1"
+    assert archive.ids() == [1, 2]
+    assert archive.index()[1]["title"] == "First"
+    assert archive.read_task(2) == tasks[0]
+    assert archive.read_task(3) is None
+    assert [task.id for task in archive.iter_tasks()] == [1, 2]
+
+
+def test_archive_members_are_compressed_independently(tmp_path: Path) -> None:
+    task = make_task(1, "First")
+    path = tmp_path / "v1.zip"
+
+    MilestoneArchive.write(path, [(task, task.to_markdown())])
+
+    with zipfile.ZipFile(path) as bundle:
+        assert sorted(bundle.namelist()) == ["1.md", "index.json"]
+        assert bundle.getinfo("1.md").compress_type == zipfile.ZIP_LZMA
+        assert bundle.read("1.md").decode() == task.to_markdown()
+
+
+def test_archive_index_reloads_when_bundle_changes(tmp_path: Path) -> None:
+    path = tmp_path / "v1.zip"
+    first = make_task(1, "First")
+    archive = MilestoneArchive.write(path, [(first, first.to_markdown())])
+    assert archive.ids() == [1]
+
+    second = make_task(2, "Second")
+    MilestoneArchive.write(path, [(first, first.to_markdown()), (second, second.to_markdown())])
+
+    assert archive.ids() == [1, 2]
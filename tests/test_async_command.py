@@ -0,0 +1,54 @@
+import asyncio
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from quadro import async_command
+from quadro.exceptions import TaskNotFoundError
+from quadro.models import TaskStatus
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+@pytest.mark.asyncio
+async def test_run_in_executor_runs_off_event_loop() -> None:
+    loop_thread = threading.get_ident()
+
+    worker_thread = await async_command.run_in_executor(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_concurrent_add_task_allocates_unique_ids(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        tasks = await asyncio.gather(*(async_command.add_task(f"Task {i}") for i in range(20)))
+
+        assert sorted(task.id for task in tasks) == list(range(1, 21))
+        assert len(await async_command.list_tasks()) == 20
+
+
+@pytest.mark.asyncio
+async def test_status_transitions(runner: CliRunner) -> None:
+    with runner.isolated_filesystem():
+        await async_command.add_task("Task 1", milestone="mvp")
+
+        started = await async_command.start_task(1)
+        completed = await async_command.complete_task(1)
+
+        assert started.status == TaskStatus.PROGRESS
+        assert completed.status == TaskStatus.DONE
+        assert (await async_command.show_task(1)).status == TaskStatus.DONE
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate(runner: CliRunner) -> None:
+    with (
+        runner.isolated_filesystem(),
+        pytest.raises(TaskNotFoundError, match="Task #999 not found"),
+    ):
+        await async_command.show_task(999)
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from quadro.batch import BatchResult
+from quadro.batch import parse_script
+from quadro.batch import run_batch
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> TaskStorage:
+    return TaskStorage(tmp_path / "tasks")
+
+
+def test_parse_script_skips_blank_lines_and_comments() -> None:
+    script = ['add "Fix login" --milestone mvp\n', "\n", "# tidy up\n", "quadro done 3  # later\n"]
+
+    assert parse_script(script) == [
+        (1, ["add", "Fix login", "--milestone", "mvp"]),
+        (4, ["done", "3"]),
+    ]
+
+
+def test_parse_script_rejects_unbalanced_quotes() -> None:
+    with pytest.raises(ValueError, match="Line 2: No closing quotation"):
+        parse_script(["add One", 'add "Two'])
+
+
+@pytest.mark.parametrize("command", ["batch", "daemon", "serve", "shell"])
+def test_parse_script_rejects_unavailable_commands(command: str) -> None:
+    with pytest.raises(ValueError, match=f"Line 1: '{command}' is not available in a batch"):
+        parse_script([command])
+
+
+def test_run_batch_reports_every_line(
+    storage: TaskStorage, capsys: pytest.CaptureFixture[str]
+) -> None:
+    commands = parse_script(["add First --milestone mvp", "done 7", "start 1", "move 1 --to v2"])
+
+    results = run_batch(commands, storage)
+
+    assert results == [
+        BatchResult(1, ["add", "First", "--milestone", "mvp"], 0),
+        BatchResult(2, ["done", "7"], 1),
+        BatchResult(3, ["start", "1"], 0),
+        BatchResult(4, ["move", "1", "--to", "v2"], 0),
+    ]
+    assert "Task #7 not found" in capsys.readouterr().out
+    assert (storage.base_path / "v2" / "1.md").exists()
+
+
+def test_run_batch_stops_at_first_failure(storage: TaskStorage) -> None:
+    results = run_batch(parse_script(["add One", "done 7", "add Two"]), storage, fail_fast=True)
+
+    assert [result.ok for result in results] == [True, False]
+    assert storage.load_task(2) is None
+
+
+def test_run_batch_updates_rollups(storage: TaskStorage) -> None:
+    run_batch(
+        parse_script(["add One --milestone mvp", "add Two --milestone mvp", "done 1"]), storage
+    )
+
+    rollups = TaskStorage(storage.base_path).rollups()
+    assert rollups.statuses == {"mvp": {"done": 1, "todo": 1}}
@@ -0,0 +1,166 @@
+from datetime import UTC
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+
+from rich.console import Console
+
+from quadro.cache import CacheStats
+from quadro.cache import MarkdownCache
+from quadro.cache import TaskCache
+from quadro.models import Task
+from quadro.models import TaskStatus
+
+
+def make_task(task_id: int) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 6, 12, 0, 0, tzinfo=UTC),
+    )
+
+
+def test_get_returns_copy_while_file_is_unchanged() -> None:
+    cache = TaskCache()
+    cache.put(Path("1.md"), 10, 100, make_task(1))
+
+    task = cache.get(Path("1.md"), 10, 100)
+    assert task == make_task(1)
+
+    task.title = "Changed"
+    assert cache.get(Path("1.md"), 10, 100) == make_task(1)
+
+
+def test_get_misses_when_mtime_or_size_differ() -> None:
+    cache = TaskCache()
+    cache.put(Path("1.md"), 10, 100, make_task(1))
+
+    assert cache.get(Path("1.md"), 11, 100) is None
+    assert cache.get(Path("1.md"), 10, 101) is None
+    assert cache.get(Path("2.md"), 10, 100) is None
+    assert cache.stats() == CacheStats(misses=3, entries=1, bytes=100)
+
+
+def test_evicts_least_recently_used_over_entry_budget() -> None:
+    cache = TaskCache(max_entries=2)
+    cache.put(Path("1.md"), 1, 10, make_task(1))
+    cache.put(Path("2.md"), 1, 10, make_task(2))
+    cache.get(Path("1.md"), 1, 10)
+
+    cache.put(Path("3.md"), 1, 10, make_task(3))
+
+    assert cache.get(Path("2.md"), 1, 10) is None
+    assert cache.get(Path("1.md"), 1, 10) is not None
+    assert cache.get(Path("3.md"), 1, 10) is not None
+    assert cache.stats() == CacheStats(hits=3, misses=1, evictions=1, entries=2, bytes=20)
+
+
+def test_evicts_over_byte_budget() -> None:
+    cache = TaskCache(max_bytes=250)
+    cache.put(Path("1.md"), 1, 100, make_task(1))
+    cache.put(Path("2.md"), 1, 100, make_task(2))
+
+    cache.put(Path("3.md"), 1, 100, make_task(3))
+
+    assert cache.get(Path("1.md"), 1, 100) is None
+    assert cache.stats().bytes == 200
+
+
+def test_skips_tasks_larger_than_byte_budget() -> None:
+    cache = TaskCache(max_bytes=50)
+
+    cache.put(Path("1.md"), 1, 100, make_task(1))
+
+    assert cache.stats() == CacheStats()
+
+
+def test_put_replaces_entry_of_same_path() -> None:
+    cache = TaskCache()
+    cache.put(Path("1.md"), 1, 100, make_task(1))
+
+    cache.put(Path("1.md"), 2, 80, make_task(1))
+
+    assert cache.stats() == CacheStats(entries=1, bytes=80)
+
+
+def test_discard_and_clear() -> None:
+    cache = TaskCache()
+    cache.put(Path("1.md"), 1, 100, make_task(1))
+    cache.put(Path("2.md"), 1, 100, make_task(2))
+
+    cache.discard(Path("1.md"))
+    assert cache.stats().entries == 1
+
+    cache.clear()
+    assert cache.stats().entries == 0
+    assert cache.stats().bytes == 0
+
+
+def markdown_console() -> Console:
+    return Console(file=StringIO(), width=40)
+
+
+def test_markdown_cache_reuses_rendering_per_text_and_width() -> None:
+    cache = MarkdownCache()
+    console = markdown_console()
+
+    rendered = cache.render(console, "Some **bold** text")
+
+    assert cache.render(console, "Some **bold** text") is rendered
+    assert cache.render(console, "Some **bold** text", width=20) is not rendered
+    assert cache.render(console, "Other text") is not rendered
+
+
+def test_markdown_cache_evicts_least_recently_used() -> None:
+    cache = MarkdownCache(max_entries=2)
+    console = markdown_console()
+
+    first = cache.render(console, "one")
+    second = cache.render(console, "two")
+    cache.render(console, "one")
+    cache.render(console, "three")
+
+    assert cache.render(console, "one") is first
+    assert cache.render(console, "two") is not second
+
+
+def test_markdown_cache_clear() -> None:
+    cache = MarkdownCache()
+    console = markdown_console()
+    rendered = cache.render(console, "one")
+
+    cache.clear()
+
+    assert cache.render(console, "one") is not rendered
+
+
+def test_rendered_markdown_renders_pages_on_demand() -> None:
+    console = markdown_console()
+    text = "\n\n".join(f"Paragraph {index}" for index in range(50))
+    rendered = MarkdownCache().render(console, text)
+
+    pages = rendered.pages(10)
+    first_page = next(pages)
+
+    complete = [rendered.complete]
+    remaining = list(pages)
+    complete.append(rendered.complete)
+
+    assert len(first_page) == 10
+    assert "Paragraph 0" in "".join(segment.text for segment in first_page[0])
+    assert complete == [False, True]
+    assert sum(len(page) for page in remaining) == 99 - 10
+    assert all(line[-1].text == "\n" for line in first_page)
+
+
+def test_rendered_markdown_lines_are_cropped_to_width() -> None:
+    console = markdown_console()
+    rendered = MarkdownCache().render(console, "`" + "x" * 60 + "`")
+
+    lines = ["".join(segment.text for segment in line) for line in rendered.lines()]
+
+    assert lines
+    assert all(len(line) <= 40 + 1 for line in lines)
@@ -1,8 +1,13 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
+import quadro
 from quadro.cli import main
 
 
@@ -31,3 +36,60 @@ def test_unexpected_error_handling(runner: CliRunner) -> None:
         assert "RuntimeError" in result.output
         assert "Unexpected error occurred" in result.output
         assert "report this issue" in result.output
+
+
+# Modules that are slow to import and only needed by some commands.
+HEAVY_MODULES = ("rich", "yaml", "numpy", "markdown_it", "fastmcp", "http.server")
+
+LOADED_MODULES_SCRIPT = """
+import sys
+import quadro
+from quadro.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print(",".join(name for name in {modules!r} if name in sys.modules), file=sys.stderr)
+"""
+
+
+def loaded_heavy_modules(cwd: Path, *args: str) -> list[str]:
+    """Run the CLI in a fresh interpreter and return the heavy modules it imported."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", LOADED_MODULES_SCRIPT.format(modules=HEAVY_MODULES), *args],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(Path(quadro.__file__).parent.parent)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+    return [name for name in line.split(",") if name]
+
+
+def test_cli_import_does_not_load_heavy_modules(tmp_path: Path) -> None:
+    assert loaded_heavy_modules(tmp_path, "--help") == []
+
+
+def test_add_does_not_load_yaml_or_optional_modules(tmp_path: Path) -> None:
+    assert loaded_heavy_modules(tmp_path, "add", "Task") == ["rich"]
+
+
+def test_piped_list_does_not_load_rich(tmp_path: Path) -> None:
+    loaded_heavy_modules(tmp_path, "add", "Task")
+
+    assert loaded_heavy_modules(tmp_path, "list", "--format", "plain") == ["yaml"]
+
+
+def test_client_import_does_not_load_click(tmp_path: Path) -> None:
+    script = "import sys, quadro.client; print('click' in sys.modules, 'quadro.cli' in sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(quadro.__file__).parent.parent)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["False", "False"]
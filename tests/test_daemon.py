@@ -0,0 +1,167 @@
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from quadro.cli import run_command
+from quadro.client import NO_DAEMON_ENV
+from quadro.client import daemon_running
+from quadro.client import forward
+from quadro.client import forwardable
+from quadro.client import socket_path
+from quadro.client import stop_daemon
+from quadro.command import add_task
+from quadro.daemon import TaskDaemon
+from quadro.storage import STATE_DIR
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TaskStorage:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(NO_DAEMON_ENV, raising=False)
+    return TaskStorage()
+
+
+@pytest.fixture
+def daemon(storage: TaskStorage) -> Iterator[TaskDaemon]:
+    server = TaskDaemon(storage)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_socket_path_is_in_state_dir() -> None:
+    assert socket_path(Path("tasks")) == Path("tasks", STATE_DIR, "daemon.sock")
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ([], True),
+        (["add", "Task"], True),
+        (["list", "--todo"], True),
+        (["list", "--pager"], False),
+        (["edit", "1"], False),
+        (["delete", "1", "--yes"], False),
+        (["daemon"], False),
+    ],
+)
+def test_forwardable(args: list[str], expected: bool) -> None:  # noqa: FBT001
+    assert forwardable(args) is expected
+
+
+def test_run_command_uses_given_storage(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    storage = TaskStorage(tmp_path / "elsewhere")
+
+    assert run_command(["add", "Task"], storage) == 0
+    assert run_command(["show", "1"], storage) == 0
+    assert run_command(["show", "2"], storage) == 1
+
+    output = capsys.readouterr().out
+    assert "✓ Created task #1" in output
+    assert "Task #2 not found" in output
+    assert (tmp_path / "elsewhere" / "1.md").exists()
+
+
+def test_run_command_reports_usage_errors(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert run_command(["start", "one"], TaskStorage(tmp_path)) == 2
+    assert "Invalid value" in capsys.readouterr().err
+
+
+@pytest.mark.usefixtures("storage")
+def test_forward_without_daemon_returns_none() -> None:
+    assert forward(["list"]) is None
+    assert not daemon_running()
+    assert not stop_daemon()
+
+
+@pytest.mark.usefixtures("daemon")
+def test_forward_runs_command_in_daemon(
+    storage: TaskStorage, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert daemon_running()
+
+    assert forward(["add", "First", "--milestone", "mvp"]) == 0
+    assert forward(["list"]) == 0
+    assert forward(["done", "7"]) == 1
+
+    output = capsys.readouterr().out
+    assert "✓ Created task #1" in output
+    assert "1 todo mvp First\n" in output
+    assert "Task #7 not found" in output
+    assert storage.load_task(1) is not None
+
+
+@pytest.mark.usefixtures("daemon")
+def test_forward_sees_changes_made_outside_daemon(capsys: pytest.CaptureFixture[str]) -> None:
+    forward(["list"])
+    add_task("Added directly", storage=TaskStorage())
+
+    assert forward(["list"]) == 0
+    assert "1 todo - Added directly\n" in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("daemon")
+def test_forward_skips_interactive_commands() -> None:
+    assert forward(["edit", "1"]) is None
+
+
+@pytest.mark.usefixtures("daemon")
+def test_forward_is_disabled_by_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(NO_DAEMON_ENV, "1")
+
+    assert forward(["list"]) is None
+
+
+@pytest.mark.usefixtures("daemon")
+def test_forward_adopts_client_environment(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    workspace = Path("workspace.toml")
+    workspace.write_text('[roots]\napi = "tasks"\n')
+    add_task("Task", storage=TaskStorage())
+    monkeypatch.setenv("QUADRO_WORKSPACE", str(workspace))
+
+    assert forward(["list"]) == 0
+    assert "api:1 todo - Task\n" in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("daemon")
+def test_daemon_refuses_second_instance(storage: TaskStorage) -> None:
+    with pytest.raises(FileExistsError, match="Daemon already running"):
+        TaskDaemon(storage)
+
+
+def test_daemon_replaces_stale_socket(storage: TaskStorage) -> None:
+    path = socket_path(storage.base_path)
+    path.parent.mkdir(parents=True)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    server = TaskDaemon(storage)
+    server.server_close()
+
+    assert not path.exists()
+
+
+def test_stop_daemon(storage: TaskStorage) -> None:
+    server = TaskDaemon(storage)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    assert stop_daemon()
+
+    thread.join(timeout=5)
+    server.server_close()
+    assert not thread.is_alive()
+    assert not socket_path(storage.base_path).exists()
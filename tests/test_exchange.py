@@ -0,0 +1,152 @@
+import json
+from datetime import UTC
+from datetime import datetime
+from io import StringIO
+from textwrap import dedent
+
+import pytest
+
+from quadro.exchange import TABLE_LIST_FORMATS
+from quadro.exchange import read_records
+from quadro.exchange import write_task_list
+from quadro.exchange import write_task_table
+from quadro.exchange import write_tasks
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.table import TaskTable
+
+
+@pytest.fixture
+def tasks() -> list[Task]:
+    return [
+        Task(
+            id=1,
+            title="First",
+            description="Line one\nLine two",
+            status=TaskStatus.TODO,
+            milestone="mvp",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        ),
+        Task(
+            id=2,
+            title="Second, with comma",
+            description="",
+            status=TaskStatus.DONE,
+            milestone=None,
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+            completed=datetime(2025, 10, 4, 9, 0, 0, tzinfo=UTC),
+        ),
+    ]
+
+
+def test_write_tasks_ndjson(tasks: list[Task]) -> None:
+    output = StringIO()
+
+    assert write_tasks(tasks, output) == 2
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0] == (
+        '{"id": 1, "title": "First", "description": "Line one\\nLine two", "status": "todo", '
+        '"milestone": "mvp", "created": "2025-10-03T09:00:00+00:00", "completed": null}'
+    )
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_write_and_read_round_trip(tasks: list[Task], fmt: str) -> None:
+    output = StringIO()
+    write_tasks(tasks, output, fmt)
+
+    records = list(read_records(StringIO(output.getvalue()), fmt))
+
+    assert [Task.from_dict(record) for record in records] == tasks
+
+
+def test_read_records_skips_blank_lines() -> None:
+    source = StringIO('{"title": "A"}\n\n{"title": "B"}\n')
+
+    assert list(read_records(source)) == [{"title": "A"}, {"title": "B"}]
+
+
+def test_read_records_invalid_json() -> None:
+    source = StringIO(
+        dedent("""\
+            {"title": "A"}
+            not json
+        """)
+    )
+
+    with pytest.raises(ValueError, match="Invalid JSON on line 2"):
+        list(read_records(source))
+
+
+def test_read_records_rejects_non_objects() -> None:
+    with pytest.raises(ValueError, match="Expected a JSON object on line 1"):
+        list(read_records(StringIO("[1, 2]\n")))
+
+
+def test_unsupported_format(tasks: list[Task]) -> None:
+    with pytest.raises(ValueError, match="Unsupported format: xml"):
+        write_tasks(tasks, StringIO(), "xml")
+
+
+def test_write_task_list_formats() -> None:
+    rows = [
+        (
+            str(task_id),
+            Task(
+                id=task_id,
+                title=title,
+                description="",
+                status=TaskStatus.TODO,
+                milestone=milestone,
+                created=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
+            ),
+        )
+        for task_id, title, milestone in [(1, "Task x", "mvp"), (2, "Task xx", None)]
+    ]
+    outputs = {}
+
+    for fmt in ("plain", "tsv", "json"):
+        output = StringIO()
+        write_task_list(rows, output, fmt)
+        outputs[fmt] = output.getvalue()
+
+    assert outputs["plain"] == "1 todo mvp Task x\n2 todo - Task xx\n"
+    assert outputs["tsv"].splitlines() == [
+        "id\tstatus\tmilestone\ttitle",
+        "1\ttodo\tmvp\tTask x",
+        "2\ttodo\t\tTask xx",
+    ]
+    assert [record["title"] for record in json.loads(outputs["json"])] == ["Task x", "Task xx"]
+
+
+def test_write_task_list_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported format: xml"):
+        write_task_list([], StringIO(), "xml")
+
+
+def test_write_task_table_matches_task_list() -> None:
+    tasks = [
+        Task(
+            id=task_id,
+            title=title,
+            description="Not in the table",
+            status=TaskStatus.TODO,
+            milestone=milestone,
+            created=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
+        )
+        for task_id, title, milestone in [(1, "Task\tx", "mvp"), (2, "Task xx", None)]
+    ]
+    table = TaskTable.from_tasks(tasks)
+
+    for fmt in TABLE_LIST_FORMATS:
+        expected = StringIO()
+        write_task_list([(str(task.id), task) for task in tasks], expected, fmt)
+        output = StringIO()
+        write_task_table(table, output, fmt)
+
+        assert output.getvalue() == expected.getvalue()
+
+    with pytest.raises(ValueError, match="Unsupported format: json"):
+        write_task_table(table, StringIO(), "json")
@@ -1,6 +1,7 @@
 import json
 from datetime import UTC
 from datetime import datetime
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -9,6 +10,9 @@ from fastmcp.client import Client
 from freezegun import freeze_time
 
 from quadro.command import add_task
+from quadro.mcp import flush_storages
+from quadro.mcp import get_storage
+from quadro.mcp import get_workspace
 from quadro.mcp import mcp
 from quadro.models import TaskStatus
 from quadro.storage import TaskStorage
@@ -758,3 +762,154 @@ status: todo
             async with Client(mcp) as client:
                 with pytest.raises(Exception, match="Task 999 not found"):
                     await client.read_resource("quadro://task/999")
+
+
+class TestSharedStorage:
+    def test_get_storage_reuses_instance(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            assert get_storage() is get_storage()
+            assert get_storage().write_delay is None
+
+    @pytest.mark.asyncio
+    async def test_write_delay_coalesces_tool_calls(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("QUADRO_WRITE_DELAY", "60")
+
+        with runner.isolated_filesystem():
+            async with Client(mcp) as client:
+                await client.call_tool("create_task", {"title": "Task 1"})
+                await client.call_tool("start_task", {"task_id": 1})
+                result = await client.call_tool("get_task", {"task_id": 1})
+
+                assert json.loads(result.content[0].text)["status"] == "progress"
+
+            storage = get_storage()
+            assert storage.flush() == [storage.base_path / "1.md"]
+            assert "status: progress" in (storage.base_path / "1.md").read_text()
+
+    def test_flush_storages_writes_pending_tasks(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("QUADRO_WRITE_DELAY", "60")
+
+        with runner.isolated_filesystem():
+            add_task("Task 1", storage=get_storage())
+
+            flush_storages()
+
+            assert Path("tasks/1.md").exists()
+
+
+class TestSearchTasksMCPTool:
+    @pytest.mark.asyncio
+    @freeze_time(FROZEN_TIME)
+    async def test_search_tasks_returns_matches(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Implement login")
+            add_task("Write docs")
+
+            async with Client(mcp) as client:
+                result = await client.call_tool("search_tasks", {"query": "LOGIN"})
+
+                assert result.content[0].text == to_compact_json(
+                    [build_task_json(1, "Implement login")]
+                )
+
+
+class TestWorkspaceMCPTools:
+    @pytest.fixture
+    def workspace_env(self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+        with runner.isolated_filesystem():
+            add_task("Login endpoint", milestone="mvp", storage=TaskStorage(Path("api/tasks")))
+            add_task("Login page", storage=TaskStorage(Path("web/tasks")))
+            Path("workspace.toml").write_text('[roots]\napi = "api/tasks"\nweb = "web/tasks"\n')
+            monkeypatch.setenv("QUADRO_WORKSPACE", "workspace.toml")
+            yield
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("workspace_env")
+    async def test_list_workspace_tasks_qualifies_ids(self) -> None:
+        async with Client(mcp) as client:
+            result = await client.call_tool("list_workspace_tasks", {})
+
+            entries = json.loads(result.content[0].text)
+            assert [entry["qualified_id"] for entry in entries] == ["api:1", "web:1"]
+            assert entries[1]["task"]["title"] == "Login page"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("workspace_env")
+    async def test_search_workspace_tasks(self) -> None:
+        async with Client(mcp) as client:
+            result = await client.call_tool("search_workspace_tasks", {"query": "page"})
+
+            entries = json.loads(result.content[0].text)
+            assert [entry["qualified_id"] for entry in entries] == ["web:1"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("workspace_env")
+    async def test_list_workspace_milestones(self) -> None:
+        async with Client(mcp) as client:
+            result = await client.call_tool("list_workspace_milestones", {})
+
+            entries = json.loads(result.content[0].text)
+            assert [entry["qualified_id"] for entry in entries] == ["api:1"]
+
+    @pytest.mark.usefixtures("workspace_env")
+    def test_get_workspace_reuses_instance(self) -> None:
+        assert get_workspace() is get_workspace()
+
+    def test_get_workspace_requires_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("QUADRO_WORKSPACE", raising=False)
+
+        with pytest.raises(ValueError, match="Set QUADRO_WORKSPACE"):
+            get_workspace()
+
+
+class TestGetStatsMCPTool:
+    @pytest.mark.asyncio
+    async def test_get_stats_returns_distributions(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            async with Client(mcp) as client:
+                result = await client.call_tool("get_stats", {"weeks": 2})
+
+                stats = json.loads(result.content[0].text)
+                assert stats["lead_time"]["count"] == 0
+                assert len(stats["throughput"]) == 2
+                assert sorted(stats["aging"]) == ["-", "mvp"]
+                assert stats["aging"]["mvp"]["count"] == 1
+
+
+class TestGetBurndownMCPTool:
+    @pytest.mark.asyncio
+    async def test_get_burndown_returns_points(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+
+            async with Client(mcp) as client:
+                result = await client.call_tool("get_burndown", {"milestone": "mvp"})
+
+                points = json.loads(result.content[0].text)
+                assert points[-1]["scope"] == 1
+                assert points[-1]["done"] == 0
+
+
+class TestGetMilestoneCountsMCPTool:
+    @pytest.mark.asyncio
+    async def test_get_milestone_counts(self, runner: CliRunner) -> None:
+        with runner.isolated_filesystem():
+            add_task("Task 1", milestone="mvp")
+            add_task("Task 2")
+
+            async with Client(mcp) as client:
+                result = await client.call_tool("get_milestone_counts", {})
+
+                counts = json.loads(result.content[0].text)
+                assert counts == {"mvp": {"todo": 1, "progress": 0, "done": 0}}
@@ -1,6 +1,9 @@
 from datetime import UTC
 from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
 
+import frontmatter
 import pytest
 
 from quadro.models import Task
@@ -352,3 +355,160 @@ def test_task_cannot_have_completed_timestamp_if_not_done() -> None:
             created=datetime(2025, 10, 3, 9, 30, 15, tzinfo=UTC),
             completed=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
         )
+
+
+def test_from_markdown_rejects_completed_timestamp_if_not_done() -> None:
+    content = """---
+status: todo
+created: 2025-10-03T09:30:15
+completed: 2025-10-03T10:45:22
+---
+
+# Task
+"""
+    with pytest.raises(ValueError, match="Only completed tasks can have a 'completed' timestamp"):
+        Task.from_markdown(content, task_id=1, file_path="tasks/1.md")
+
+
+def test_from_markdown_done_task_without_completed_timestamp() -> None:
+    content = """---
+status: done
+created: 2025-10-03T09:30:15
+---
+
+# Task
+"""
+    task = Task.from_markdown(content, task_id=1, file_path="tasks/1.md")
+
+    assert task.completed is not None
+    assert task.completed.tzinfo == UTC
+
+
+def test_from_markdown_interns_milestones(valid_markdown: str) -> None:
+    first = Task.from_markdown(valid_markdown, task_id=1, file_path="tasks/mvp/1.md")
+    second = Task.from_markdown(valid_markdown, task_id=2, file_path="tasks/mvp/2.md")
+
+    assert first.milestone is second.milestone
+    assert not hasattr(first, "__dict__")
+
+
+def test_to_dict_and_from_dict_round_trip() -> None:
+    task = Task(
+        id=7,
+        title="Round Trip",
+        description="Some description",
+        status=TaskStatus.DONE,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 30, 15, tzinfo=UTC),
+        completed=datetime(2025, 10, 3, 10, 45, 22, tzinfo=UTC),
+    )
+
+    data = task.to_dict()
+
+    assert data == {
+        "id": 7,
+        "title": "Round Trip",
+        "description": "Some description",
+        "status": "done",
+        "milestone": "mvp",
+        "created": "2025-10-03T09:30:15+00:00",
+        "completed": "2025-10-03T10:45:22+00:00",
+    }
+    assert Task.from_dict(data) == task
+
+
+def test_from_dict_defaults_and_empty_values() -> None:
+    task = Task.from_dict(
+        {"title": "Minimal", "milestone": "", "created": "2025-10-03T09:30:15"},
+        task_id=3,
+    )
+
+    assert task == Task(
+        id=3,
+        title="Minimal",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 9, 30, 15, tzinfo=UTC),
+    )
+
+
+def test_from_dict_missing_title() -> None:
+    with pytest.raises(ValueError, match="Missing 'title' in record"):
+        Task.from_dict({"id": 1})
+
+
+def test_from_dict_missing_id() -> None:
+    with pytest.raises(ValueError, match="Missing 'id' in record"):
+        Task.from_dict({"title": "No ID"})
+
+
+def frontmatter_markdown(task: Task) -> str:
+    metadata = {"status": task.status.value, "created": task.created.isoformat()}
+    if task.milestone is not None:
+        metadata["milestone"] = task.milestone
+    if task.completed is not None:
+        metadata["completed"] = task.completed.isoformat()
+
+    parts = [frontmatter.dumps(frontmatter.Post(content="", **metadata)).strip()]
+    parts.extend(["", f"# {task.title}"])
+    if task.description:
+        parts.extend(["", task.description])
+
+    return "\n".join(parts) + "\n"
+
+
+@pytest.mark.parametrize(
+    "milestone",
+    [
+        None,
+        "mvp",
+        "sprint-1",
+        "v1.0",
+        "yes",
+        "on",
+        "null",
+        "~",
+        "1",
+        "0x1f",
+        "2025-01-01",
+        "a: b",
+        "#tag",
+        "[x]",
+        "it's",
+        "  padded",
+        "",
+        "équipe",
+        "a very long milestone name " * 5,
+        "multi\nline",
+    ],
+)
+@pytest.mark.parametrize(
+    ("created", "completed"),
+    [
+        (datetime(2025, 10, 3, 9, 30, 15, tzinfo=UTC), None),
+        (
+            datetime(2025, 10, 3, 9, 30, 15, 123456, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2025, 10, 4, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ),
+        (datetime(2025, 10, 3, 9, 30, 15), None),  # noqa: DTZ001
+        (datetime(2025, 10, 3, tzinfo=timezone(timedelta(seconds=5))), None),
+    ],
+)
+def test_to_markdown_matches_yaml_dump(
+    milestone: str | None, created: datetime, completed: datetime | None
+) -> None:
+    task = Task(
+        id=1,
+        title="Title",
+        description="Body",
+        status=TaskStatus.DONE if completed else TaskStatus.PROGRESS,
+        milestone=milestone,
+        created=created,
+        completed=completed,
+    )
+
+    markdown = task.to_markdown()
+
+    assert markdown == frontmatter_markdown(task)
+    assert Task.from_markdown(markdown, task_id=1, file_path="tasks/1.md").milestone == milestone
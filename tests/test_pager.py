@@ -0,0 +1,45 @@
+import sys
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from quadro.pager import PAGER_ENV
+from quadro.pager import pager_console
+
+
+def copy_pager(tmp_path: Path) -> tuple[str, Path]:
+    script = tmp_path / "pager.py"
+    output = tmp_path / "paged.txt"
+    script.write_text(
+        f"import shutil, sys\nshutil.copyfileobj(sys.stdin, open({str(output)!r}, 'w'))\n"
+    )
+    return f"{sys.executable} {script}", output
+
+
+def test_pager_console_writes_to_pager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    command, output = copy_pager(tmp_path)
+    monkeypatch.setenv(PAGER_ENV, command)
+
+    with pager_console(Console(file=StringIO())) as console:
+        console.print("first")
+        console.print("second")
+
+    assert output.read_text() == "first\nsecond\n"
+
+
+def test_pager_console_falls_back_when_pager_is_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PAGER_ENV, "quadro-missing-pager")
+    console = Console(file=StringIO())
+
+    with pager_console(console) as paged:
+        assert paged is console
+
+
+def test_pager_console_stops_when_pager_quits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PAGER_ENV, f"{sys.executable} -c pass")
+
+    with pager_console(Console(file=StringIO())) as console:
+        for i in range(100_000):
+            console.print(f"line {i}")
@@ -3,8 +3,11 @@ from datetime import datetime
 from io import StringIO
 from textwrap import dedent
 
+import pytest
 from rich.console import Console
+from rich.markdown import Markdown
 
+from quadro.cache import MarkdownCache
 from quadro.models import Task
 from quadro.models import TaskStatus
 from quadro.renderer import Renderer
@@ -70,6 +73,47 @@ def test_render_task_list() -> None:
     assert result.strip() == expected.strip()
 
 
+def make_tasks(count: int) -> list[Task]:
+    return [
+        Task(
+            id=i,
+            title=f"Task {'x' * (i % 7)}",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="mvp" if i % 2 else None,
+            created=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def test_render_task_list_streams_chunks_as_one_table() -> None:
+    tasks = make_tasks(12)
+    rows = [(str(task.id), task) for task in tasks]
+    streamed = StringIO()
+    single = StringIO()
+
+    Renderer(Console(file=streamed, width=80)).render_task_rows(rows, chunk_size=5)
+    Renderer(Console(file=single, width=80)).render_task_list(tasks)
+
+    assert streamed.getvalue() == single.getvalue()
+    assert streamed.getvalue().count("Milestone") == 1
+
+
+def test_render_task_list_streaming_fits_narrow_console() -> None:
+    tasks = make_tasks(3)
+    tasks[0].title = "A very long title " * 10
+    output = StringIO()
+
+    Renderer(Console(file=output, width=60)).render_task_rows(
+        [(str(task.id), task) for task in tasks], chunk_size=1
+    )
+
+    lines = output.getvalue().splitlines()
+    assert max(len(line) for line in lines) <= 60
+    assert "3 tasks" in lines[-1]
+
+
 def test_render_task_detail() -> None:
     output = StringIO()
     console = Console(file=output)
@@ -103,6 +147,59 @@ def test_render_task_detail() -> None:
     assert result.strip() == expected.strip()
 
 
+@pytest.mark.parametrize(
+    "description",
+    [
+        "",
+        "Plain text",
+        "# Heading\n\nSome **bold** text.\n\n- one\n- two\n\n```python\nprint(1)\n```\n",
+        "\n\n".join(f"Paragraph {index} with `code` and *emphasis*." for index in range(200)),
+    ],
+)
+def test_render_task_detail_matches_markdown_output(description: str) -> None:
+    task = Task(
+        id=1,
+        title="Task",
+        description=description,
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
+    )
+    output = StringIO()
+    renderer = Renderer(
+        console=Console(file=output, width=60, height=20), markdown_cache=MarkdownCache()
+    )
+
+    renderer.render_task_detail(task)
+
+    expected = StringIO()
+    console = Console(file=expected, width=60)
+    console.print(Markdown(description))
+
+    assert expected.getvalue() in output.getvalue()
+
+
+def test_render_task_detail_reuses_cached_description() -> None:
+    cache = MarkdownCache()
+    task = Task(
+        id=1,
+        title="Task",
+        description="Some **bold** text",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 10, 0, 0, tzinfo=UTC),
+    )
+    console = Console(file=StringIO(), width=60)
+    renderer = Renderer(console=console, markdown_cache=cache)
+
+    renderer.render_task_detail(task)
+    first = cache.render(console, task.description)
+    renderer.render_task_detail(task)
+
+    assert cache.render(console, task.description) is first
+    assert first.complete
+
+
 def test_render_task_detail_completed() -> None:
     output = StringIO()
     console = Console(file=output)
@@ -0,0 +1,159 @@
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import complete_task
+from quadro.command import delete_task
+from quadro.command import move_task
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.rollup import BurndownPoint
+from quadro.rollup import Rollups
+from quadro.storage import TaskStorage
+
+
+def make_task(
+    task_id: int, created: datetime, completed: datetime | None = None, milestone: str = "mvp"
+) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="",
+        status=TaskStatus.DONE if completed else TaskStatus.TODO,
+        milestone=milestone,
+        created=created,
+        completed=completed,
+    )
+
+
+def rebuilt(storage: TaskStorage) -> Rollups:
+    storage.rollups_path.unlink()
+    return storage.rollups()
+
+
+def test_burndown_accumulates_days() -> None:
+    rollups = Rollups()
+    rollups.add(make_task(1, datetime(2025, 10, 1, 9, tzinfo=UTC)))
+    rollups.add(
+        make_task(2, datetime(2025, 10, 1, 10, tzinfo=UTC), datetime(2025, 10, 3, tzinfo=UTC))
+    )
+
+    assert rollups.burndown("mvp") == [
+        BurndownPoint(date(2025, 10, 1), 2, 0),
+        BurndownPoint(date(2025, 10, 2), 2, 0),
+        BurndownPoint(date(2025, 10, 3), 2, 1),
+    ]
+    assert rollups.burndown("mvp", until=date(2025, 10, 4))[-1].remaining == 1
+
+
+def test_remove_undoes_add() -> None:
+    rollups = Rollups()
+    task = make_task(1, datetime(2025, 10, 1, tzinfo=UTC), datetime(2025, 10, 2, tzinfo=UTC))
+
+    rollups.add(task)
+    rollups.remove(task)
+
+    assert rollups.milestones == {}
+    assert rollups.burndown("mvp") == []
+
+
+def test_tasks_without_milestone_only_count_statuses() -> None:
+    rollups = Rollups()
+    task = make_task(1, datetime(2025, 10, 1, tzinfo=UTC))
+    task.milestone = None
+
+    rollups.add(task)
+
+    assert rollups.milestones == {}
+    assert rollups.status_counts() == {
+        None: {TaskStatus.TODO: 1, TaskStatus.PROGRESS: 0, TaskStatus.DONE: 0}
+    }
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    rollups = Rollups(signature=42)
+    rollups.add(make_task(1, datetime(2025, 10, 1, tzinfo=UTC)))
+
+    rollups.save(tmp_path / "rollups.json")
+    loaded = Rollups.load(tmp_path / "rollups.json")
+
+    assert loaded is not None
+    assert loaded.signature == 42
+    assert loaded.milestones == rollups.milestones
+    assert loaded.statuses == rollups.statuses
+
+
+def test_load_returns_none_for_missing_or_invalid_file(tmp_path: Path) -> None:
+    (tmp_path / "bad.json").write_text("{not json")
+
+    assert Rollups.load(tmp_path / "missing.json") is None
+    assert Rollups.load(tmp_path / "bad.json") is None
+
+
+def test_storage_updates_rollups_incrementally(tmp_path: Path) -> None:
+    storage = TaskStorage(tmp_path)
+
+    with freeze_time("2025-10-01 12:00:00"):
+        add_task("Task 1", milestone="mvp", storage=storage)
+        add_task("Task 2", milestone="mvp", storage=storage)
+        assert storage.rollups().burndown("mvp") == [BurndownPoint(date(2025, 10, 1), 2, 0)]
+
+    with freeze_time("2025-10-02 12:00:00"):
+        complete_task(1, storage=storage)
+        add_task("Task 3", milestone="beta", storage=storage)
+        move_task(2, "beta", storage=storage)
+        delete_task(3, storage=storage)
+
+    stored = Rollups.load(storage.rollups_path)
+    assert stored is not None
+    assert stored.burndown("mvp") == [
+        BurndownPoint(date(2025, 10, 1), 1, 0),
+        BurndownPoint(date(2025, 10, 2), 1, 1),
+    ]
+    assert stored.burndown("beta") == [BurndownPoint(date(2025, 10, 1), 1, 0)]
+
+    assert stored.status_counts() == {
+        "beta": {TaskStatus.TODO: 1, TaskStatus.PROGRESS: 0, TaskStatus.DONE: 0},
+        "mvp": {TaskStatus.TODO: 0, TaskStatus.PROGRESS: 0, TaskStatus.DONE: 1},
+    }
+
+    rollups = storage.rollups()
+    assert rollups.signature == stored.signature
+    fresh = rebuilt(storage)
+    assert rollups.milestones == fresh.milestones
+    assert rollups.statuses == fresh.statuses
+
+
+def test_rollups_rebuild_after_hand_edit(tmp_path: Path) -> None:
+    storage = TaskStorage(tmp_path)
+    add_task("Task 1", milestone="mvp", storage=storage)
+    storage.rollups()
+
+    (tmp_path / "mvp" / "1.md").unlink()
+
+    assert storage.rollups().burndown("mvp") == []
+
+
+def test_rollups_include_archived_tasks(tmp_path: Path) -> None:
+    storage = TaskStorage(tmp_path)
+    add_task("Task 1", milestone="mvp", storage=storage)
+    storage.rollups()
+
+    archive_milestone("mvp", storage=storage)
+
+    rollups = storage.rollups()
+    assert rollups.burndown("mvp")[-1].scope == 1
+    assert rollups.status_counts() == {}
+
+
+def test_rollups_are_not_written_until_read(tmp_path: Path) -> None:
+    storage = TaskStorage(tmp_path)
+
+    add_task("Task 1", milestone="mvp", storage=storage)
+
+    assert not storage.rollups_path.exists()
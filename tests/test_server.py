@@ -0,0 +1,165 @@
+import json
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError
+from urllib.request import Request
+from urllib.request import urlopen
+
+import pytest
+
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import complete_task
+from quadro.command import start_task
+from quadro.server import TaskServer
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> TaskStorage:
+    return TaskStorage(tmp_path / "tasks")
+
+
+@pytest.fixture
+def base_url(storage: TaskStorage) -> Iterator[str]:
+    server = TaskServer(("127.0.0.1", 0), storage)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def get(url: str, etag: str | None = None) -> tuple[int, dict[str, str], Any]:
+    headers = {"If-None-Match": etag} if etag else {}
+
+    try:
+        with urlopen(Request(url, headers=headers)) as response:  # noqa: S310
+            body = response.read()
+            return response.status, dict(response.headers), json.loads(body)
+    except HTTPError as e:
+        body = e.read()
+        return e.code, dict(e.headers), json.loads(body) if body else None
+
+
+class TestTasksEndpoint:
+    def test_lists_tasks(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", milestone="mvp", storage=storage)
+        add_task("Task 2", storage=storage)
+
+        status, headers, body = get(f"{base_url}/tasks")
+
+        assert status == HTTPStatus.OK
+        assert headers["Content-Type"] == "application/json"
+        assert [task["title"] for task in body] == ["Task 1", "Task 2"]
+        assert body[0]["milestone"] == "mvp"
+
+    def test_filters_by_milestone_and_status(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", milestone="mvp", storage=storage)
+        add_task("Task 2", milestone="mvp", storage=storage)
+        add_task("Task 3", storage=storage)
+        start_task(2, storage=storage)
+
+        _, _, body = get(f"{base_url}/tasks?milestone=mvp&status=progress&status=done")
+
+        assert [task["id"] for task in body] == [2]
+
+    def test_invalid_status_is_rejected(self, base_url: str) -> None:
+        status, _, body = get(f"{base_url}/tasks?status=invalid")
+
+        assert status == HTTPStatus.BAD_REQUEST
+        assert "invalid" in body["error"]
+
+    def test_returns_not_modified_until_tasks_change(
+        self, storage: TaskStorage, base_url: str
+    ) -> None:
+        add_task("Task 1", storage=storage)
+        _, headers, _ = get(f"{base_url}/tasks")
+        etag = headers["ETag"]
+
+        status, headers, body = get(f"{base_url}/tasks", etag)
+
+        assert status == HTTPStatus.NOT_MODIFIED
+        assert headers["ETag"] == etag
+        assert body is None
+
+        complete_task(1, storage=storage)
+        status, headers, body = get(f"{base_url}/tasks", etag)
+
+        assert status == HTTPStatus.OK
+        assert headers["ETag"] != etag
+        assert body[0]["status"] == "done"
+
+
+class TestTaskEndpoint:
+    def test_returns_task(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", "Details", storage=storage)
+
+        status, _, body = get(f"{base_url}/tasks/1")
+
+        assert status == HTTPStatus.OK
+        assert body["title"] == "Task 1"
+        assert body["description"] == "Details"
+
+    def test_returns_not_found(self, base_url: str) -> None:
+        status, _, body = get(f"{base_url}/tasks/999")
+
+        assert status == HTTPStatus.NOT_FOUND
+        assert body == {"error": "Task #999 not found"}
+
+    def test_etag_only_changes_with_the_task(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", storage=storage)
+        add_task("Task 2", storage=storage)
+        _, headers, _ = get(f"{base_url}/tasks/1")
+        etag = headers["ETag"]
+
+        start_task(2, storage=storage)
+        status, _, _ = get(f"{base_url}/tasks/1", etag)
+
+        assert status == HTTPStatus.NOT_MODIFIED
+
+        start_task(1, storage=storage)
+        status, _, body = get(f"{base_url}/tasks/1", etag)
+
+        assert status == HTTPStatus.OK
+        assert body["status"] == "progress"
+
+    def test_returns_archived_task(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", milestone="v1", storage=storage)
+        archive_milestone("v1", storage=storage)
+
+        status, headers, body = get(f"{base_url}/tasks/1")
+
+        assert status == HTTPStatus.OK
+        assert body["title"] == "Task 1"
+        assert get(f"{base_url}/tasks/1", headers["ETag"])[0] == HTTPStatus.NOT_MODIFIED
+
+
+class TestMilestonesEndpoint:
+    def test_summarizes_milestones(self, storage: TaskStorage, base_url: str) -> None:
+        add_task("Task 1", milestone="mvp", storage=storage)
+        add_task("Task 2", milestone="mvp", storage=storage)
+        add_task("Task 3", milestone="v2", storage=storage)
+        add_task("Task 4", storage=storage)
+        complete_task(1, storage=storage)
+
+        status, headers, body = get(f"{base_url}/milestones")
+
+        assert status == HTTPStatus.OK
+        assert body == [
+            {"milestone": "mvp", "total": 2, "todo": 1, "progress": 0, "done": 1},
+            {"milestone": "v2", "total": 1, "todo": 1, "progress": 0, "done": 0},
+        ]
+        assert get(f"{base_url}/milestones", headers["ETag"])[0] == HTTPStatus.NOT_MODIFIED
+
+
+def test_unknown_path_returns_not_found(base_url: str) -> None:
+    status, _, body = get(f"{base_url}/unknown")
+
+    assert status == HTTPStatus.NOT_FOUND
+    assert body == {"error": "Not found: /unknown"}
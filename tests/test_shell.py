@@ -0,0 +1,94 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.shell import TaskShell
+from quadro.storage import TaskStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> TaskStorage:
+    return TaskStorage(tmp_path / "tasks")
+
+
+def run_shell(storage: TaskStorage, lines: str) -> str:
+    output = StringIO()
+    TaskShell(storage, stdin=StringIO(lines), stdout=output).run()
+    return output.getvalue()
+
+
+def test_shell_runs_commands_against_its_storage(
+    storage: TaskStorage, capsys: pytest.CaptureFixture[str]
+) -> None:
+    output = run_shell(storage, 'add "First task" --milestone mvp\nquadro start 1\nlist\nexit\n')
+
+    assert output.startswith("Quadro shell.")
+    assert output.count("quadro> ") == 4
+    commands_output = capsys.readouterr().out
+    assert "✓ Created task #1" in commands_output
+    assert "✓ Started task #1: First task" in commands_output
+    assert "1 progress mvp First task\n" in commands_output
+    assert (storage.base_path / "mvp" / "1.md").exists()
+
+
+def test_shell_continues_after_failing_command(
+    storage: TaskStorage, capsys: pytest.CaptureFixture[str]
+) -> None:
+    run_shell(storage, "show 5\nnope\nadd Task\n")
+
+    commands_output = capsys.readouterr()
+    assert "Task #5 not found" in commands_output.out
+    assert "No such command 'nope'" in commands_output.err
+    assert "✓ Created task #1" in commands_output.out
+
+
+def test_shell_reports_unbalanced_quotes(storage: TaskStorage) -> None:
+    output = run_shell(storage, 'add "Unfinished\n')
+
+    assert "✗ No closing quotation" in output
+
+
+def test_shell_refuses_nested_sessions(storage: TaskStorage) -> None:
+    output = run_shell(storage, "shell\ndaemon\n")
+
+    assert "! 'shell' is not available in the shell" in output
+    assert "! 'daemon' is not available in the shell" in output
+
+
+def test_shell_help(storage: TaskStorage, capsys: pytest.CaptureFixture[str]) -> None:
+    run_shell(storage, "help\nhelp done\n")
+
+    commands_output = capsys.readouterr().out
+    assert "Quadro task management CLI." in commands_output
+    assert "Mark a task as completed." in commands_output
+
+
+def test_complete_command_names(storage: TaskStorage) -> None:
+    shell = TaskShell(storage)
+
+    assert shell.completenames("st") == ["start", "stats"]
+    assert shell.completenames("ex") == ["exit", "export"]
+
+
+def test_complete_task_ids_and_milestones(storage: TaskStorage) -> None:
+    add_task("First", milestone="mvp", storage=storage)
+    add_task("Second", milestone="mvp-2", storage=storage)
+    add_task("Third", milestone="old", storage=storage)
+    archive_milestone("old", storage=storage)
+    shell = TaskShell(storage)
+
+    def complete(line: str) -> list[str]:
+        text = line.rsplit(" ", 1)[-1]
+        return shell.completedefault(text, line, len(line) - len(text), len(line))
+
+    assert complete("show ") == ["1", "2"]
+    assert complete("done 1 ") == []
+    assert complete("move 1 --to mv") == ["mvp", "mvp-2"]
+    assert complete("list --milestone ") == ["mvp", "mvp-2"]
+    assert complete("burndown ") == ["mvp", "mvp-2"]
+    assert complete("unarchive ") == ["old"]
+    assert complete("list --mi") == ["--milestone"]
+    assert complete("unknown ") == []
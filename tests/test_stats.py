@@ -0,0 +1,140 @@
+from collections.abc import Iterator
+from dataclasses import astuple
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.stats import Distribution
+from quadro.stats import WeeklyThroughput
+from quadro.stats import compute_stats
+from quadro.table import TaskTable
+
+
+NOW = datetime(2025, 10, 8, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest) -> Iterator[None]:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield
+        return
+
+    with patch("quadro.stats.HAS_NUMPY", new=False):
+        yield
+
+
+def make_task(
+    task_id: int,
+    created_days_ago: float,
+    completed_days_ago: float | None = None,
+    milestone: str | None = None,
+) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO if completed_days_ago is None else TaskStatus.DONE,
+        milestone=milestone,
+        created=NOW - timedelta(days=created_days_ago),
+        completed=None if completed_days_ago is None else NOW - timedelta(days=completed_days_ago),
+    )
+
+
+@pytest.mark.usefixtures("backend")
+class TestComputeStats:
+    def test_lead_time_distribution(self) -> None:
+        table = TaskTable.from_tasks(
+            [
+                make_task(1, 10, 9),
+                make_task(2, 10, 8),
+                make_task(3, 10, 7),
+                make_task(4, 10, 6),
+                make_task(5, 2),
+            ]
+        )
+
+        stats = compute_stats(table, NOW, bins=2)
+
+        assert stats.lead_time.count == 4
+        assert stats.lead_time.mean == pytest.approx(2.5)
+        assert stats.lead_time.percentiles == pytest.approx({"p50": 2.5, "p85": 3.55, "p95": 3.85})
+        assert [astuple(b) for b in stats.lead_time.histogram] == [
+            (pytest.approx(1.0), pytest.approx(2.5), 2),
+            (pytest.approx(2.5), pytest.approx(4.0), 2),
+        ]
+
+    def test_weekly_throughput(self) -> None:
+        table = TaskTable.from_tasks(
+            [
+                make_task(1, 30, 1),
+                make_task(2, 30, 2),
+                make_task(3, 30, 8),
+                make_task(4, 30, 25),
+                make_task(5, 30),
+            ]
+        )
+
+        stats = compute_stats(table, NOW, weeks=3)
+
+        assert stats.throughput == [
+            WeeklyThroughput(date(2025, 9, 22), 0),
+            WeeklyThroughput(date(2025, 9, 29), 1),
+            WeeklyThroughput(date(2025, 10, 6), 2),
+        ]
+
+    def test_aging_per_milestone(self) -> None:
+        table = TaskTable.from_tasks(
+            [
+                make_task(1, 4, milestone="mvp"),
+                make_task(2, 2, milestone="mvp"),
+                make_task(3, 10, 1, milestone="mvp"),
+                make_task(4, 1),
+                make_task(5, 5, 1, milestone="v2"),
+            ]
+        )
+
+        stats = compute_stats(table, NOW, bins=1)
+
+        assert list(stats.aging) == ["-", "mvp"]
+        assert stats.aging["mvp"].count == 2
+        assert stats.aging["mvp"].mean == pytest.approx(3.0)
+        assert stats.aging["mvp"].percentiles["p50"] == pytest.approx(3.0)
+        assert [astuple(b) for b in stats.aging["-"].histogram] == [
+            (pytest.approx(0.5), pytest.approx(1.5), 1)
+        ]
+
+    def test_empty_table(self) -> None:
+        stats = compute_stats(TaskTable(), NOW, weeks=2)
+
+        assert stats.lead_time == Distribution()
+        assert stats.aging == {}
+        assert [week.completed for week in stats.throughput] == [0, 0]
+
+
+def test_backends_agree() -> None:
+    pytest.importorskip("numpy")
+    table = TaskTable.from_tasks(
+        make_task(i, i % 17 + 1, (i % 5) / 2 if i % 3 else None, milestone=f"m{i % 4}")
+        for i in range(1, 200)
+    )
+
+    vectorized = compute_stats(table, NOW, weeks=4, bins=7)
+    with patch("quadro.stats.HAS_NUMPY", new=False):
+        looped = compute_stats(table, NOW, weeks=4, bins=7)
+
+    assert vectorized.throughput == looped.throughput
+    assert vectorized.lead_time.count == looped.lead_time.count
+    assert vectorized.lead_time.percentiles == pytest.approx(looped.lead_time.percentiles)
+    assert [b.count for b in vectorized.lead_time.histogram] == [
+        b.count for b in looped.lead_time.histogram
+    ]
+    assert vectorized.aging.keys() == looped.aging.keys()
+    for milestone, distribution in vectorized.aging.items():
+        assert distribution.mean == pytest.approx(looped.aging[milestone].mean)
@@ -1,11 +1,19 @@
+import time
+from dataclasses import replace
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from quadro.cache import TaskCache
+from quadro.exceptions import MilestoneNotFoundError
+from quadro.exceptions import SnapshotExistsError
+from quadro.exceptions import SnapshotNotFoundError
 from quadro.models import Task
 from quadro.models import TaskStatus
+from quadro.rollup import NO_MILESTONE_KEY
 from quadro.storage import TaskStorage
 
 
@@ -740,3 +748,802 @@ def test_filter_by_status_with_empty_task_list(tmp_path: Path) -> None:
     filtered_tasks = storage.filter_by_status([], [TaskStatus.TODO])
     assert len(filtered_tasks) == 0
     assert filtered_tasks == []
+
+
+def test_check_empty_directory(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path / "nonexistent")
+
+    report = storage.check()
+
+    assert report.ok
+    assert report.checked == 0
+
+
+def test_check_valid_tasks(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(
+        Task(
+            id=1,
+            title="Root Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone=None,
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+    storage.save_task(
+        Task(
+            id=2,
+            title="MVP Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="mvp",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+
+    report = storage.check()
+
+    assert report.ok
+    assert report.checked == 2
+
+
+def test_check_detects_unparsable_file(tmp_path: Path) -> None:
+    (tmp_path / "1.md").write_text("# No frontmatter")
+
+    storage = TaskStorage(base_path=tmp_path)
+    report = storage.check()
+
+    assert not report.ok
+    assert len(report.issues) == 1
+    assert report.issues[0].path == tmp_path / "1.md"
+    assert "Missing 'status'" in report.issues[0].message
+
+
+def test_check_detects_duplicate_ids(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    storage.save_task(task)
+    task.milestone = "v2"
+    storage.save_task(task)
+
+    report = storage.check()
+
+    assert report.checked == 2
+    assert [issue.path for issue in report.issues] == [
+        tmp_path / "mvp" / "1.md",
+        tmp_path / "v2" / "1.md",
+    ]
+    assert all("Duplicate task #1" in issue.message for issue in report.issues)
+
+
+def test_check_detects_milestone_mismatch(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    file_path = storage.save_task(
+        Task(
+            id=1,
+            title="Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="mvp",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+    file_path.rename(tmp_path / "1.md")
+
+    report = storage.check()
+
+    assert len(report.issues) == 1
+    assert report.issues[0].path == tmp_path / "1.md"
+    assert report.issues[0].message == "Milestone 'mvp' does not match directory 'root'"
+
+
+def test_save_task_with_write_delay_coalesces_writes(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path, write_delay=60)
+    task = Task(
+        id=1,
+        title="Original Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+
+    file_path = storage.save_task(task)
+    task.status = TaskStatus.PROGRESS
+    storage.save_task(task)
+    task.title = "Updated Task"
+    storage.save_task(task)
+
+    assert file_path == tmp_path / "mvp" / "1.md"
+    assert "# Original Task" in file_path.read_text()
+    assert storage.load_task(1) == task
+
+    assert storage.flush() == [file_path]
+    assert storage.flush() == []
+    content = file_path.read_text()
+    assert "# Updated Task" in content
+    assert "status: progress" in content
+
+
+def test_save_task_with_write_delay_flushes_before_scanning(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path, write_delay=60)
+    task = Task(
+        id=1,
+        title="Buffered Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+
+    storage.save_task(task)
+
+    assert storage.get_next_id() == 2
+    assert (tmp_path / "1.md").exists()
+
+
+def test_save_task_with_write_delay_writes_new_tasks_at_once(tmp_path: Path) -> None:
+    server = TaskStorage(base_path=tmp_path, write_delay=60)
+    cli = TaskStorage(base_path=tmp_path)
+
+    server.save_task(replace(make_task(server.get_next_id()), title="From server"))
+    cli.save_task(replace(make_task(cli.get_next_id()), title="From CLI"))
+    server.flush()
+
+    assert [task.title for task in cli.load_all_tasks()] == ["From server", "From CLI"]
+
+
+def test_save_task_with_write_delay_flushes_after_delay(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path, write_delay=0.01)
+    task = Task(
+        id=1,
+        title="Buffered Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+
+    file_path = storage.save_task(task)
+    task.title = "Delayed Task"
+    storage.save_task(task)
+
+    for _ in range(100):
+        if "# Delayed Task" in file_path.read_text():
+            break
+        time.sleep(0.01)
+
+    assert "# Delayed Task" in file_path.read_text()
+
+
+def test_write_task_skips_identical_content(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Test Task",
+        description="Test description",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+
+    assert storage.write_task(task) == (tmp_path / "1.md", True)
+    mtime = (tmp_path / "1.md").stat().st_mtime_ns
+
+    assert storage.write_task(task) == (tmp_path / "1.md", False)
+    assert (tmp_path / "1.md").stat().st_mtime_ns == mtime
+
+    task.title = "Changed Task"
+    assert storage.write_task(task) == (tmp_path / "1.md", True)
+
+
+def test_write_task_compares_against_file_loaded_by_another_storage(tmp_path: Path) -> None:
+    task = Task(
+        id=1,
+        title="Test Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    TaskStorage(base_path=tmp_path).save_task(task)
+
+    storage = TaskStorage(base_path=tmp_path)
+    loaded = storage.load_task(1)
+    assert loaded is not None
+
+    assert storage.write_task(loaded) == (tmp_path / "mvp" / "1.md", False)
+
+
+def test_write_task_detects_external_changes(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Test Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=None,
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    storage.write_task(task)
+
+    file_path = tmp_path / "1.md"
+    file_path.write_text(file_path.read_text() + "\nEdited by hand\n")
+
+    assert storage.write_task(task) == (file_path, True)
+    assert "Edited by hand" not in file_path.read_text()
+
+
+def test_create_snapshot_isolated_from_later_writes(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Original Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    storage.save_task(task)
+
+    name, count = storage.create_snapshot("before")
+    task.title = "Updated Task"
+    storage.save_task(task)
+
+    assert (name, count) == ("before", 1)
+    snapshot_file = tmp_path / ".quadro" / "snapshots" / "before" / "mvp" / "1.md"
+    assert "# Original Task" in snapshot_file.read_text()
+    assert "# Updated Task" in (tmp_path / "mvp" / "1.md").read_text()
+
+
+def test_create_snapshot_is_hidden_from_task_scans(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(
+        Task(
+            id=1,
+            title="Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="mvp",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+
+    storage.create_snapshot("before")
+
+    assert storage.get_next_id() == 2
+    assert len(storage.load_all_tasks()) == 1
+    assert storage.get_milestones() == ["mvp"]
+    assert storage.check().ok
+
+
+def test_create_snapshot_rejects_existing_and_invalid_names(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.create_snapshot("before")
+
+    with pytest.raises(SnapshotExistsError, match="Snapshot 'before' already exists"):
+        storage.create_snapshot("before")
+    with pytest.raises(ValueError, match="Invalid snapshot name"):
+        storage.create_snapshot("../escape")
+
+
+def test_restore_snapshot(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Original Task",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    storage.save_task(task)
+    storage.create_snapshot("before")
+
+    task.title = "Updated Task"
+    storage.save_task(task)
+    storage.save_task(
+        Task(
+            id=2,
+            title="New Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="v2",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+
+    assert storage.restore_snapshot("before") == 1
+    assert [t.title for t in storage.load_all_tasks()] == ["Original Task"]
+    assert storage.get_milestones() == ["mvp"]
+    assert storage.list_snapshots() == ["before"]
+
+
+def test_restore_snapshot_not_found(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+
+    with pytest.raises(SnapshotNotFoundError, match="Snapshot 'missing' not found"):
+        storage.restore_snapshot("missing")
+
+
+def test_archive_milestone(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    for task_id, milestone in [(1, "v1"), (2, None), (3, "v1")]:
+        storage.save_task(
+            Task(
+                id=task_id,
+                title=f"Task {task_id}",
+                description="",
+                status=TaskStatus.TODO,
+                milestone=milestone,
+                created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+            )
+        )
+
+    path, count = storage.archive_milestone("v1")
+
+    assert path == tmp_path / ".quadro" / "archive" / "v1.zip"
+    assert count == 2
+    assert not (tmp_path / "v1").exists()
+    assert storage.get_milestones() == []
+    assert [t.id for t in storage.load_all_tasks()] == [2]
+    assert [t.id for t in storage.load_all_tasks(milestone="v1")] == [1, 3]
+    loaded = storage.load_task(3)
+    assert loaded is not None
+    assert loaded.title == "Task 3"
+    assert storage.get_next_id() == 4
+    assert storage.list_archived_milestones() == ["v1"]
+
+
+def test_archive_milestone_merges_and_prefers_task_files(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Archived",
+        description="",
+        status=TaskStatus.TODO,
+        milestone="v1",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    storage.save_task(task)
+    storage.archive_milestone("v1")
+
+    task.title = "Reopened"
+    storage.save_task(task)
+    storage.save_task(replace(task, id=2, title="New"))
+
+    assert [t.title for t in storage.load_all_tasks(milestone="v1")] == ["Reopened", "New"]
+
+    storage.archive_milestone("v1")
+
+    assert [t.title for t in storage.load_all_tasks(milestone="v1")] == ["Reopened", "New"]
+
+
+def test_archive_milestone_without_tasks(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+
+    with pytest.raises(MilestoneNotFoundError, match="Milestone 'v1' has no tasks to archive"):
+        storage.archive_milestone("v1")
+
+
+def test_unarchive_milestone(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(
+        Task(
+            id=1,
+            title="Task",
+            description="",
+            status=TaskStatus.TODO,
+            milestone="v1",
+            created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+        )
+    )
+    original = (tmp_path / "v1" / "1.md").read_text()
+    storage.archive_milestone("v1")
+
+    assert storage.unarchive_milestone("v1") == 1
+    assert (tmp_path / "v1" / "1.md").read_text() == original
+    assert storage.list_archived_milestones() == []
+
+    with pytest.raises(MilestoneNotFoundError, match="Milestone 'v1' is not archived"):
+        storage.unarchive_milestone("v1")
+
+
+def test_load_task_is_served_from_cache(tmp_path: Path) -> None:
+    cache = TaskCache()
+    storage = TaskStorage(base_path=tmp_path, cache=cache)
+    storage.save_task(
+        Task(1, "Task 1", "", TaskStatus.TODO, None, datetime(2025, 10, 6, tzinfo=UTC))
+    )
+
+    first = storage.load_task(1)
+    second = storage.load_task(1)
+
+    assert first == second
+    assert first is not second
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
+
+
+def test_cached_task_is_reparsed_after_external_edit(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(
+        Task(1, "Task 1", "", TaskStatus.TODO, None, datetime(2025, 10, 6, tzinfo=UTC))
+    )
+    storage.load_task(1)
+
+    file_path = tmp_path / "1.md"
+    file_path.write_text(file_path.read_text().replace("# Task 1", "# Edited elsewhere"))
+
+    loaded = storage.load_task(1)
+
+    assert loaded is not None
+
+    assert loaded.title == "Edited elsewhere"
+    assert storage.load_all_tasks()[0].title == "Edited elsewhere"
+
+
+def test_saved_task_is_not_served_stale_from_cache(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(1, "Task 1", "", TaskStatus.TODO, None, datetime(2025, 10, 6, tzinfo=UTC))
+    storage.save_task(task)
+    storage.load_all_tasks()
+
+    storage.save_task(replace(task, title="Task X"))
+
+    loaded = storage.load_task(1)
+
+    assert loaded is not None
+
+    assert loaded.title == "Task X"
+
+
+HAND_WRITTEN_TASK = """---
+# Owner: ops
+status: todo
+created: 2025-10-03 09:00:00+00:00
+tags: [infra,  urgent]
+---
+
+#   Rotate keys
+
+*  Step one
+*  Step two   
+"""  # noqa: W291
+
+
+def test_save_task_patch_only_rewrites_status_lines(tmp_path: Path) -> None:
+    file_path = tmp_path / "1.md"
+    file_path.write_text(HAND_WRITTEN_TASK)
+    storage = TaskStorage(base_path=tmp_path)
+    task = storage.load_task(1)
+    assert task is not None
+
+    task.status = TaskStatus.PROGRESS
+    storage.save_task(task, patch=True)
+
+    assert file_path.read_text() == HAND_WRITTEN_TASK.replace("status: todo", "status: progress")
+
+    task.status = TaskStatus.DONE
+    task.completed = datetime(2025, 10, 4, 12, 0, 0, tzinfo=UTC)
+    storage.save_task(task, patch=True)
+
+    assert file_path.read_text() == HAND_WRITTEN_TASK.replace(
+        "status: todo\n",
+        "completed: '2025-10-04T12:00:00+00:00'\nstatus: done\n",
+    )
+    assert storage.load_task(1) == task
+
+
+def test_save_task_patch_keeps_canonical_files_sorted(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    task = Task(
+        id=1,
+        title="Task",
+        description="Body",
+        status=TaskStatus.TODO,
+        milestone="mvp",
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+    file_path = storage.save_task(task)
+
+    task.status = TaskStatus.DONE
+    task.completed = datetime(2025, 10, 4, 12, 0, 0, tzinfo=UTC)
+    storage.save_task(task, patch=True)
+
+    assert file_path.read_text() == task.to_markdown()
+
+
+def test_save_task_patch_preserves_crlf_line_endings(tmp_path: Path) -> None:
+    file_path = tmp_path / "1.md"
+    file_path.write_bytes(
+        b"---\r\nstatus: todo\r\ncreated: 2025-10-03T09:00:00+00:00\r\n---\r\n\r\n# Task\r\n"
+    )
+    storage = TaskStorage(base_path=tmp_path)
+    task = storage.load_task(1)
+    assert task is not None
+
+    task.status = TaskStatus.PROGRESS
+    storage.save_task(task, patch=True)
+
+    assert file_path.read_bytes() == (
+        b"---\r\nstatus: progress\r\ncreated: 2025-10-03T09:00:00+00:00\r\n---\r\n\r\n# Task\r\n"
+    )
+
+
+def test_save_task_patch_falls_back_when_other_fields_change(tmp_path: Path) -> None:
+    file_path = tmp_path / "1.md"
+    file_path.write_text(HAND_WRITTEN_TASK)
+    storage = TaskStorage(base_path=tmp_path)
+    task = storage.load_task(1)
+    assert task is not None
+
+    task.title = "Rotate all keys"
+    task.status = TaskStatus.PROGRESS
+    storage.save_task(task, patch=True)
+
+    assert file_path.read_text() == task.to_markdown()
+
+
+def test_save_task_patch_with_write_delay(tmp_path: Path) -> None:
+    file_path = tmp_path / "1.md"
+    file_path.write_text(HAND_WRITTEN_TASK)
+    storage = TaskStorage(base_path=tmp_path, write_delay=60)
+    task = storage.load_task(1)
+    assert task is not None
+
+    task.status = TaskStatus.PROGRESS
+    storage.save_task(task, patch=True)
+
+    assert storage.flush() == [file_path]
+    assert file_path.read_text() == HAND_WRITTEN_TASK.replace("status: todo", "status: progress")
+
+
+def make_task(task_id: int, milestone: str | None = "mvp") -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        milestone=milestone,
+        created=datetime(2025, 10, 3, 9, 0, 0, tzinfo=UTC),
+    )
+
+
+def test_batch_saves_rollups_once_at_the_end(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+    storage.rollups()
+    saved = storage.rollups_path.read_text()
+
+    with storage.batch():
+        storage.save_task(make_task(2))
+        storage.save_task(make_task(3, milestone=None))
+        storage.move_task(1, None)
+
+        assert storage.rollups_path.read_text() == saved
+        assert storage.rollups().statuses == {"mvp": {"todo": 1}, NO_MILESTONE_KEY: {"todo": 2}}
+
+    assert storage.rollups_path.read_text() != saved
+    assert TaskStorage(base_path=tmp_path).rollups().statuses == {
+        "mvp": {"todo": 1},
+        NO_MILESTONE_KEY: {"todo": 2},
+    }
+
+
+def test_batch_counts_next_id_once(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(4))
+
+    with (
+        patch.object(storage, "_iter_task_files", wraps=storage._iter_task_files) as scan,
+        storage.batch(),
+    ):
+        for _ in range(3):
+            storage.save_task(make_task(storage.get_next_id()))
+
+    assert scan.call_count == 1
+    assert sorted(path.name for path in (tmp_path / "mvp").iterdir()) == [
+        "4.md",
+        "5.md",
+        "6.md",
+        "7.md",
+    ]
+
+
+def test_batch_recounts_next_id_after_delete(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+
+    with storage.batch():
+        storage.save_task(make_task(storage.get_next_id()))
+        storage.delete_task(2)
+
+        assert storage.get_next_id() == 2
+
+
+def test_unsynced_batch_does_not_record_changed_files(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+
+    with storage.batch(sync=False):
+        storage.save_tasks([make_task(task_id) for task_id in range(2, 6)])
+        storage.delete_task(1)
+
+        assert storage._batch is not None
+        assert storage._batch.changed == set()
+
+    assert [task.id for task in storage.load_all_tasks()] == [2, 3, 4, 5]
+
+
+def test_batch_flushes_buffered_writes_and_nests(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path, write_delay=60)
+    file_path = storage.save_task(make_task(1))
+
+    with storage.batch():
+        with storage.batch():
+            storage.save_task(replace(make_task(1), title="Renamed"))
+        assert "# Task 1" in file_path.read_text()
+
+    assert "# Renamed" in file_path.read_text()
+
+
+def test_restore_snapshot_brings_back_archive_bundles(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1, milestone="v1"))
+    storage.archive_milestone("v1")
+    storage.save_task(make_task(2, milestone="v2"))
+
+    assert storage.create_snapshot("archived") == ("archived", 2)
+
+    storage.unarchive_milestone("v1")
+    storage.restore_snapshot("archived")
+
+    assert storage.list_archived_milestones() == ["v1"]
+    assert not (tmp_path / "v1").exists()
+    assert [task.id for task in storage.load_all_tasks(milestone="v1")] == [1]
+
+
+def test_restore_snapshot_taken_before_archiving(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1, milestone="v1"))
+    storage.save_task(make_task(2, milestone="v1"))
+    storage.create_snapshot("before")
+    storage.archive_milestone("v1")
+
+    storage.restore_snapshot("before")
+
+    assert storage.list_archived_milestones() == []
+    assert [task.id for task in storage.load_all_tasks(milestone="v1")] == [1, 2]
+    assert storage.rollups().milestones["v1"]["created"] == {"2025-10-03": 2}
+    assert storage.check().ok
+
+
+def test_rollups_count_archived_tasks_shadowed_by_files_once(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1, milestone="v1"))
+    storage.save_task(make_task(2, milestone="v1"))
+    storage.archive_milestone("v1")
+    (tmp_path / "v1").mkdir()
+    (tmp_path / "v1" / "1.md").write_text(make_task(1, milestone="v1").to_markdown())
+
+    assert storage.rollups().milestones["v1"]["created"] == {"2025-10-03": 2}
+
+
+def test_check_detects_tasks_also_archived(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1, milestone="v1"))
+    storage.archive_milestone("v1")
+    storage.save_task(make_task(1, milestone="v1"))
+
+    report = storage.check()
+
+    assert [issue.path for issue in report.issues] == [tmp_path / "v1" / "1.md"]
+    assert report.issues[0].message == (
+        f"Task #1 is also archived in {storage.archive_path / 'v1.zip'}"
+    )
+
+
+def test_check_rebuilds_rollups_and_drops_manifest(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+    storage.rollups()
+    storage.manifest()
+    storage.rollups_path.write_text(
+        storage.rollups_path.read_text().replace('"todo": 1', '"todo": 5')
+    )
+
+    storage.check()
+
+    assert TaskStorage(base_path=tmp_path).rollups().statuses == {"mvp": {"todo": 1}}
+    assert not storage.manifest_path.exists()
+
+
+def test_make_state_dir_ignores_local_state_in_git(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+    storage.rollups()
+
+    gitignore = tmp_path / ".quadro" / ".gitignore"
+    assert gitignore.read_text().splitlines() == ["*", "!.gitignore", "!archive/", "!archive/*.zip"]
+    gitignore.write_text("custom\n")
+    assert storage.make_state_dir() == tmp_path / ".quadro"
+    assert gitignore.read_text() == "custom\n"
+
+
+def test_rollups_are_read_when_they_cannot_be_saved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+
+    def read_only(*_args: object) -> None:
+        raise PermissionError
+
+    monkeypatch.setattr(storage, "make_state_dir", read_only)
+
+    assert storage.rollups().statuses == {"mvp": {"todo": 1}}
+    assert not storage.rollups_path.exists()
+
+
+def test_tree_signature_is_the_rollups_signature(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+    storage.save_task(make_task(2, milestone=None))
+
+    signature = storage.tree_signature()
+
+    assert signature == storage.rollups().signature
+    assert TaskStorage(base_path=tmp_path).tree_signature() == signature
+
+
+def test_task_signature_only_stats_the_task_file(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    storage.save_task(make_task(1))
+    storage.save_task(make_task(2, milestone="v2"))
+    storage.save_task(make_task(3, milestone=None))
+    before = storage.task_signature(2)
+
+    storage.save_task(replace(make_task(1), status=TaskStatus.DONE))
+
+    with patch.object(storage, "_iter_task_files", wraps=storage._iter_task_files) as scan:
+        assert storage.task_signature(2) == before
+        assert storage.task_signature(3) is not None
+        assert storage.task_signature(4) is None
+
+    assert scan.call_count == 0
+
+
+def test_rollups_track_task_files_shadowing_archived_copies(tmp_path: Path) -> None:
+    storage = TaskStorage(base_path=tmp_path)
+    for task_id in (1, 2, 3):
+        storage.save_task(make_task(task_id, milestone="v1"))
+    storage.archive_milestone("v1")
+    storage.rollups()
+
+    def rebuilt() -> tuple[object, object]:
+        fresh = TaskStorage(base_path=tmp_path)
+        fresh._discard_rollups()
+        rollups = fresh.rollups()
+        return rollups.statuses, rollups.milestones
+
+    task = replace(make_task(2, milestone="v1"), status=TaskStatus.PROGRESS)
+    storage.save_task(task)
+    assert (storage.rollups().statuses, storage.rollups().milestones) == rebuilt()
+    assert storage.rollups().milestones["v1"]["created"] == {"2025-10-03": 3}
+
+    storage.save_task(replace(task, status=TaskStatus.DONE, completed=task.created))
+    assert (storage.rollups().statuses, storage.rollups().milestones) == rebuilt()
+    assert storage.rollups().milestones["v1"]["completed"] == {"2025-10-03": 1}
+
+    storage.delete_task(2)
+    assert (storage.rollups().statuses, storage.rollups().milestones) == rebuilt()
+    assert storage.rollups().milestones["v1"]["completed"] == {}
@@ -0,0 +1,204 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import delete_task
+from quadro.command import move_task
+from quadro.command import update_task
+from quadro.storage import TaskStorage
+from quadro.sync import PULL
+from quadro.sync import PUSH
+from quadro.sync import Manifest
+from quadro.sync import SyncChange
+from quadro.sync import plan
+
+
+@pytest.fixture
+def laptop(tmp_path: Path) -> TaskStorage:
+    return TaskStorage(tmp_path / "laptop" / "tasks")
+
+
+@pytest.fixture
+def buildbox(tmp_path: Path) -> TaskStorage:
+    storage = TaskStorage(tmp_path / "buildbox" / "tasks")
+    storage.base_path.mkdir(parents=True)
+    return storage
+
+
+class TestPlan:
+    def test_first_sync_copies_missing_files_both_ways(self) -> None:
+        changes, conflicts, base = plan({"1.md": "a"}, {"2.md": "b"}, {})
+
+        assert changes == [SyncChange("1.md", PUSH), SyncChange("2.md", PULL)]
+        assert conflicts == []
+        assert base == {"1.md": "a", "2.md": "b"}
+
+    def test_unchanged_side_takes_other_sides_edit(self) -> None:
+        changes, _, base = plan({"1.md": "a"}, {"1.md": "b"}, {"1.md": "a"})
+
+        assert changes == [SyncChange("1.md", PULL)]
+        assert base == {"1.md": "b"}
+
+    def test_deletion_is_propagated(self) -> None:
+        changes, _, base = plan({}, {"1.md": "a"}, {"1.md": "a"})
+
+        assert changes == [SyncChange("1.md", PUSH, deleted=True)]
+        assert base == {}
+
+    def test_edits_on_both_sides_conflict(self) -> None:
+        changes, conflicts, base = plan({"1.md": "b"}, {"1.md": "c"}, {"1.md": "a"})
+
+        assert changes == []
+        assert conflicts == ["1.md"]
+        assert base == {"1.md": "a"}
+
+    def test_files_created_on_both_sides_conflict_unless_identical(self) -> None:
+        _, conflicts, base = plan({"1.md": "a", "2.md": "x"}, {"1.md": "b", "2.md": "x"}, {})
+
+        assert conflicts == ["1.md"]
+        assert base == {"2.md": "x"}
+
+
+class TestManifest:
+    def test_build_hashes_files_relative_to_root(self, tmp_path: Path) -> None:
+        (tmp_path / "mvp").mkdir()
+        (tmp_path / "mvp" / "1.md").write_text("content")
+        manifest = Manifest(tmp_path / ".quadro" / "manifest.json")
+
+        hashes = manifest.build(tmp_path, [tmp_path / "mvp" / "1.md"])
+
+        assert list(hashes) == ["mvp/1.md"]
+        assert (tmp_path / ".quadro" / "manifest.json").exists()
+
+    def test_build_only_rehashes_changed_files(self, tmp_path: Path) -> None:
+        files = [tmp_path / "1.md", tmp_path / "2.md"]
+        for file_path in files:
+            file_path.write_text(file_path.name)
+        manifest = Manifest(tmp_path / ".quadro" / "manifest.json")
+        first = manifest.build(tmp_path, files)
+
+        files[1].write_text("changed")
+        with patch("quadro.sync._file_hash", return_value="new") as file_hash:
+            second = manifest.build(tmp_path, files)
+
+        file_hash.assert_called_once_with(files[1])
+        assert second == {"1.md": first["1.md"], "2.md": "new"}
+
+
+class TestStorageSync:
+    def test_sync_copies_new_tasks_both_ways(
+        self, laptop: TaskStorage, buildbox: TaskStorage
+    ) -> None:
+        add_task("Laptop task", milestone="mvp", storage=laptop)
+        (buildbox.base_path / "2.md").write_text(
+            "---\ncreated: '2025-10-06T12:00:00+00:00'\nstatus: todo\n---\n\n# Buildbox task\n"
+        )
+
+        report = laptop.sync(buildbox)
+
+        assert report.ok
+        assert [change.path for change in report.changes] == ["2.md", "mvp/1.md"]
+        pushed = buildbox.load_task(1)
+        assert pushed is not None
+        assert pushed.title == "Laptop task"
+        pulled = laptop.load_task(2)
+        assert pulled is not None
+        assert pulled.title == "Buildbox task"
+
+    def test_sync_transfers_only_changes(self, laptop: TaskStorage, buildbox: TaskStorage) -> None:
+        for number in range(5):
+            add_task(f"Task {number}", storage=laptop)
+        laptop.sync(buildbox)
+
+        update_task(3, title="Edited", storage=buildbox)
+        report = laptop.sync(buildbox)
+
+        assert report.changes == [SyncChange("3.md", PULL)]
+        pulled = laptop.load_task(3)
+        assert pulled is not None
+        assert pulled.title == "Edited"
+        assert laptop.sync(buildbox).changes == []
+
+    def test_sync_propagates_moves_and_deletions(
+        self, laptop: TaskStorage, buildbox: TaskStorage
+    ) -> None:
+        add_task("Task 1", storage=laptop)
+        add_task("Task 2", storage=laptop)
+        laptop.sync(buildbox)
+
+        move_task(1, "mvp", storage=laptop)
+        delete_task(2, storage=laptop)
+        report = laptop.sync(buildbox)
+
+        assert report.changes == [
+            SyncChange("1.md", PUSH, deleted=True),
+            SyncChange("2.md", PUSH, deleted=True),
+            SyncChange("mvp/1.md", PUSH),
+        ]
+        assert [task.id for task in buildbox.load_all_tasks(milestone="mvp")] == [1]
+        assert buildbox.load_task(2) is None
+
+    def test_sync_moves_archived_tasks_into_the_bundle(
+        self, laptop: TaskStorage, buildbox: TaskStorage
+    ) -> None:
+        add_task("Task 1", milestone="v1", storage=laptop)
+        add_task("Task 2", milestone="v1", storage=laptop)
+        add_task("Task 3", storage=laptop)
+        laptop.sync(buildbox)
+
+        archive_milestone("v1", storage=laptop)
+        report = laptop.sync(buildbox)
+
+        assert report.changes == [
+            SyncChange(".quadro/archive/v1.zip", PUSH),
+            SyncChange("v1/1.md", PUSH, deleted=True),
+            SyncChange("v1/2.md", PUSH, deleted=True),
+        ]
+        assert buildbox.list_archived_milestones() == ["v1"]
+        task = buildbox.load_task(1)
+        assert task is not None
+        assert task.title == "Task 1"
+        assert buildbox.get_next_id() == 4
+        assert laptop.sync(buildbox).changes == []
+
+    def test_sync_reports_conflicting_edits(
+        self, laptop: TaskStorage, buildbox: TaskStorage
+    ) -> None:
+        add_task("Task 1", storage=laptop)
+        laptop.sync(buildbox)
+
+        update_task(1, title="Laptop edit", storage=laptop)
+        update_task(1, title="Buildbox edit", storage=buildbox)
+        report = laptop.sync(buildbox)
+
+        assert not report.ok
+        assert report.conflicts == ["1.md"]
+        laptop_task = laptop.load_task(1)
+        assert laptop_task is not None
+        assert laptop_task.title == "Laptop edit"
+        buildbox_task = buildbox.load_task(1)
+        assert buildbox_task is not None
+        assert buildbox_task.title == "Buildbox edit"
+
+    def test_sync_base_is_shared_by_both_directions(
+        self, laptop: TaskStorage, buildbox: TaskStorage
+    ) -> None:
+        add_task("Task 1", storage=laptop)
+        laptop.sync(buildbox)
+
+        update_task(1, title="Edited", storage=laptop)
+        report = buildbox.sync(laptop)
+
+        assert report.changes == [SyncChange("1.md", PULL)]
+
+    def test_dry_run_changes_nothing(self, laptop: TaskStorage, buildbox: TaskStorage) -> None:
+        add_task("Task 1", storage=laptop)
+
+        report = laptop.sync(buildbox, dry_run=True)
+
+        assert report.changes == [SyncChange("1.md", PUSH)]
+        assert buildbox.load_task(1) is None
+        assert laptop.sync(buildbox).changes == [SyncChange("1.md", PUSH)]
@@ -0,0 +1,93 @@
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+from quadro.command import add_task
+from quadro.command import complete_task
+from quadro.command import start_task
+from quadro.models import Task
+from quadro.models import TaskStatus
+from quadro.storage import TaskStorage
+from quadro.table import NO_MILESTONE
+from quadro.table import NO_TIMESTAMP
+from quadro.table import STATUSES
+from quadro.table import TaskRow
+from quadro.table import TaskTable
+from quadro.table import from_micros
+
+
+def make_task(task_id: int, milestone: str | None = None, title: str = "Task") -> Task:
+    return Task(
+        id=task_id,
+        title=title,
+        description="A long description that the table does not keep",
+        status=TaskStatus.TODO,
+        milestone=milestone,
+        created=datetime(2025, 10, 6, 12, 0, 0, 123456, tzinfo=UTC),
+    )
+
+
+def test_columns_round_trip_metadata() -> None:
+    task = make_task(7, milestone="mvp")
+    task.status = TaskStatus.DONE
+    task.completed = datetime(2025, 10, 7, 8, 30, 0, 1, tzinfo=UTC)
+
+    table = TaskTable.from_tasks([task, make_task(8)])
+
+    assert len(table) == 2
+    assert list(table.ids) == [7, 8]
+    assert [STATUSES[code] for code in table.statuses] == [TaskStatus.DONE, TaskStatus.TODO]
+    assert list(table.milestone_codes) == [0, NO_MILESTONE]
+    assert from_micros(table.created[0]) == datetime(2025, 10, 6, 12, 0, 0, 123456, tzinfo=UTC)
+    assert from_micros(table.completed[0]) == datetime(2025, 10, 7, 8, 30, 0, 1, tzinfo=UTC)
+    assert table.completed[1] == NO_TIMESTAMP
+
+
+def test_milestones_are_interned() -> None:
+    table = TaskTable.from_tasks(
+        make_task(i, milestone="mvp" if i % 2 else "v2") for i in range(10)
+    )
+
+    assert table.milestones == ["v2", "mvp"]
+    assert list(table.milestone_codes) == [0, 1] * 5
+
+
+def test_nbytes_is_compact() -> None:
+    table = TaskTable.from_tasks(make_task(i, "mvp", title="x" * 40) for i in range(1000))
+
+    # 29 bytes of numeric columns, an 8-byte title offset and the title itself.
+    assert table.nbytes == 8 + 1000 * (29 + 8 + 40)
+
+
+def test_rows_decode_titles_and_milestones() -> None:
+    task = make_task(7, milestone="mvp", title="Café login")
+    task.status = TaskStatus.DONE
+    task.completed = datetime(2025, 10, 7, 8, 30, 0, tzinfo=UTC)
+
+    table = TaskTable.from_tasks([task, make_task(8, title="")])
+
+    assert list(table.rows()) == [
+        TaskRow(7, "Café login", TaskStatus.DONE, "mvp", task.created, task.completed),
+        TaskRow(8, "", TaskStatus.TODO, None, task.created, None),
+    ]
+
+
+def test_storage_load_table(tmp_path: Path) -> None:
+    storage = TaskStorage(tmp_path)
+    add_task("Task 1", milestone="mvp", storage=storage)
+    add_task("Task 2", milestone="mvp", storage=storage)
+    add_task("Task 3", storage=storage)
+    start_task(1, storage=storage)
+    complete_task(2, storage=storage)
+
+    table = storage.load_table()
+
+    assert list(table.ids) == [1, 2, 3]
+    assert [STATUSES[code] for code in table.statuses] == [
+        TaskStatus.PROGRESS,
+        TaskStatus.DONE,
+        TaskStatus.TODO,
+    ]
+    assert table.completed[1] != NO_TIMESTAMP
+    assert list(storage.load_table(milestone="mvp").ids) == [1, 2]
+    assert list(storage.load_table(statuses=[TaskStatus.TODO, TaskStatus.DONE]).ids) == [2, 3]
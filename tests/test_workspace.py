@@ -0,0 +1,127 @@
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import patch
+
+import pytest
+
+from quadro.command import add_task
+from quadro.command import archive_milestone
+from quadro.command import complete_task
+from quadro.models import TaskStatus
+from quadro.storage import TaskStorage
+from quadro.workspace import Workspace
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Workspace:
+    api = TaskStorage(tmp_path / "api" / "tasks")
+    web = TaskStorage(tmp_path / "web" / "tasks")
+
+    add_task("Login endpoint", milestone="mvp", storage=api)
+    add_task("Rate limiting", storage=api)
+    add_task("Login page", "Form with validation", milestone="mvp", storage=web)
+    complete_task(1, storage=web)
+
+    return Workspace({"web": web.base_path, "api": api.base_path})
+
+
+class TestWorkspaceFromFile:
+    def test_resolves_roots_relative_to_file(self, tmp_path: Path) -> None:
+        config = tmp_path / "quadro-workspace.toml"
+        config.write_text(
+            dedent("""
+                [roots]
+                api = "api/tasks"
+                web = "/srv/web/tasks"
+            """)
+        )
+
+        workspace = Workspace.from_file(config)
+
+        assert workspace.storages["api"].base_path == tmp_path / "api" / "tasks"
+        assert workspace.storages["web"].base_path == Path("/srv/web/tasks")
+
+    def test_raises_without_roots(self, tmp_path: Path) -> None:
+        config = tmp_path / "quadro-workspace.toml"
+        config.write_text("[roots]\n")
+
+        with pytest.raises(ValueError, match="No roots defined"):
+            Workspace.from_file(config)
+
+    def test_raises_for_non_string_root(self, tmp_path: Path) -> None:
+        config = tmp_path / "quadro-workspace.toml"
+        config.write_text("[roots]\napi = 1\n")
+
+        with pytest.raises(ValueError, match="Root 'api' must be a path string"):
+            Workspace.from_file(config)
+
+
+class TestWorkspaceQueries:
+    def test_list_tasks_merges_roots_in_name_order(self, workspace: Workspace) -> None:
+        entries = workspace.list_tasks()
+
+        assert [entry.qualified_id for entry in entries] == ["api:1", "api:2", "web:1"]
+        assert entries[2].task.title == "Login page"
+
+    def test_list_tasks_filters_by_milestone_and_status(self, workspace: Workspace) -> None:
+        entries = workspace.list_tasks(milestone="mvp", statuses=[TaskStatus.TODO])
+
+        assert [entry.qualified_id for entry in entries] == ["api:1"]
+
+    def test_list_tasks_with_milestone_includes_archived_tasks(self, workspace: Workspace) -> None:
+        archive_milestone("mvp", storage=workspace.storages["web"])
+
+        entries = workspace.list_tasks(milestone="mvp")
+
+        assert [entry.qualified_id for entry in entries] == ["api:1", "web:1"]
+        assert [entry.qualified_id for entry in workspace.list_tasks()] == ["api:1", "api:2"]
+
+    def test_list_milestones_skips_tasks_without_milestone(self, workspace: Workspace) -> None:
+        entries = workspace.list_milestones()
+
+        assert [entry.qualified_id for entry in entries] == ["api:1", "web:1"]
+
+    def test_search_matches_title_and_description(self, workspace: Workspace) -> None:
+        assert [entry.qualified_id for entry in workspace.search("login")] == ["api:1", "web:1"]
+        assert [entry.qualified_id for entry in workspace.search("VALIDATION")] == ["web:1"]
+
+    def test_search_applies_filters(self, workspace: Workspace) -> None:
+        entries = workspace.search("login", statuses=[TaskStatus.DONE])
+
+        assert [entry.qualified_id for entry in entries] == ["web:1"]
+
+    def test_missing_root_has_no_tasks(self, tmp_path: Path) -> None:
+        workspace = Workspace({"gone": tmp_path / "missing"})
+
+        assert workspace.list_tasks() == []
+
+    def test_unchanged_root_is_not_reloaded(self, workspace: Workspace) -> None:
+        workspace.list_tasks()
+
+        with patch.object(TaskStorage, "load_all_tasks") as load_all_tasks:
+            workspace.list_tasks()
+            workspace.search("login")
+
+        load_all_tasks.assert_not_called()
+
+    def test_milestone_query_is_cached_and_loads_only_the_milestone(
+        self, workspace: Workspace
+    ) -> None:
+        with patch.object(
+            TaskStorage, "load_all_tasks", autospec=True, side_effect=TaskStorage.load_all_tasks
+        ) as load_all_tasks:
+            workspace.list_tasks(milestone="mvp")
+            workspace.search("login", milestone="mvp")
+
+        assert [call.kwargs for call in load_all_tasks.call_args_list] == [
+            {"milestone": "mvp"},
+            {"milestone": "mvp"},
+        ]
+
+    def test_changed_root_is_reloaded(self, workspace: Workspace) -> None:
+        workspace.list_tasks()
+
+        add_task("Logout endpoint", storage=workspace.storages["api"])
+
+        entries = workspace.search("logout")
+        assert [entry.qualified_id for entry in entries] == ["api:3"]